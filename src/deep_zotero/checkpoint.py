@@ -0,0 +1,185 @@
+"""Checkpoint journal for resumable indexing.
+
+Records how far each document has progressed through the indexing
+pipeline and which Anthropic batches are in flight, so an interrupted
+``deep-zotero-index`` run can pick up where it stopped instead of
+re-extracting every PDF and re-submitting paid vision batches.
+
+Stages, in order:
+
+- ``extracted``: extraction finished; the DocumentExtraction (possibly
+  with pending vision work) is spooled to disk.
+- ``vision_resolved``: vision tables resolved; the spooled extraction
+  has been replaced by the resolved one.
+- ``storing``: chunks are being written to the vector store.  A document
+  left in this stage was interrupted mid-write and must be deleted and
+  stored again.
+- ``indexed``: stored completely.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+STAGES = ("extracted", "vision_resolved", "storing", "indexed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    item_key    TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    stage       TEXT NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id    TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    n_requests  INTEGER NOT NULL,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS batches_fingerprint ON batches(fingerprint);
+CREATE TABLE IF NOT EXISTS batch_requests (
+    batch_id    TEXT NOT NULL,
+    custom_id   TEXT NOT NULL,
+    meta        TEXT NOT NULL,
+    PRIMARY KEY (batch_id, custom_id)
+);
+"""
+
+
+class IndexCheckpoint:
+    """SQLite-backed journal of per-item stages and in-flight vision batches.
+
+    Item entries carry a fingerprint (PDF hash plus the settings that
+    shape extraction); an entry whose fingerprint no longer matches is
+    treated as absent.  Safe to use from the indexer's writer thread.
+
+    Also implements the batch journal interface consumed by
+    ``VisionAPI(batch_journal=...)``.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Item stages
+    # ------------------------------------------------------------------
+
+    def get_stage(self, item_key: str, fingerprint: str) -> str | None:
+        """Last recorded stage for ``item_key``, or None if unknown or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, stage FROM items WHERE item_key = ?", (item_key,)
+            ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        return row[1]
+
+    def mark(self, item_key: str, fingerprint: str, stage: str) -> None:
+        """Record that ``item_key`` has completed ``stage``."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown checkpoint stage: {stage!r}")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items (item_key, fingerprint, stage, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (item_key, fingerprint, stage, time.time()),
+            )
+
+    def items_in_stage(self, stage: str) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item_key FROM items WHERE stage = ? ORDER BY item_key", (stage,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def forget(self, item_keys: list[str]) -> None:
+        """Drop the entries for ``item_keys``."""
+        with self._lock:
+            self._conn.executemany("DELETE FROM items WHERE item_key = ?", [(k,) for k in item_keys])
+
+    # ------------------------------------------------------------------
+    # Batch journal
+    # ------------------------------------------------------------------
+
+    def find_batches(self, fingerprint: str) -> list[tuple[str, int]]:
+        """(batch_id, n_requests) pairs already submitted for ``fingerprint``."""
+        with self._lock:
+            return [
+                (r[0], r[1]) for r in self._conn.execute(
+                    "SELECT batch_id, n_requests FROM batches WHERE fingerprint = ? ORDER BY created_at",
+                    (fingerprint,),
+                )
+            ]
+
+    def record_batch(
+        self,
+        fingerprint: str,
+        batch_id: str,
+        n_requests: int,
+        requests: dict[str, dict] | None = None,
+    ) -> None:
+        """Journal a submitted batch before it is polled.
+
+        ``requests`` maps each custom_id in the batch to JSON-serializable
+        metadata (the table spec and result cache key), so the batch can
+        be collected by ``VisionAPI.resume_pending_batches`` without the
+        call that submitted it.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batches (batch_id, fingerprint, n_requests, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (batch_id, fingerprint, n_requests, time.time()),
+            )
+            if requests:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO batch_requests (batch_id, custom_id, meta) VALUES (?, ?, ?)",
+                    [(batch_id, cid, json.dumps(meta)) for cid, meta in requests.items()],
+                )
+            self._conn.execute("COMMIT")
+
+    def pending_batches(self) -> list[tuple[str, int]]:
+        """(batch_id, n_requests) for every journaled batch, oldest first."""
+        with self._lock:
+            return [
+                (r[0], r[1]) for r in self._conn.execute(
+                    "SELECT batch_id, n_requests FROM batches ORDER BY created_at"
+                )
+            ]
+
+    def batch_requests(self, batch_id: str) -> dict[str, dict]:
+        """custom_id -> metadata journaled with ``batch_id`` (empty if none)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT custom_id, meta FROM batch_requests WHERE batch_id = ?", (batch_id,)
+            ).fetchall()
+        return {cid: json.loads(meta) for cid, meta in rows}
+
+    def finish_batch(self, batch_id: str) -> None:
+        """Drop one journaled batch whose results have been collected."""
+        with self._lock:
+            self._conn.execute("DELETE FROM batch_requests WHERE batch_id = ?", (batch_id,))
+            self._conn.execute("DELETE FROM batches WHERE batch_id = ?", (batch_id,))
+
+    def finish_batches(self, fingerprint: str) -> None:
+        """Drop journaled batches whose results have been collected."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM batch_requests WHERE batch_id IN "
+                "(SELECT batch_id FROM batches WHERE fingerprint = ?)",
+                (fingerprint,),
+            )
+            self._conn.execute("DELETE FROM batches WHERE fingerprint = ?", (fingerprint,))
@@ -32,6 +32,38 @@ def main(argv: list[str] | None = None) -> int:
         "--no-vision", action="store_true",
         help="Disable vision-based table extraction even if configured",
     )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes for PDF extraction (default: extraction_workers from config)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Store each paper as soon as it is extracted (bounded memory, crash-safe progress)",
+    )
+    parser.add_argument(
+        "--changed", action="store_true",
+        help="Only check items changed in Zotero since the last --changed run (fast incremental update)",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and index papers as they are added or changed in Zotero (implies --changed)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore the extraction cache for this run (re-extract every PDF)",
+    )
+    parser.add_argument(
+        "--prune-cache", type=int, default=None, metavar="MB",
+        help="Evict least recently used extraction cache entries down to MB megabytes, then exit (0 clears it)",
+    )
+    parser.add_argument(
+        "--rebuild-lexical-index", action="store_true",
+        help="Rebuild the keyword (FTS5) index from the vector store, then exit",
+    )
+    parser.add_argument(
+        "--sync-metadata", action="store_true",
+        help="Only push Zotero metadata edits (tags, collections, titles, DOIs) into the index, then exit",
+    )
     parser.add_argument(
         "--config", type=str, default=None,
         help="Path to config JSON file (default: ~/.config/deep-zotero/config.json)",
@@ -42,6 +74,15 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    if args.watch:
+        conflicting = [
+            flag for flag, value in (
+                ("--force", args.force), ("--limit", args.limit),
+                ("--item-key", args.item_key), ("--title", args.title),
+            ) if value
+        ]
+        if conflicting:
+            parser.error(f"--watch cannot be combined with {', '.join(conflicting)}")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
@@ -49,6 +90,21 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     config = Config.load(args.config)
+
+    if args.prune_cache is not None:
+        from .extraction_cache import ExtractionCache
+        cache = ExtractionCache(
+            config.chroma_db_path.parent / "extraction_cache",
+            max_bytes=config.extraction_cache_max_mb * 1024 * 1024,
+        )
+        removed, freed = cache.prune(args.prune_cache * 1024 * 1024)
+        stats = cache.stats()
+        print(f"Extraction cache: removed {removed} entries ({freed / 1e6:.1f} MB); "
+              f"{stats['entries']} entries ({stats['bytes'] / 1e6:.1f} MB) remain")
+        return 0
+
+    if args.workers is not None:
+        config.extraction_workers = args.workers
     errors = config.validate()
     if errors:
         for e in errors:
@@ -57,13 +113,49 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.no_vision:
         config.vision_enabled = False
+    if args.no_cache:
+        config.extraction_cache_enabled = False
 
     indexer = Indexer(config)
+
+    if args.rebuild_lexical_index:
+        n = indexer.store.rebuild_lexical_index()
+        print(f"Lexical index rebuilt: {n} chunks")
+        return 0
+
+    if args.sync_metadata:
+        sync = indexer.sync_metadata(item_key=args.item_key)
+        print(f"\nMetadata sync complete in {sync['seconds']}s:")
+        print(f"  Updated:     {sync['updated']}")
+        print(f"  Unchanged:   {sync['unchanged']}")
+        print(f"  Not indexed: {sync['not_indexed']}")
+        for key, fields in sync["changes"].items():
+            print(f"  {key}: {', '.join(fields)}")
+        return 0
+
+    if args.watch:
+        from .watcher import LibraryWatcher
+        watcher = LibraryWatcher(
+            indexer,
+            config.zotero_data_dir,
+            poll_interval=config.watch_poll_interval,
+            debounce=config.watch_debounce,
+            streaming=args.stream,
+        )
+        print("Watching Zotero library for changes (Ctrl+C to stop)...")
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            print(f"\nStopped after {watcher.runs} indexing runs")
+        return 0
+
     result = indexer.index_all(
         force_reindex=args.force,
         limit=args.limit,
         item_key=args.item_key,
         title_pattern=args.title,
+        streaming=args.stream,
+        changed_only=args.changed,
     )
 
     # Print summary
@@ -73,6 +165,9 @@ def main(argv: list[str] | None = None) -> int:
     print(f"  Skipped (empty): {result['skipped']}")
     print(f"  Failed:          {result['failed']}")
     print(f"  Empty:           {result['empty']}")
+    if "removed" in result:
+        print(f"  Removed:         {result['removed']}")
+        print(f"  Metadata synced: {result['metadata_updated']}")
 
     if result.get("quality_distribution"):
         dist = result["quality_distribution"]
@@ -86,6 +181,24 @@ def main(argv: list[str] | None = None) -> int:
               f"{stats.get('ocr_pages',0)} OCR, "
               f"{stats.get('empty_pages',0)} empty")
 
+    if result.get("embedding_stats", {}).get("texts"):
+        emb = result["embedding_stats"]
+        print(f"  Embedding: {emb['texts']} texts in {emb['seconds']:.1f}s "
+              f"({emb['texts_per_sec']} texts/s, {emb['throttled']} rate-limited)")
+
+    if result.get("embedding_cache"):
+        cache = result["embedding_cache"]
+        print(f"  Embedding cache: {cache['hits']} hits, {cache['misses']} misses "
+              f"({cache['hit_rate']:.0%} hit rate, {cache['entries']} entries)")
+
+    if result.get("vision_cost"):
+        vision = result["vision_cost"]
+        line = f"  Vision: ${vision['session_cost_usd']:.4f} this run"
+        if vision.get("cache"):
+            cache = vision["cache"]
+            line += f", cache {cache['hits']} hits, {cache['misses']} misses ({cache['entries']} entries)"
+        print(line)
+
     # Print failures
     failures = [r for r in result["results"] if r.status == "failed"]
     if failures:
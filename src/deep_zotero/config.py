@@ -36,6 +36,35 @@ class Config:
     vision_enabled: bool
     vision_model: str
     anthropic_api_key: str | None
+    # Indexing settings
+    extraction_workers: int = 1  # Processes for PDF extraction (1 = in-process)
+    extraction_page_workers: int = 1  # Processes per long PDF for layout analysis (1 = off)
+    extraction_page_parallel_min_pages: int = 100  # Page count at which a PDF is split
+    stream_queue_depth: int = 4  # Extracted docs buffered ahead of the writer (streaming mode)
+    stream_vision_batch_docs: int = 200  # Spooled docs resolved per vision batch (streaming mode)
+    extraction_cache_enabled: bool = True  # Reuse extractions of unchanged PDFs across runs
+    extraction_cache_max_mb: int = 2048  # LRU size limit for the extraction cache
+    # Embedding throughput settings
+    embedding_concurrency: int = 4  # Gemini batches in flight at once
+    embedding_requests_per_minute: int = 0  # Gemini request rate cap (0 = unlimited)
+    embedding_cache_enabled: bool = True  # Reuse vectors for byte-identical texts across runs
+    embedding_cache_max_entries: int = 200_000  # LRU entry limit for the embedding cache
+    # Vision result cache settings
+    vision_cache_enabled: bool = True  # Reuse transcriptions of identical table crops across runs
+    vision_cache_max_entries: int = 100_000  # LRU entry limit for the vision result cache
+    vision_render_workers: int = 1  # Processes rendering table crops before submission (1 = in-process)
+    # Vision image payload settings (defaults send pymupdf's PNGs unchanged)
+    vision_image_grayscale: bool = False  # Send 8-bit grayscale instead of RGB
+    vision_image_colors: int = 0  # PNG palette size (0 = no quantization)
+    vision_image_trim: bool = False  # Trim blank margins from full-page fallbacks
+    vision_image_format: str = "png"  # "png", "jpeg" or "webp"
+    vision_image_quality: int = 85  # JPEG/WebP quality
+    # Retrieval settings
+    hybrid_search: bool = False  # Fuse BM25 (lexical index) with vector rankings
+    query_cache_size: int = 256  # Query vectors kept in memory by the MCP server
+    # Watch mode settings
+    watch_poll_interval: float = 5.0  # Seconds between library change checks
+    watch_debounce: float = 10.0  # Quiet seconds required before indexing a change
 
     @classmethod
     def load(cls, path: Path | str | None = None) -> "Config":
@@ -79,6 +108,34 @@ class Config:
             vision_enabled=data.get("vision_enabled", True),
             vision_model=data.get("vision_model", "claude-haiku-4-5-20251001"),
             anthropic_api_key=data.get("anthropic_api_key") or os.environ.get("ANTHROPIC_API_KEY"),
+            # Indexing settings
+            extraction_workers=data.get("extraction_workers", 1),
+            extraction_page_workers=data.get("extraction_page_workers", 1),
+            extraction_page_parallel_min_pages=data.get("extraction_page_parallel_min_pages", 100),
+            stream_queue_depth=data.get("stream_queue_depth", 4),
+            stream_vision_batch_docs=data.get("stream_vision_batch_docs", 200),
+            extraction_cache_enabled=data.get("extraction_cache_enabled", True),
+            extraction_cache_max_mb=data.get("extraction_cache_max_mb", 2048),
+            # Embedding throughput settings
+            embedding_concurrency=data.get("embedding_concurrency", 4),
+            embedding_requests_per_minute=data.get("embedding_requests_per_minute", 0),
+            embedding_cache_enabled=data.get("embedding_cache_enabled", True),
+            embedding_cache_max_entries=data.get("embedding_cache_max_entries", 200_000),
+            # Vision result cache settings
+            vision_cache_enabled=data.get("vision_cache_enabled", True),
+            vision_cache_max_entries=data.get("vision_cache_max_entries", 100_000),
+            vision_render_workers=data.get("vision_render_workers", 1),
+            vision_image_grayscale=data.get("vision_image_grayscale", False),
+            vision_image_colors=data.get("vision_image_colors", 0),
+            vision_image_trim=data.get("vision_image_trim", False),
+            vision_image_format=data.get("vision_image_format", "png"),
+            vision_image_quality=data.get("vision_image_quality", 85),
+            # Retrieval settings
+            hybrid_search=data.get("hybrid_search", False),
+            query_cache_size=data.get("query_cache_size", 256),
+            # Watch mode settings
+            watch_poll_interval=data.get("watch_poll_interval", 5.0),
+            watch_debounce=data.get("watch_debounce", 10.0),
         )
 
     def validate(self) -> list[str]:
@@ -95,4 +152,24 @@ class Config:
         elif self.embedding_provider not in ("gemini", "local"):
             errors.append(f"Invalid embedding_provider: {self.embedding_provider}. Must be 'gemini' or 'local'")
 
+        if self.extraction_workers < 1:
+            errors.append(f"extraction_workers must be >= 1, got {self.extraction_workers}")
+        if self.extraction_page_workers < 1:
+            errors.append(f"extraction_page_workers must be >= 1, got {self.extraction_page_workers}")
+        if self.vision_render_workers < 1:
+            errors.append(f"vision_render_workers must be >= 1, got {self.vision_render_workers}")
+        if self.vision_image_format not in ("png", "jpeg", "webp"):
+            errors.append(
+                f"Invalid vision_image_format: {self.vision_image_format}. Must be 'png', 'jpeg' or 'webp'"
+            )
+        if self.vision_image_colors and not 2 <= self.vision_image_colors <= 256:
+            errors.append(f"vision_image_colors must be 0 or 2-256, got {self.vision_image_colors}")
+        if not 1 <= self.vision_image_quality <= 100:
+            errors.append(f"vision_image_quality must be 1-100, got {self.vision_image_quality}")
+
+        if self.watch_poll_interval <= 0:
+            errors.append(f"watch_poll_interval must be > 0, got {self.watch_poll_interval}")
+        if self.watch_debounce < 0:
+            errors.append(f"watch_debounce must be >= 0, got {self.watch_debounce}")
+
         return errors
@@ -0,0 +1,142 @@
+"""Document-level metadata sidecar for the vector store.
+
+Bibliographic fields (title, authors, tags, collections, DOI, PDF hash,
+...) are the same for every chunk of a document.  Rather than copying
+them into each chunk's Chroma metadata, they live once per document in
+this SQLite table and are joined onto chunks when results are built.
+Chunk metadata keeps only chunk-local fields plus ``doc_id`` and the
+fields Chroma must filter on (``year``, ``chunk_type``).
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Sidecar column -> key used in chunk-shaped metadata dicts
+DOC_FIELDS: dict[str, str] = {
+    "title": "doc_title",
+    "authors": "authors",
+    "year": "year",
+    "citation_key": "citation_key",
+    "publication": "publication",
+    "doi": "doi",
+    "tags": "tags",
+    "collections": "collections",
+    "journal_quartile": "journal_quartile",
+    "pdf_hash": "pdf_hash",
+    "quality_grade": "quality_grade",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id           TEXT PRIMARY KEY,
+    title            TEXT NOT NULL DEFAULT '',
+    authors          TEXT NOT NULL DEFAULT '',
+    year             INTEGER NOT NULL DEFAULT 0,
+    citation_key     TEXT NOT NULL DEFAULT '',
+    publication      TEXT NOT NULL DEFAULT '',
+    doi              TEXT NOT NULL DEFAULT '',
+    tags             TEXT NOT NULL DEFAULT '',
+    collections      TEXT NOT NULL DEFAULT '',
+    journal_quartile TEXT NOT NULL DEFAULT '',
+    pdf_hash         TEXT NOT NULL DEFAULT '',
+    quality_grade    TEXT NOT NULL DEFAULT '',
+    updated_at       REAL NOT NULL
+);
+"""
+
+_COLUMNS = list(DOC_FIELDS)
+_SQL_CHUNK = 500  # doc_ids per IN (...) query
+
+
+def _to_chunk_keys(row: dict) -> dict:
+    """Sidecar row -> chunk-shaped metadata (doc_title, authors_lower, ...)."""
+    meta = {DOC_FIELDS[col]: row[col] for col in _COLUMNS}
+    meta["authors_lower"] = meta["authors"].lower()
+    meta["tags_lower"] = meta["tags"].lower()
+    return meta
+
+
+class DocumentStore:
+    """SQLite table of per-document metadata keyed by doc_id.
+
+    Args:
+        path: SQLite file (created if missing).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def upsert(self, doc_id: str, doc_meta: dict) -> None:
+        """Insert or replace a document's metadata.
+
+        ``doc_meta`` uses indexer keys (``title``, ``authors``, ...);
+        missing or None values are stored as empty/zero.
+        """
+        values = [(doc_meta.get(col) or (0 if col == "year" else "")) for col in _COLUMNS]
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO documents (doc_id, {', '.join(_COLUMNS)}, updated_at) "
+                f"VALUES (?, {', '.join('?' * len(_COLUMNS))}, ?)",
+                (doc_id, *values, time.time()),
+            )
+
+    def update(self, doc_id: str, fields: dict) -> bool:
+        """Overwrite some columns of an existing row. Returns False if absent."""
+        fields = {k: v for k, v in fields.items() if k in DOC_FIELDS}
+        if not fields:
+            return self.get(doc_id) is not None
+        assignments = ", ".join(f"{col} = ?" for col in fields)
+        values = [(v or (0 if col == "year" else "")) for col, v in fields.items()]
+        with self._lock:
+            cur = self._conn.execute(
+                f"UPDATE documents SET {assignments}, updated_at = ? WHERE doc_id = ?",
+                (*values, time.time(), doc_id),
+            )
+        return cur.rowcount > 0
+
+    def get(self, doc_id: str) -> dict | None:
+        """Chunk-shaped metadata for one document, or None if unknown."""
+        return self.get_many([doc_id]).get(doc_id)
+
+    def get_many(self, doc_ids) -> dict[str, dict]:
+        """Chunk-shaped metadata for each known doc_id."""
+        ids = list(dict.fromkeys(doc_ids))
+        out: dict[str, dict] = {}
+        with self._lock:
+            for i in range(0, len(ids), _SQL_CHUNK):
+                chunk = ids[i:i + _SQL_CHUNK]
+                cur = self._conn.execute(
+                    f"SELECT doc_id, {', '.join(_COLUMNS)} FROM documents "
+                    f"WHERE doc_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row in cur:
+                    out[row[0]] = _to_chunk_keys(dict(zip(_COLUMNS, row[1:])))
+        return out
+
+    def delete(self, doc_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def count_by(self, column: str) -> dict[str, int]:
+        """Number of documents per value of ``column``."""
+        if column not in DOC_FIELDS:
+            raise ValueError(f"Unknown document field: {column!r}")
+        with self._lock:
+            return {
+                value: n for value, n in self._conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM documents GROUP BY {column}"
+                )
+            }
@@ -1,7 +1,12 @@
 """Embedding services: Gemini API and local (ChromaDB default)."""
+import concurrent.futures
+import heapq
 import logging
+import random
+import re
+import threading
 import time
-import concurrent.futures
+from collections import OrderedDict, deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,6 +19,84 @@ class EmbeddingError(Exception):
     """Raised when embedding fails after retries."""
 
 
+class _TokenBucket:
+    """Thread-safe token bucket limiting request starts per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+
+class _QueryLRU:
+    """Thread-safe in-process LRU of query vectors.
+
+    Agents often repeat a query with different filters; this skips the
+    embedding round trip for those repeats.  Persistence across server
+    restarts comes from the EmbeddingCache behind ``embed()``.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> list[float] | None:
+        with self._lock:
+            vector = self._data.get(query)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(query)
+            self.hits += 1
+            return list(vector)
+
+    def put(self, query: str, vector: list[float]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[query] = list(vector)
+            self._data.move_to_end(query)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Fallback for wrapped errors that only carry the status in their message:
+# "429" alone also turns up in counts and ids, so it needs its reason phrase.
+_RATE_LIMIT_TEXT = re.compile(r"\bRESOURCE_EXHAUSTED\b|\b429\W+Too Many Requests\b", re.IGNORECASE)
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    """True for HTTP 429 / RESOURCE_EXHAUSTED errors from the Gemini client."""
+    response = getattr(exc, "response", None)
+    if 429 in (
+        getattr(exc, "code", None),
+        getattr(exc, "status_code", None),
+        getattr(response, "status_code", None),
+    ):
+        return True
+    if getattr(exc, "status", None) == "RESOURCE_EXHAUSTED":
+        return True
+    return _RATE_LIMIT_TEXT.search(str(exc)) is not None
+
+
 class Embedder:
     """
     Gemini embedding wrapper using gemini-embedding-001.
@@ -24,8 +107,17 @@ class Embedder:
     Output dimensions: configurable (768 default, up to 3072)
     Max input: 2048 tokens per text
     Batch size: up to 100 texts
+
+    Batches are sent concurrently, at most ``max_concurrent_batches`` at a
+    time, on one long-lived thread pool.  ``requests_per_minute`` (0 = no
+    limit) caps request starts with a token bucket.  On HTTP 429 the
+    in-flight limit is halved and the batch is retried after a jittered
+    backoff; each success raises the limit by one again.
     """
 
+    # Rate-limit retries allowed per batch before they count as failures
+    MAX_THROTTLE_RETRIES = 8
+
     def __init__(
         self,
         model: str = "gemini-embedding-001",
@@ -33,6 +125,9 @@ class Embedder:
         api_key: str | None = None,
         timeout: float = 120.0,
         max_retries: int = 3,
+        max_concurrent_batches: int = 4,
+        requests_per_minute: float = 0,
+        query_cache_size: int = 256,
     ):
         from google import genai
         # Uses GEMINI_API_KEY env var if api_key not provided
@@ -44,58 +139,139 @@ class Embedder:
         self.dimensions = dimensions
         self.timeout = timeout
         self.max_retries = max_retries
-
-    def _embed_batch_with_timeout(
-        self, batch: list[str], task_type: str, batch_num: int, total_batches: int
-    ) -> list[list[float]]:
-        """Embed a single batch with timeout, retry, and logging."""
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._concurrency_limit = self.max_concurrent_batches
+        self._rate_limiter = (
+            _TokenBucket(requests_per_minute / 60.0, capacity=self.max_concurrent_batches)
+            if requests_per_minute > 0 else None
+        )
+        # Headroom for calls abandoned after a timeout, which keep a thread busy
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent_batches * 2,
+            thread_name_prefix="gemini-embed",
+        )
+        self._stats_lock = threading.Lock()
+        self._stats = {"texts": 0, "batches": 0, "seconds": 0.0, "throttled": 0}
+        # Optional EmbeddingCache, attached by create_embedder()
+        self.cache = None
+        self._query_cache = _QueryLRU(query_cache_size)
+
+    @property
+    def stats(self) -> dict:
+        """Cumulative embedding throughput for this instance."""
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["texts_per_sec"] = round(out["texts"] / out["seconds"], 1) if out["seconds"] else 0.0
+        return out
+
+    def _call_embed(self, batch: list[str], task_type: str) -> list[list[float]]:
         from google.genai import types
-        total_chars = sum(len(t) for t in batch)
-        logger.debug(
-            f"Embedding batch {batch_num}/{total_batches}: "
-            f"{len(batch)} texts, {total_chars} chars total"
+        response = self.client.models.embed_content(
+            model=self.model,
+            contents=batch,
+            config=types.EmbedContentConfig(
+                task_type=task_type,
+                output_dimensionality=self.dimensions,
+            ),
         )
+        return [e.values for e in response.embeddings]
 
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(
-                        self.client.models.embed_content,
-                        model=self.model,
-                        contents=batch,
-                        config=types.EmbedContentConfig(
-                            task_type=task_type,
-                            output_dimensionality=self.dimensions,
-                        ),
-                    )
-                    response = future.result(timeout=self.timeout)
+    def _embed_batches(self, batches: list[list[str]], task_type: str) -> list[list[list[float]]]:
+        """Embed batches concurrently with timeout, retry, and rate control.
 
-                logger.debug(
-                    f"Batch {batch_num}/{total_batches} succeeded "
-                    f"(attempt {attempt}), got {len(response.embeddings)} embeddings"
-                )
-                return [e.values for e in response.embeddings]
+        Returns per-batch results in input order.
 
-            except concurrent.futures.TimeoutError:
+        Raises:
+            EmbeddingError: If any batch fails ``max_retries`` times.
+        """
+        total_batches = len(batches)
+        results: list[list[list[float]] | None] = [None] * total_batches
+        attempts = [0] * total_batches
+        throttles = [0] * total_batches
+        ready: deque[int] = deque(range(total_batches))
+        delayed: list[tuple[float, int]] = []  # heap of (ready_at, batch_idx)
+        in_flight: dict[concurrent.futures.Future, tuple[int, float]] = {}  # future -> (idx, deadline)
+
+        def fail(idx: int, reason: str, rate_limited: bool = False) -> None:
+            if rate_limited:
+                throttles[idx] += 1
+                with self._stats_lock:
+                    self._stats["throttled"] += 1
+                self._concurrency_limit = max(1, self._concurrency_limit // 2)
+            counts = not rate_limited or throttles[idx] > self.MAX_THROTTLE_RETRIES
+            if counts:
                 logger.warning(
-                    f"Batch {batch_num}/{total_batches} timed out after "
-                    f"{self.timeout}s (attempt {attempt}/{self.max_retries})"
+                    f"Batch {idx + 1}/{total_batches} {reason} "
+                    f"(attempt {attempts[idx]}/{self.max_retries})"
                 )
-            except Exception as e:
-                logger.warning(
-                    f"Batch {batch_num}/{total_batches} failed "
-                    f"(attempt {attempt}/{self.max_retries}): {type(e).__name__}: {e}"
+            else:
+                attempts[idx] -= 1  # throttling is not the batch's fault
+                logger.info(f"Batch {idx + 1}/{total_batches} rate limited, in-flight limit now {self._concurrency_limit}")
+            if attempts[idx] >= self.max_retries:
+                for f in in_flight:
+                    f.cancel()
+                batch = batches[idx]
+                raise EmbeddingError(
+                    f"Batch {idx + 1}/{total_batches} failed after "
+                    f"{self.max_retries} attempts ({len(batch)} texts, {sum(len(t) for t in batch)} chars)"
+                )
+            # Exponential backoff with jitter so concurrent retries spread out;
+            # 429s back off harder
+            exponent = throttles[idx] + 1 if rate_limited else attempts[idx]
+            backoff = min(2 ** exponent, 60) * random.uniform(0.5, 1.5)
+            logger.info(f"Retrying batch {idx + 1} in {backoff:.1f}s...")
+            heapq.heappush(delayed, (time.monotonic() + backoff, idx))
+
+        while ready or delayed or in_flight:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                ready.append(heapq.heappop(delayed)[1])
+
+            while ready and len(in_flight) < self._concurrency_limit:
+                idx = ready.popleft()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                attempts[idx] += 1
+                logger.debug(
+                    f"Embedding batch {idx + 1}/{total_batches}: "
+                    f"{len(batches[idx])} texts, {sum(len(t) for t in batches[idx])} chars total"
+                )
+                future = self._executor.submit(self._call_embed, batches[idx], task_type)
+                in_flight[future] = (idx, time.monotonic() + self.timeout)
+
+            wake_at = [deadline for _idx, deadline in in_flight.values()]
+            if delayed:
+                wake_at.append(delayed[0][0])
+            timeout = max(0.0, min(wake_at) - time.monotonic()) if wake_at else None
+            if in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED,
                 )
+            else:
+                time.sleep(timeout or 0)
+                done = set()
+
+            for future in done:
+                idx, _deadline = in_flight.pop(future)
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    fail(idx, f"failed: {type(e).__name__}: {e}", rate_limited=_is_rate_limited(e))
+                    continue
+                logger.debug(
+                    f"Batch {idx + 1}/{total_batches} succeeded "
+                    f"(attempt {attempts[idx]}), got {len(results[idx])} embeddings"
+                )
+                self._concurrency_limit = min(self.max_concurrent_batches, self._concurrency_limit + 1)
 
-            if attempt < self.max_retries:
-                backoff = 2 ** attempt
-                logger.info(f"Retrying in {backoff}s...")
-                time.sleep(backoff)
+            now = time.monotonic()
+            for future, (idx, deadline) in list(in_flight.items()):
+                if deadline <= now and not future.done():
+                    del in_flight[future]
+                    future.cancel()  # no-op if running; the thread is abandoned
+                    fail(idx, f"timed out after {self.timeout}s")
 
-        raise EmbeddingError(
-            f"Batch {batch_num}/{total_batches} failed after "
-            f"{self.max_retries} attempts ({len(batch)} texts, {total_chars} chars)"
-        )
+        return results  # type: ignore[return-value]
 
     def embed(
         self,
@@ -114,40 +290,56 @@ class Embedder:
                 - "CLASSIFICATION": For classification
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in input order
 
         Raises:
             EmbeddingError: If embedding fails after retries
         """
         if not texts:
             return []
+        if self.cache is not None:
+            namespace = self.cache.namespace("gemini", self.model, self.dimensions, task_type)
+            return self.cache.get_or_compute(
+                namespace, texts, lambda missing: self._embed_uncached(missing, task_type),
+            )
+        return self._embed_uncached(texts, task_type)
 
-        results = []
+    def _embed_uncached(self, texts: list[str], task_type: str) -> list[list[float]]:
         batch_size = 100  # Gemini limit
-        total_batches = (len(texts) + batch_size - 1) // batch_size
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
 
         logger.debug(
-            f"Embedding {len(texts)} texts in {total_batches} batch(es), "
+            f"Embedding {len(texts)} texts in {len(batches)} batch(es), "
             f"task_type={task_type}"
         )
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            batch_results = self._embed_batch_with_timeout(
-                batch, task_type, batch_num, total_batches
+        t0 = time.perf_counter()
+        batch_results = self._embed_batches(batches, task_type)
+        elapsed = time.perf_counter() - t0
+        with self._stats_lock:
+            self._stats["texts"] += len(texts)
+            self._stats["batches"] += len(batches)
+            self._stats["seconds"] += elapsed
+        if len(batches) > 1:
+            logger.info(
+                f"Embedded {len(texts)} texts in {elapsed:.1f}s "
+                f"({len(texts) / elapsed:.0f} texts/s, {len(batches)} batches)"
             )
-            results.extend(batch_results)
 
-        return results
+        return [vec for batch in batch_results for vec in batch]
 
     def embed_query(self, query: str) -> list[float]:
         """
         Embed a search query.
 
         Uses RETRIEVAL_QUERY task type for asymmetric retrieval.
+        Repeated queries are answered from an in-process LRU.
         """
-        return self.embed([query], task_type="RETRIEVAL_QUERY")[0]
+        vector = self._query_cache.get(query)
+        if vector is None:
+            vector = self.embed([query], task_type="RETRIEVAL_QUERY")[0]
+            self._query_cache.put(query, vector)
+        return vector
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """
@@ -171,22 +363,48 @@ class LocalEmbedder:
     Note: Uses symmetric embeddings (same for docs and queries).
     """
 
-    def __init__(self):
+    def __init__(self, query_cache_size: int = 256):
         import chromadb.utils.embedding_functions as ef
         self._ef = ef.DefaultEmbeddingFunction()
         self.dimensions = 384  # all-MiniLM-L6-v2 output size
+        self._stats = {"texts": 0, "batches": 0, "seconds": 0.0, "throttled": 0}
+        # Optional EmbeddingCache, attached by create_embedder()
+        self.cache = None
+        self._query_cache = _QueryLRU(query_cache_size)
+
+    @property
+    def stats(self) -> dict:
+        """Cumulative embedding throughput for this instance."""
+        out = dict(self._stats)
+        out["texts_per_sec"] = round(out["texts"] / out["seconds"], 1) if out["seconds"] else 0.0
+        return out
 
     def embed(self, texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT") -> list[list[float]]:
         """Embed texts. task_type is ignored (symmetric model)."""
         if not texts:
             return []
+        if self.cache is not None:
+            namespace = self.cache.namespace("local", "all-MiniLM-L6-v2", self.dimensions, "symmetric")
+            return self.cache.get_or_compute(namespace, texts, self._embed_uncached)
+        return self._embed_uncached(texts)
+
+    def _embed_uncached(self, texts: list[str]) -> list[list[float]]:
+        t0 = time.perf_counter()
         # ChromaDB's DefaultEmbeddingFunction returns numpy arrays with np.float32
         # Convert to native Python floats for ChromaDB compatibility
-        return [[float(v) for v in e] for e in self._ef(texts)]
+        vectors = [[float(v) for v in e] for e in self._ef(texts)]
+        self._stats["texts"] += len(texts)
+        self._stats["batches"] += 1
+        self._stats["seconds"] += time.perf_counter() - t0
+        return vectors
 
     def embed_query(self, query: str) -> list[float]:
-        """Embed a search query."""
-        return self.embed([query])[0]
+        """Embed a search query (repeats are served from an in-process LRU)."""
+        vector = self._query_cache.get(query)
+        if vector is None:
+            vector = self.embed([query])[0]
+            self._query_cache.put(query, vector)
+        return vector
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed documents for indexing."""
@@ -200,25 +418,37 @@ def create_embedder(config: "Config"):
         config: Application configuration
 
     Returns:
-        Embedder instance (Gemini API or LocalEmbedder)
+        Embedder instance (Gemini API or LocalEmbedder), with an
+        EmbeddingCache attached when ``config.embedding_cache_enabled``
 
     Raises:
         ValueError: If embedding_provider is invalid
     """
     if config.embedding_provider == "local":
         logger.info("Using local embeddings (all-MiniLM-L6-v2, 384 dimensions)")
-        return LocalEmbedder()
+        embedder = LocalEmbedder(query_cache_size=config.query_cache_size)
     elif config.embedding_provider == "gemini":
         logger.info(f"Using Gemini embeddings ({config.embedding_model}, {config.embedding_dimensions} dimensions)")
-        return Embedder(
+        embedder = Embedder(
             model=config.embedding_model,
             dimensions=config.embedding_dimensions,
             api_key=config.gemini_api_key,
             timeout=config.embedding_timeout,
             max_retries=config.embedding_max_retries,
+            max_concurrent_batches=config.embedding_concurrency,
+            requests_per_minute=config.embedding_requests_per_minute,
+            query_cache_size=config.query_cache_size,
         )
     else:
         raise ValueError(
             f"Invalid embedding_provider: {config.embedding_provider}. "
             f"Must be 'gemini' or 'local'"
         )
+
+    if config.embedding_cache_enabled:
+        from .embedding_cache import EmbeddingCache
+        embedder.cache = EmbeddingCache(
+            config.chroma_db_path.parent / "embedding_cache.sqlite",
+            max_entries=config.embedding_cache_max_entries,
+        )
+    return embedder
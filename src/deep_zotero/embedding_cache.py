@@ -0,0 +1,150 @@
+"""Persistent embedding cache keyed by text content.
+
+Re-indexing a changed PDF or running ``--force`` re-embeds every chunk,
+although most chunk texts are byte-identical to ones embedded before.
+This cache stores each vector under
+sha256(provider, model, dimensions, task_type, text), so identical
+text is only ever embedded once per embedding configuration.
+
+Vectors are stored as float32 blobs in SQLite.  When the entry count
+exceeds ``max_entries``, the least recently used entries are evicted.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_SQL_CHUNK = 500  # keys per IN (...) query
+
+
+class EmbeddingCache:
+    """SQLite-backed LRU cache of embedding vectors.
+
+    Args:
+        path: SQLite file (created if missing).
+        max_entries: Entry limit; least recently used entries are evicted
+            beyond it.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 200_000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_lru ON embeddings(last_used)")
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def namespace(provider: str, model: str, dimensions: int, task_type: str) -> str:
+        """Key prefix identifying one embedding configuration."""
+        return f"{provider}\0{model}\0{dimensions}\0{task_type}\0"
+
+    @staticmethod
+    def _key(namespace: str, text: str) -> str:
+        return hashlib.sha256((namespace + text).encode("utf-8")).hexdigest()
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        texts: list[str],
+        compute: Callable[[list[str]], list[list[float]]],
+    ) -> list[list[float]]:
+        """Return vectors for ``texts``, computing and storing only misses.
+
+        Args:
+            namespace: Value from namespace().
+            texts: Texts to embed.
+            compute: Embeds a list of texts (called once, with the unique
+                uncached texts, or not at all).
+
+        Returns:
+            One vector per input text, in input order.
+        """
+        keys = [self._key(namespace, t) for t in texts]
+        found = self._get_many(set(keys))
+
+        missing: dict[str, str] = {}  # key -> text, de-duplicated
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        n_missed = sum(1 for k in keys if k not in found)
+        with self._lock:
+            self.hits += len(keys) - n_missed
+            self.misses += n_missed
+
+        if missing:
+            vectors = compute(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._put_many(computed)
+            found.update(computed)
+
+        return [list(found[k]) for k in keys]
+
+    def _get_many(self, keys: set[str]) -> dict[str, list[float]]:
+        out: dict[str, list[float]] = {}
+        key_list = list(keys)
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(key_list), _SQL_CHUNK):
+                chunk = key_list[i:i + _SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    out[key] = array("f", blob).tolist()
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, r[0]) for r in rows],
+                    )
+        return out
+
+    def _put_many(self, vectors: dict[str, list[float]]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                [(k, array("f", v).tobytes(), now) for k, v in vectors.items()],
+            )
+            self._conn.execute("COMMIT")
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN ("
+                " SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            logger.debug(f"Embedding cache: evicted {excess} entries")
+
+    def stats(self) -> dict:
+        """Entry count plus hit/miss counts since this instance was created."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,149 @@
+"""Content-addressed on-disk cache of finished document extractions.
+
+Extraction (layout analysis, OCR, caption scanning, vision) is by far the
+most expensive part of indexing, and its output depends only on the PDF
+bytes and the extractor itself — not on chunking or embedding settings.
+Caching it lets a ``--force`` re-index after a chunk_size or embedding
+change skip straight to chunking.
+
+Entries are pickled DocumentExtraction objects named by
+sha256(full PDF) + extractor version + extraction options.  Recency is
+tracked through file mtimes, and the least recently used entries are
+evicted once the directory exceeds its size limit.  The directory size is
+scanned once when the cache is opened and then kept as a running total,
+so inserts only rescan the directory when the limit is crossed.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from .models import DocumentExtraction
+
+logger = logging.getLogger(__name__)
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of the complete file contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """LRU-bounded directory of pickled extractions.
+
+    Args:
+        directory: Cache directory (created if missing).
+        max_bytes: Total size limit; least recently used entries are
+            evicted after each insert that exceeds it.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._total_bytes = sum(size for _mtime, size, _p in self._scan())
+
+    @staticmethod
+    def make_key(pdf_hash: str, *, extractor_version: int, ocr_language: str, vision: str) -> str:
+        """Cache key for a PDF under a given extractor configuration.
+
+        Args:
+            pdf_hash: Full-file hash from file_hash().
+            extractor_version: pdf_processor.EXTRACTOR_VERSION.
+            ocr_language: OCR language passed to extract_document.
+            vision: Vision model name, or "" when vision is disabled.
+        """
+        options = f"v{extractor_version}:{ocr_language}:{vision or 'novision'}"
+        return f"{pdf_hash}_{hashlib.sha256(options.encode()).hexdigest()[:12]}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> DocumentExtraction | None:
+        """Return the cached extraction for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                extraction = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable extraction cache entry {path.name}: {e}")
+            self._total_bytes -= self._size(path)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # mark as recently used
+        return extraction
+
+    def put(self, key: str, extraction: DocumentExtraction) -> None:
+        """Store a fully resolved extraction (no pending vision work)."""
+        if extraction.pending_vision is not None:
+            raise ValueError("Cannot cache an extraction with pending vision work")
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(extraction, f, protocol=pickle.HIGHEST_PROTOCOL)
+        replaced = self._size(path)
+        os.replace(tmp, path)
+        self._total_bytes += self._size(path) - replaced
+        if self._total_bytes > self.max_bytes:
+            self.prune()
+
+    def stats(self) -> dict:
+        """Entry count and total size of the cache."""
+        sizes = [p.stat().st_size for p in self.directory.glob("*.pkl")]
+        return {"entries": len(sizes), "bytes": sum(sizes)}
+
+    def prune(self, max_bytes: int | None = None) -> tuple[int, int]:
+        """Evict least recently used entries until under ``max_bytes``.
+
+        Args:
+            max_bytes: Size target; defaults to the cache's own limit.
+                Pass 0 to empty the cache.
+
+        Returns:
+            (entries_removed, bytes_freed)
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._scan()
+        total = sum(size for _mtime, size, _p in entries)
+        self._total_bytes = total  # resync with other writers
+        if total <= limit:
+            return 0, 0
+
+        entries.sort()  # oldest first
+        removed = freed = 0
+        for _mtime, size, p in entries:
+            if total - freed <= limit:
+                break
+            p.unlink(missing_ok=True)
+            removed += 1
+            freed += size
+        self._total_bytes = total - freed
+        logger.debug(f"Extraction cache: evicted {removed} entries ({freed / 1e6:.1f} MB)")
+        return removed, freed
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry."""
+        entries = []
+        for p in self.directory.glob("*.pkl"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        return entries
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
@@ -1,6 +1,8 @@
 """Feature extraction: caption detection, figure detection, vision table extraction, cell cleaning."""
 
-from .captions import DetectedCaption, find_all_captions
+from .captions import DetectedCaption, PageTextCache, find_all_captions
+from .doc_pool import DocumentPool
+from .image_optimizer import ImageOptions
 from .paddle_extract import (
     MatchedPaddleTable,
     PaddleEngine,
@@ -11,7 +13,10 @@ from .paddle_extract import (
 
 __all__ = [
     "DetectedCaption",
+    "DocumentPool",
+    "ImageOptions",
     "find_all_captions",
+    "PageTextCache",
     "MatchedPaddleTable",
     "match_tables_to_captions",
     "PaddleEngine",
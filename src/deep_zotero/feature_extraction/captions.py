@@ -233,6 +233,7 @@ def find_all_captions(
     *,
     include_figures: bool = True,
     include_tables: bool = True,
+    text_dict: dict | None = None,
 ) -> list[DetectedCaption]:
     """Find all table and figure captions on a page.
 
@@ -244,11 +245,14 @@ def find_all_captions(
         page: A pymupdf Page object.
         include_figures: Whether to look for figure captions.
         include_tables: Whether to look for table captions.
+        text_dict: Pre-parsed ``page.get_text("dict")`` output (e.g. from
+            a PageTextCache). Parsed from the page if omitted.
 
     Returns:
         All detected captions sorted by y-position (top to bottom).
     """
-    text_dict = page.get_text("dict")
+    if text_dict is None:
+        text_dict = page.get_text("dict")
     results: list[DetectedCaption] = []
 
     for block in text_dict.get("blocks", []):
@@ -312,6 +316,79 @@ def find_all_captions(
     return results
 
 
+# ---------------------------------------------------------------------------
+# Per-document page text cache
+# ---------------------------------------------------------------------------
+
+
+class PageTextCache:
+    """Parse each page of a document at most once per extraction.
+
+    Abstract detection, per-page caption scanning, orphan recovery,
+    stats and completeness grading all walk the same pages' text.  One
+    cache is created per open document and passed through those stages
+    so each page's text dict, plain text and captions are computed once.
+
+    Text dicts are parsed without image blocks: every consumer skips
+    non-text blocks, and dropping the embedded image bytes keeps the
+    cache small on figure-heavy papers.
+
+    Args:
+        doc: Open pymupdf.Document (must outlive the cache).
+        caption_finder: Caption detector called as
+            ``caption_finder(page, include_figures=, include_tables=,
+            text_dict=)``. Defaults to find_all_captions.
+    """
+
+    def __init__(self, doc: pymupdf.Document, caption_finder=None):
+        import pymupdf
+
+        self.doc = doc
+        self._caption_finder = caption_finder or find_all_captions
+        self._dict_flags = pymupdf.TEXTFLAGS_DICT & ~pymupdf.TEXT_PRESERVE_IMAGES
+        self._dicts: dict[int, dict] = {}
+        self._texts: dict[int, str] = {}
+        self._captions: dict[tuple[int, bool, bool], list[DetectedCaption]] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def text_dict(self, page_idx: int) -> dict:
+        """``get_text("dict")`` output (text blocks only) for a 0-indexed page."""
+        if page_idx not in self._dicts:
+            self._dicts[page_idx] = self.doc[page_idx].get_text("dict", flags=self._dict_flags)
+        return self._dicts[page_idx]
+
+    def text(self, page_idx: int) -> str:
+        """``get_text()`` plain text for a 0-indexed page."""
+        if page_idx not in self._texts:
+            self._texts[page_idx] = self.doc[page_idx].get_text()
+        return self._texts[page_idx]
+
+    def captions(
+        self,
+        page_idx: int,
+        *,
+        include_figures: bool = True,
+        include_tables: bool = True,
+    ) -> list[DetectedCaption]:
+        """Detected captions for a 0-indexed page.
+
+        Cached per (include_figures, include_tables) combination, since a
+        block matching both patterns is classified differently depending
+        on which types are requested.
+        """
+        key = (page_idx, include_figures, include_tables)
+        if key not in self._captions:
+            self._captions[key] = self._caption_finder(
+                self.doc[page_idx],
+                include_figures=include_figures,
+                include_tables=include_tables,
+                text_dict=self.text_dict(page_idx),
+            )
+        return self._captions[key]
+
+
 # ---------------------------------------------------------------------------
 # is_in_references utility
 # ---------------------------------------------------------------------------
@@ -0,0 +1,218 @@
+"""Append-only vision cost ledger.
+
+Every vision batch result is logged as one JSON line, so logging costs
+O(1) per entry regardless of how large the ledger has grown.  A rolled-up
+summary (totals, per-session counts, and the byte offset it covers) is
+kept next to the ledger; ``summarize`` only parses lines appended since
+the last rollup, plus the last few lines for ``recent_entries``.
+
+Ledgers written by older versions as a single JSON array
+(``vision_costs.json``) are converted on first use.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_VERSION = 1
+
+# Serializes appends from concurrent threads within one process
+_append_lock = threading.Lock()
+
+
+def _empty_rollup() -> dict:
+    return {
+        "version": _ROLLUP_VERSION,
+        "offset": 0,
+        "total_cost": 0.0,
+        "total_tables": 0,
+        "tokens": {"input": 0, "output": 0, "cache_write": 0, "cache_read": 0},
+        "sessions": {},
+    }
+
+
+class CostLedger:
+    """JSONL cost ledger with an incrementally maintained summary.
+
+    Args:
+        path: Ledger path, normally ``*.jsonl``. A ``.json`` path is mapped
+            to the ``.jsonl`` file beside it. A legacy JSON-array log with
+            the same stem is migrated into the ledger.
+    """
+
+    def __init__(self, path: Path | str):
+        path = Path(path)
+        if path.suffix == ".json":
+            path = path.with_suffix(".jsonl")
+        self.path = path
+        self.legacy_path = path.with_suffix(".json")
+        self.rollup_path = path.with_name(path.name + ".summary.json")
+        self._migrate()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, entry: dict) -> None:
+        """Append one cost entry."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with _append_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _migrate(self) -> None:
+        """Fold a legacy JSON-array log into the JSONL ledger (oldest first)."""
+        legacy = self.legacy_path
+        if not legacy.exists():
+            return
+        try:
+            entries = json.loads(legacy.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Could not migrate legacy cost log %s: %s", legacy, exc)
+            return
+        if not isinstance(entries, list):
+            entries = []
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with _append_lock:
+            with open(tmp, "w", encoding="utf-8") as out:
+                for entry in entries:
+                    out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                if self.path.exists():
+                    with open(self.path, "r", encoding="utf-8") as existing:
+                        for line in existing:
+                            out.write(line)
+            os.replace(tmp, self.path)
+            self.rollup_path.unlink(missing_ok=True)
+            legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+        logger.info("Migrated %d vision cost entries to %s", len(entries), self.path)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def summarize(self, last_n: int = 10) -> dict | None:
+        """Aggregate the ledger; None if it has no entries.
+
+        Returns:
+            Dict with total_cost_usd, total_tables, avg_cost_per_table_usd,
+            tokens, sessions (sorted by first timestamp) and the last
+            ``last_n`` entries as recent_entries.
+        """
+        if not self.path.exists():
+            return None
+
+        rollup = self._load_rollup()
+        size = self.path.stat().st_size
+        if size < rollup["offset"]:
+            # Ledger was truncated or replaced; start over
+            rollup = _empty_rollup()
+        if size > rollup["offset"]:
+            self._roll_forward(rollup)
+            self._save_rollup(rollup)
+
+        if not rollup["total_tables"]:
+            return None
+
+        total_cost = rollup["total_cost"]
+        total_tables = rollup["total_tables"]
+        sessions = [
+            {
+                "session_id": sid,
+                "first_timestamp": s["first_timestamp"],
+                "table_count": s["table_count"],
+                "cost_usd": round(s["cost_usd"], 6),
+            }
+            for sid, s in rollup["sessions"].items()
+        ]
+        sessions.sort(key=lambda x: x["first_timestamp"])
+
+        return {
+            "total_cost_usd": round(total_cost, 6),
+            "total_tables": total_tables,
+            "avg_cost_per_table_usd": round(total_cost / total_tables, 6),
+            "tokens": dict(rollup["tokens"]),
+            "sessions": sessions,
+            "recent_entries": self.tail(last_n, end=rollup["offset"]) if last_n > 0 else [],
+        }
+
+    def _roll_forward(self, rollup: dict) -> None:
+        """Fold complete lines after rollup["offset"] into the rollup."""
+        tokens = rollup["tokens"]
+        sessions = rollup["sessions"]
+        with open(self.path, "rb") as f:
+            f.seek(rollup["offset"])
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partially written line; pick it up next time
+                rollup["offset"] += len(raw)
+                try:
+                    entry = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue
+                cost = entry.get("cost_usd", 0.0)
+                rollup["total_cost"] += cost
+                rollup["total_tables"] += 1
+                tokens["input"] += entry.get("input_tokens", 0)
+                tokens["output"] += entry.get("output_tokens", 0)
+                tokens["cache_write"] += entry.get("cache_write_tokens", 0)
+                tokens["cache_read"] += entry.get("cache_read_tokens", 0)
+
+                sid = entry.get("session_id", "unknown")
+                ts = entry.get("timestamp", "")
+                session = sessions.setdefault(
+                    sid, {"first_timestamp": ts, "table_count": 0, "cost_usd": 0.0},
+                )
+                session["table_count"] += 1
+                session["cost_usd"] += cost
+                if ts and ts < session["first_timestamp"]:
+                    session["first_timestamp"] = ts
+
+    def tail(self, n: int, end: int | None = None) -> list[dict]:
+        """Last ``n`` entries (before byte offset ``end``), oldest first."""
+        if n <= 0 or not self.path.exists():
+            return []
+        with open(self.path, "rb") as f:
+            if end is None:
+                end = f.seek(0, os.SEEK_END)
+            block = 64 * 1024
+            start = end
+            data = b""
+            while start > 0 and data.count(b"\n") <= n:
+                start = max(0, start - block)
+                f.seek(start)
+                data = f.read(end - start)
+        lines = data.split(b"\n")
+        if start > 0:
+            lines = lines[1:]  # first line may be cut mid-entry
+        entries: list[dict] = []
+        for raw in lines:
+            if raw.strip():
+                try:
+                    entries.append(json.loads(raw))
+                except json.JSONDecodeError:
+                    continue
+        return entries[-n:]
+
+    def _load_rollup(self) -> dict:
+        try:
+            rollup = json.loads(self.rollup_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return _empty_rollup()
+        if rollup.get("version") != _ROLLUP_VERSION:
+            return _empty_rollup()
+        return rollup
+
+    def _save_rollup(self, rollup: dict) -> None:
+        tmp = self.rollup_path.with_name(self.rollup_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(rollup), encoding="utf-8")
+            os.replace(tmp, self.rollup_path)
+        except OSError as exc:
+            logger.warning("Could not save vision cost summary: %s", exc)
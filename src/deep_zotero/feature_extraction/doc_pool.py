@@ -0,0 +1,67 @@
+"""Bounded pool of open PDF documents.
+
+The vision path touches the same PDFs repeatedly — rendering every table
+crop, building re-crop and full-page specs, and post-processing — and
+Zotero storage is often network-mounted, where each ``pymupdf.open`` is
+expensive.  A DocumentPool keeps recently used documents open and closes
+the least recently used one when the bound is reached.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pymupdf
+
+
+class DocumentPool:
+    """LRU cache of open pymupdf.Document handles keyed by path.
+
+    A handle returned by ``get`` stays valid until the pool is closed or
+    ``max_open`` other documents have been requested since.  Use as a
+    context manager so every handle is closed when the stage ends.
+
+    Args:
+        max_open: Maximum number of documents held open at once.
+    """
+
+    def __init__(self, max_open: int = 8):
+        if max_open < 1:
+            raise ValueError(f"max_open must be >= 1, got {max_open}")
+        self._max_open = max_open
+        self._docs: OrderedDict[str, pymupdf.Document] = OrderedDict()
+        self._lock = threading.Lock()
+        self.opens = 0
+
+    def get(self, pdf_path: Path | str) -> pymupdf.Document:
+        """Open document for ``pdf_path``, reusing a pooled handle if present."""
+        key = str(pdf_path)
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                self._docs.move_to_end(key)
+                return doc
+            doc = pymupdf.open(key)
+            self.opens += 1
+            self._docs[key] = doc
+            while len(self._docs) > self._max_open:
+                _, evicted = self._docs.popitem(last=False)
+                evicted.close()
+            return doc
+
+    def close(self) -> None:
+        """Close every pooled document."""
+        with self._lock:
+            while self._docs:
+                _, doc = self._docs.popitem(last=False)
+                doc.close()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __enter__(self) -> DocumentPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
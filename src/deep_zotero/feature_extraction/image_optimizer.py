@@ -0,0 +1,133 @@
+"""Size optimization for rendered vision images.
+
+Table crops are rendered at up to 300 DPI and sent as base64 PNG; the
+full-page fallbacks of vision waves 2/3 are the largest payloads and
+dominate batch splitting.  ``encode_pixmap`` turns a rendered pixmap into
+image bytes under an ``ImageOptions`` policy:
+
+- grayscale: drop colour channels (tables are almost always black on white)
+- colors: quantize PNGs to a small palette
+- trim_whitespace: cut blank page margins from full-page renders
+  (``content_rect``, applied in page coordinates before rendering)
+- format: PNG (lossless), or JPEG/WebP at ``quality``
+
+Resolution is left alone: render_table_region already targets the
+1568 px long edge the Anthropic API resizes to.
+
+The default options produce exactly the PNG ``pymupdf`` writes, so
+optimization is opt-in.  See tests/benchmark_image_payload.py for the
+size/token trade-off on the fixture papers.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+
+import pymupdf
+from PIL import Image, ImageChops
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+
+# Pixels darker than this (0-255) count as content when trimming
+_TRIM_THRESHOLD = 245
+# Blank border kept around trimmed content, in PDF points
+_TRIM_MARGIN = 6.0
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    """Encoding policy for rendered vision images.
+
+    Args:
+        grayscale: Convert to 8-bit grayscale.
+        colors: Palette size for PNG quantization (0 = off, else 2-256).
+        trim_whitespace: Trim blank margins from full-page renders.
+            Crops are never trimmed, so re-crop coordinates returned by
+            the model stay relative to the crop that was requested.
+        format: "png", "jpeg" or "webp".
+        quality: JPEG/WebP quality (1-100).
+    """
+
+    grayscale: bool = False
+    colors: int = 0
+    trim_whitespace: bool = False
+    format: str = "png"
+    quality: int = 85
+
+    def __post_init__(self) -> None:
+        if self.format not in IMAGE_FORMATS:
+            raise ValueError(f"format must be one of {IMAGE_FORMATS}, got {self.format!r}")
+        if self.colors and not 2 <= self.colors <= 256:
+            raise ValueError(f"colors must be 0 or 2-256, got {self.colors}")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"quality must be 1-100, got {self.quality}")
+
+    @property
+    def is_default(self) -> bool:
+        """Whether these options leave pymupdf's PNG output untouched."""
+        return self == _DEFAULT
+
+
+_DEFAULT = ImageOptions()
+
+
+def encode_pixmap(
+    pix: pymupdf.Pixmap,
+    options: ImageOptions | None = None,
+) -> tuple[bytes, str]:
+    """Encode a rendered pixmap as (image_bytes, media_type).
+
+    Args:
+        pix: Rendered page region.
+        options: Encoding policy; None or default options give plain PNG.
+    """
+    if options is None or options.is_default:
+        return pix.tobytes("png"), "image/png"
+
+    img = _to_image(pix)
+    if options.grayscale:
+        img = img.convert("L")
+
+    buf = io.BytesIO()
+    if options.format == "jpeg":
+        img.save(buf, "JPEG", quality=options.quality, optimize=True)
+        return buf.getvalue(), "image/jpeg"
+    if options.format == "webp":
+        img.save(buf, "WEBP", quality=options.quality, method=6)
+        return buf.getvalue(), "image/webp"
+    if options.colors:
+        img = img.quantize(colors=options.colors)
+    img.save(buf, "PNG", optimize=True)
+    return buf.getvalue(), "image/png"
+
+
+def _to_image(pix: pymupdf.Pixmap) -> Image.Image:
+    if pix.alpha:
+        pix = pymupdf.Pixmap(pix, 0)
+    if pix.n not in (1, 3):
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pix)
+    mode = "L" if pix.n == 1 else "RGB"
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+
+def content_rect(page: pymupdf.Page, clip: pymupdf.Rect) -> pymupdf.Rect:
+    """Bounding rect of the non-blank content within ``clip``.
+
+    Found on a 72 DPI grayscale render and returned in page coordinates
+    with a small margin, so callers trim before choosing DPI or splitting
+    into strips.  Returns ``clip`` unchanged if it is blank.
+    """
+    clip = pymupdf.Rect(clip)
+    pix = page.get_pixmap(clip=clip, colorspace=pymupdf.csGRAY, alpha=False)
+    gray = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    ink = ImageChops.invert(gray).point(lambda v: 255 if v > 255 - _TRIM_THRESHOLD else 0)
+    bbox = ink.getbbox()
+    if bbox is None:
+        return clip
+    sx = clip.width / pix.width
+    sy = clip.height / pix.height
+    x0, y0, x1, y1 = bbox
+    return pymupdf.Rect(
+        clip.x0 + x0 * sx - _TRIM_MARGIN, clip.y0 + y0 * sy - _TRIM_MARGIN,
+        clip.x0 + x1 * sx + _TRIM_MARGIN, clip.y0 + y1 * sy + _TRIM_MARGIN,
+    ) & clip
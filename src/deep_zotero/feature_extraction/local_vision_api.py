@@ -7,20 +7,26 @@ same prompt, rendering, and parsing utilities from vision_extract.py.
 
 from __future__ import annotations
 
-import base64
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 import pymupdf
 
-from .vision_api import TableVisionSpec
+from .doc_pool import DocumentPool
+from .image_optimizer import ImageOptions
+from .vision_api import (
+    _MIN_PARALLEL_RENDER,
+    TableVisionSpec,
+    _encode_table_images,
+    render_tables_parallel,
+)
 from .vision_extract import (
     AgentResponse,
     VISION_FIRST_SYSTEM,
     build_common_ctx,
     parse_agent_response,
-    render_table_region,
 )
 
 logger = logging.getLogger(__name__)
@@ -49,8 +55,18 @@ class LocalVisionAPI:
         Concurrent requests to vLLM.
     timeout:
         Per-request timeout in seconds.
+    render_workers:
+        Processes used to render table crops before sending
+        (1 = render in-process).
+    image_options:
+        Encoding policy for rendered images (see image_optimizer);
+        None sends pymupdf's PNGs unchanged.
     """
 
+    # Tables can be sent one at a time, so resolve_pending_vision sends a
+    # table's re-crop/full-page follow-up as soon as its response arrives
+    supports_pipelining = True
+
     def __init__(
         self,
         base_url: str = "http://localhost:8118/v1",
@@ -59,6 +75,8 @@ class LocalVisionAPI:
         max_tokens: int = 2048,
         max_workers: int = 4,
         timeout: float = 120.0,
+        render_workers: int = 1,
+        image_options: ImageOptions | None = None,
     ) -> None:
         try:
             import openai as _openai
@@ -74,6 +92,8 @@ class LocalVisionAPI:
         self._max_tokens = max_tokens
         self._max_workers = max_workers
         self._timeout = timeout
+        self._render_workers = render_workers
+        self._image_options = image_options
 
         self._client = _openai.OpenAI(
             base_url=self._base_url,
@@ -96,23 +116,26 @@ class LocalVisionAPI:
     def total_output_tokens(self) -> int:
         return self._total_output_tokens
 
+    @property
+    def max_workers(self) -> int:
+        """Concurrent requests to vLLM."""
+        return self._max_workers
+
     # ------------------------------------------------------------------
     # Table rendering (same as VisionAPI._prepare_table)
     # ------------------------------------------------------------------
 
-    @staticmethod
     def _prepare_table(
+        self,
         spec: TableVisionSpec,
+        doc_pool: DocumentPool | None = None,
     ) -> list[tuple[str, str]]:
-        """Render PNG(s) for a table spec, return (base64, media_type) pairs."""
+        """Render image(s) for a table spec, return (base64, media_type) pairs."""
+        if doc_pool is not None:
+            return _encode_table_images(doc_pool.get(spec.pdf_path), spec, self._image_options)
         doc = pymupdf.open(str(spec.pdf_path))
         try:
-            page = doc[spec.page_num - 1]
-            strips = render_table_region(page, spec.bbox)
-            return [
-                (base64.b64encode(png_bytes).decode("ascii"), media_type)
-                for png_bytes, media_type in strips
-            ]
+            return _encode_table_images(doc, spec, self._image_options)
         finally:
             doc.close()
 
@@ -184,6 +207,106 @@ class LocalVisionAPI:
                 recrop_needed=False, recrop_bbox_pct=None,
             )
 
+    # ------------------------------------------------------------------
+    # Per-table entry points (pipelined scheduling)
+    # ------------------------------------------------------------------
+
+    def render_table(
+        self,
+        spec: TableVisionSpec,
+        doc_pool: DocumentPool | None = None,
+    ) -> list[tuple[str, str]]:
+        """Render one table's crop images.  Not thread-safe (pymupdf)."""
+        return self._prepare_table(spec, doc_pool=doc_pool)
+
+    def extract_table(
+        self,
+        spec: TableVisionSpec,
+        images: list[tuple[str, str]],
+    ) -> AgentResponse:
+        """Send one rendered table and parse the response.
+
+        Safe to call from worker threads; request failures come back as
+        parse_success=False responses.
+        """
+        return self._extract_one(spec, images)
+
+    # ------------------------------------------------------------------
+    # Streaming entry point
+    # ------------------------------------------------------------------
+
+    def iter_tables(
+        self,
+        specs: list[TableVisionSpec],
+        max_in_flight: int | None = None,
+    ) -> Iterator[tuple[int, AgentResponse]]:
+        """Extract tables, yielding ``(index, response)`` as each completes.
+
+        Table N+1 is rendered on the calling thread while earlier tables
+        are being inferred, so callers can start building tables before
+        the last request is sent.  Rendering pauses while
+        ``max_in_flight`` requests (default: twice ``max_workers``) are
+        outstanding, which bounds the base64 images held in memory.
+
+        Args:
+            specs: Table vision specs to extract.
+            max_in_flight: Rendered tables allowed to await a response.
+
+        Yields:
+            (index into ``specs``, AgentResponse), in completion order.
+        """
+        window = max(max_in_flight or 2 * self._max_workers, 1)
+        with DocumentPool() as doc_pool:
+            rendered = (self._prepare_table(spec, doc_pool=doc_pool) for spec in specs)
+            yield from self._stream(specs, rendered, window)
+
+    def _stream(
+        self,
+        specs: list[TableVisionSpec],
+        rendered: Iterator[list[tuple[str, str]]],
+        window: int,
+    ) -> Iterator[tuple[int, AgentResponse]]:
+        """Send rendered tables with at most ``window`` awaiting a response."""
+        pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        in_flight: dict[Future, int] = {}
+        try:
+            for idx, spec in enumerate(specs):
+                # Hand back whatever finished while the last table was rendering
+                for future in [f for f in in_flight if f.done()]:
+                    yield self._collect(future, in_flight.pop(future), specs)
+                while len(in_flight) >= window:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self._collect(future, in_flight.pop(future), specs)
+                in_flight[pool.submit(self._extract_one, spec, next(rendered))] = idx
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self._collect(future, in_flight.pop(future), specs)
+        finally:
+            # A consumer that stops early abandons the queued requests
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect(
+        future: Future, idx: int, specs: list[TableVisionSpec],
+    ) -> tuple[int, AgentResponse]:
+        try:
+            return idx, future.result()
+        except Exception as exc:
+            logger.error(
+                "Unexpected error for spec %d (%s): %s",
+                idx, specs[idx].table_id, exc,
+            )
+            return idx, AgentResponse(
+                headers=[], rows=[], footnotes="",
+                table_label=None, caption="",
+                is_incomplete=False, incomplete_reason="",
+                raw_shape=(0, 0), parse_success=False,
+                raw_response=str(exc),
+                recrop_needed=False, recrop_bbox_pct=None,
+            )
+
     # ------------------------------------------------------------------
     # Main entry point (same signature as VisionAPI.extract_tables_batch)
     # ------------------------------------------------------------------
@@ -195,8 +318,8 @@ class LocalVisionAPI:
         """Extract tables via concurrent requests to a local vLLM server.
 
         Drop-in replacement for ``VisionAPI.extract_tables_batch()``.
-        Renders each table as PNG(s), sends concurrent requests via a
-        thread pool, and parses responses with the shared parser.
+        Collects ``iter_tables`` into input order; with ``render_workers``
+        > 1, all tables are instead rendered up front in a process pool.
 
         Args:
             specs: Table vision specs to extract.
@@ -207,38 +330,11 @@ class LocalVisionAPI:
         if not specs:
             return []
 
-        # Pre-render all tables (CPU work — do sequentially)
-        prepared: list[tuple[TableVisionSpec, list[tuple[str, str]]]] = []
-        for spec in specs:
-            images = self._prepare_table(spec)
-            prepared.append((spec, images))
-
-        # Submit concurrent requests to vLLM
-        responses: dict[int, AgentResponse] = {}
-
-        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
-            futures = {
-                pool.submit(self._extract_one, spec, images): idx
-                for idx, (spec, images) in enumerate(prepared)
-            }
-
-            for future in as_completed(futures):
-                idx = futures[future]
-                try:
-                    responses[idx] = future.result()
-                except Exception as exc:
-                    logger.error(
-                        "Unexpected error for spec %d (%s): %s",
-                        idx, specs[idx].table_id, exc,
-                    )
-                    responses[idx] = AgentResponse(
-                        headers=[], rows=[], footnotes="",
-                        table_label=None, caption="",
-                        is_incomplete=False, incomplete_reason="",
-                        raw_shape=(0, 0), parse_success=False,
-                        raw_response=str(exc),
-                        recrop_needed=False, recrop_bbox_pct=None,
-                    )
+        if self._render_workers > 1 and len(specs) >= _MIN_PARALLEL_RENDER:
+            rendered = render_tables_parallel(specs, self._render_workers, self._image_options)
+            responses = dict(self._stream(specs, iter(rendered), window=len(specs)))
+        else:
+            responses = dict(self.iter_tables(specs))
 
         # Return in input order
         return [responses[i] for i in range(len(specs))]
@@ -7,9 +7,12 @@ Single-agent extraction logic is built on top of this layer.
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +20,10 @@ from pathlib import Path
 import anthropic
 import pymupdf
 
+from .cost_ledger import CostLedger
+from .doc_pool import DocumentPool
+from .image_optimizer import ImageOptions
+from .vision_cache import VisionResultCache
 from .vision_extract import (
     AgentResponse,
     build_common_ctx,
@@ -27,6 +34,9 @@ from .vision_extract import (
 
 logger = logging.getLogger(__name__)
 
+# Identifies the system prompt in vision result cache keys
+VISION_PROMPT_VERSION = hashlib.sha256(VISION_FIRST_SYSTEM.encode("utf-8")).hexdigest()[:16]
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
@@ -95,19 +105,150 @@ def _compute_cost(usage: object, model: str) -> float:
 # ---------------------------------------------------------------------------
 
 
-def _append_cost_entry(path: Path, entry: CostEntry) -> None:
-    """Append a cost entry to the JSON log file."""
-    entries: list[dict] = []
-    if path.exists():
-        try:
-            entries = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            entries = []
-    entries.append(asdict(entry))
-    path.write_text(
-        json.dumps(entries, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+def _batch_fingerprint(model: str, specs: list[TableVisionSpec]) -> str:
+    """Stable identity of a batch call, used to find journaled batches."""
+    h = hashlib.sha256(model.encode())
+    for spec in sorted(specs, key=lambda s: s.table_id):
+        h.update(f"\0{spec.table_id}:{spec.page_num}:{spec.bbox}".encode())
+    return h.hexdigest()[:32]
+
+
+def _append_cost_entry(ledger: CostLedger, entry: CostEntry) -> None:
+    """Append a cost entry to the JSONL cost ledger."""
+    ledger.append(asdict(entry))
+
+
+def _spec_record(spec: TableVisionSpec) -> dict:
+    """JSON-serializable form of a spec, for the batch journal."""
+    record = asdict(spec)
+    record["pdf_path"] = str(spec.pdf_path)
+    record["bbox"] = list(spec.bbox)
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Batch polling
+# ---------------------------------------------------------------------------
+
+
+_POLL_MIN_INTERVAL = 2.0  # seconds before the first status check
+_POLL_MAX_INTERVAL = 60.0
+_POLL_BACKOFF = 1.5
+
+
+def _next_poll_delay(delay: float, done: int, remaining: int, elapsed: float) -> float:
+    """Seconds to wait before the next batch status check.
+
+    Backs off geometrically from ``_POLL_MIN_INTERVAL`` to
+    ``_POLL_MAX_INTERVAL``.  Once requests are completing, waits no
+    longer than the time projected to finish the remaining ones at the
+    observed rate, so a batch that is nearly done is not overslept.
+
+    Args:
+        delay: Previous delay.
+        done: Requests finished so far (any outcome).
+        remaining: Requests still processing.
+        elapsed: Seconds since polling started.
+    """
+    backed_off = min(delay * _POLL_BACKOFF, _POLL_MAX_INTERVAL)
+    if done > 0 and remaining > 0:
+        eta = remaining * elapsed / done
+        return max(_POLL_MIN_INTERVAL, min(eta, backed_off))
+    return backed_off
+
+
+def _request_progress(status: object) -> tuple[int, int] | None:
+    """(done, processing) from a batch's request_counts, if reported."""
+    counts = getattr(status, "request_counts", None)
+    values = [
+        getattr(counts, name, None)
+        for name in ("processing", "succeeded", "errored", "canceled", "expired")
+    ]
+    if not all(isinstance(v, int) for v in values):
+        return None
+    return sum(values[1:]), values[0]
+
+
+# ---------------------------------------------------------------------------
+# Table rendering
+# ---------------------------------------------------------------------------
+
+
+# Below this many tables, process start-up costs more than it saves
+_MIN_PARALLEL_RENDER = 8
+# Tables per worker task; a PDF with more tables is split across tasks
+_RENDER_CHUNK = 32
+
+
+def _encode_table_images(
+    doc: pymupdf.Document,
+    spec: TableVisionSpec,
+    image_options: ImageOptions | None = None,
+) -> list[tuple[str, str]]:
+    """Render a spec's crop from an open document as (base64, media_type) pairs."""
+    return _encode_crop(doc, spec.page_num, spec.bbox, image_options)
+
+
+def _encode_crop(
+    doc: pymupdf.Document,
+    page_num: int,
+    bbox: tuple[float, float, float, float],
+    image_options: ImageOptions | None = None,
+) -> list[tuple[str, str]]:
+    strips = render_table_region(doc[page_num - 1], bbox, image_options=image_options)
+    return [
+        (base64.b64encode(image_bytes).decode("ascii"), media_type)
+        for image_bytes, media_type in strips
+    ]
+
+
+def _render_crop_group(
+    pdf_path: str,
+    crops: list[tuple[int, int, tuple[float, float, float, float]]],
+    image_options: ImageOptions | None = None,
+) -> list[tuple[int, list[tuple[str, str]]]]:
+    """Render (index, page_num, bbox) crops of one PDF in a worker process."""
+    doc = pymupdf.open(pdf_path)
+    try:
+        return [
+            (idx, _encode_crop(doc, page_num, bbox, image_options))
+            for idx, page_num, bbox in crops
+        ]
+    finally:
+        doc.close()
+
+
+def render_tables_parallel(
+    specs: list[TableVisionSpec],
+    workers: int,
+    image_options: ImageOptions | None = None,
+) -> list[list[tuple[str, str]]]:
+    """Render every spec's crop images in a process pool.
+
+    Specs are grouped by PDF (in chunks of ``_RENDER_CHUNK``) so each
+    task opens its document once.  Returns (base64, media_type) pairs
+    per spec, in input order.
+    """
+    groups: dict[str, list[tuple[int, int, tuple]]] = {}
+    for idx, spec in enumerate(specs):
+        groups.setdefault(str(spec.pdf_path), []).append((idx, spec.page_num, spec.bbox))
+    tasks = [
+        (pdf_path, crops[i:i + _RENDER_CHUNK])
+        for pdf_path, crops in groups.items()
+        for i in range(0, len(crops), _RENDER_CHUNK)
+    ]
+
+    logger.debug("Rendering %d tables from %d PDFs in %d processes", len(specs), len(groups), workers)
+    images: list[list[tuple[str, str]] | None] = [None] * len(specs)
+    # spawn, not fork: callers may hold ChromaDB and HTTP client threads
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=ctx) as pool:
+        for rendered in pool.map(
+            _render_crop_group, *zip(*tasks), [image_options] * len(tasks),
+        ):
+            for idx, spec_images in rendered:
+                images[idx] = spec_images
+    return images  # type: ignore[return-value]
 
 
 # ---------------------------------------------------------------------------
@@ -125,25 +266,47 @@ class VisionAPI:
     model:
         Model ID (default: claude-haiku-4-5-20251001).
     cost_log_path:
-        Path to persistent JSON cost log file.
+        Path to the persistent JSONL cost ledger (a legacy ``.json`` log
+        is migrated to the ``.jsonl`` file beside it).
     cache:
         Enable prompt caching (system prompts cached across requests).
+    result_cache:
+        Optional VisionResultCache; tables whose rendered request matches
+        a previously transcribed one are answered from it instead of
+        being submitted.
+    render_workers:
+        Processes used to render table crops before submission
+        (1 = render in-process).
+    image_options:
+        Encoding policy for rendered images (see image_optimizer);
+        None sends pymupdf's PNGs unchanged.
     """
 
     def __init__(
         self,
         api_key: str,
         model: str = "claude-haiku-4-5-20251001",
-        cost_log_path: Path | str = Path("vision_api_costs.json"),
+        cost_log_path: Path | str = Path("vision_api_costs.jsonl"),
         cache: bool = True,
+        batch_journal: object | None = None,
+        result_cache: VisionResultCache | None = None,
+        render_workers: int = 1,
+        image_options: ImageOptions | None = None,
     ) -> None:
         if anthropic is None:
             raise ImportError("anthropic package required: pip install anthropic")
 
         self._client = anthropic.Anthropic(api_key=api_key)
         self._model = model
-        self._cost_log_path = Path(cost_log_path)
+        self._cost_ledger = CostLedger(cost_log_path)
         self._cache = cache
+        # Optional persistent record of submitted batches (see
+        # checkpoint.IndexCheckpoint) so an interrupted run re-polls
+        # batches instead of paying for them twice.
+        self._batch_journal = batch_journal
+        self._result_cache = result_cache
+        self._render_workers = render_workers
+        self._image_options = image_options
         self._session_id = datetime.now(timezone.utc).isoformat()
         self._session_cost = 0.0
 
@@ -156,6 +319,13 @@ class VisionAPI:
         """Total USD cost accumulated this session."""
         return self._session_cost
 
+    @property
+    def cache_stats(self) -> dict | None:
+        """Vision result cache entries and hit/miss counts (None if disabled)."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.stats()
+
     # ------------------------------------------------------------------
     # Generic batch infrastructure
     # ------------------------------------------------------------------
@@ -170,15 +340,27 @@ class VisionAPI:
         self,
         batch_id: str,
         expected_count: int,
-        poll_interval: float = 30.0,
     ) -> dict[str, str]:
-        """Poll a batch until done, return {custom_id: response_text}."""
+        """Poll a batch until done, return {custom_id: response_text}.
+
+        Status checks start after ``_POLL_MIN_INTERVAL`` seconds and back
+        off from there, shortened by the batch's reported progress (see
+        ``_next_poll_delay``).
+        """
+        start = time.monotonic()
+        delay = _POLL_MIN_INTERVAL
         while True:
-            time.sleep(poll_interval)
+            time.sleep(delay)
             status = self._client.messages.batches.retrieve(batch_id)
             if status.processing_status == "ended":
                 break
-            logger.debug("Batch %s status: %s", batch_id, status.processing_status)
+            progress = _request_progress(status)
+            done, remaining = progress if progress is not None else (0, 0)
+            delay = _next_poll_delay(delay, done, remaining, time.monotonic() - start)
+            logger.debug(
+                "Batch %s status: %s (%d done, %d processing; next check in %.0fs)",
+                batch_id, status.processing_status, done, remaining, delay,
+            )
 
         results: dict[str, str] = {}
         for result in self._client.messages.batches.results(batch_id):
@@ -213,7 +395,7 @@ class VisionAPI:
                     cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
                     cost_usd=cost,
                 )
-                _append_cost_entry(self._cost_log_path, entry)
+                _append_cost_entry(self._cost_ledger, entry)
             except (AttributeError, IndexError) as exc:
                 logger.warning("Could not parse batch result %s: %s", cid, exc)
 
@@ -231,11 +413,16 @@ class VisionAPI:
         self,
         requests: list[dict],
         max_batch_bytes: int = 200_000_000,  # 200MB safety margin under 256MB limit
+        fingerprint: str | None = None,
+        request_meta: dict[str, dict] | None = None,
     ) -> dict[str, str]:
         """Submit request(s) as one or more batches, poll each, merge results.
 
         Splits into sub-batches if the serialized size would exceed
-        ``max_batch_bytes`` (the Batch API limit is 256MB).
+        ``max_batch_bytes`` (the Batch API limit is 256MB).  When a batch
+        journal is configured, each batch ID is recorded under
+        ``fingerprint`` before polling starts, together with the
+        ``request_meta`` entries (keyed by custom_id) of its requests.
         """
         if not requests:
             return {}
@@ -269,6 +456,14 @@ class VisionAPI:
             if len(batches) > 1:
                 logger.info("Submitting sub-batch %d/%d (%d requests)", i, len(batches), len(batch_requests))
             batch_id = self._create_batch(batch_requests)
+            if self._batch_journal is not None and fingerprint is not None:
+                meta = None
+                if request_meta is not None:
+                    meta = {
+                        r["custom_id"]: request_meta[r["custom_id"]]
+                        for r in batch_requests if r["custom_id"] in request_meta
+                    }
+                self._batch_journal.record_batch(fingerprint, batch_id, len(batch_requests), meta)
             results = self._poll_batch(batch_id, len(batch_requests))
             all_results.update(results)
 
@@ -279,26 +474,31 @@ class VisionAPI:
     # ------------------------------------------------------------------
 
     def _prepare_table(
-        self, spec: TableVisionSpec,
+        self, spec: TableVisionSpec, doc_pool: DocumentPool | None = None,
     ) -> list[tuple[str, str]]:
         """Render PNG(s) for a table spec.
 
-        Opens the PDF, renders the crop region (possibly as multiple
-        overlapping strips for tall tables), and base64-encodes each image.
+        Renders the crop region (possibly as multiple overlapping strips
+        for tall tables) and base64-encodes each image.  The PDF is taken
+        from ``doc_pool`` when given, otherwise opened and closed here.
 
         Returns list of (base64_string, media_type) pairs.
         """
+        if doc_pool is not None:
+            return _encode_table_images(doc_pool.get(spec.pdf_path), spec, self._image_options)
         doc = pymupdf.open(str(spec.pdf_path))
         try:
-            page = doc[spec.page_num - 1]
-            strips = render_table_region(page, spec.bbox)
-            return [
-                (base64.b64encode(png_bytes).decode("ascii"), media_type)
-                for png_bytes, media_type in strips
-            ]
+            return _encode_table_images(doc, spec, self._image_options)
         finally:
             doc.close()
 
+    def _render_tables(self, specs: list[TableVisionSpec]) -> list[list[tuple[str, str]]]:
+        """Crop images for every spec, in input order."""
+        if self._render_workers > 1 and len(specs) >= _MIN_PARALLEL_RENDER:
+            return render_tables_parallel(specs, self._render_workers, self._image_options)
+        with DocumentPool() as doc_pool:
+            return [self._prepare_table(spec, doc_pool=doc_pool) for spec in specs]
+
     # ------------------------------------------------------------------
     # Request building
     # ------------------------------------------------------------------
@@ -376,18 +576,71 @@ class VisionAPI:
         if not specs:
             return []
 
-        requests: list[dict] = []
-        for spec in specs:
-            images = self._prepare_table(spec)
-            requests.append(self._build_request(spec, images))
-
-        results = self._submit_and_poll(requests)
+        fingerprint = _batch_fingerprint(self._model, specs)
+        results: dict[str, str] = {}
+        todo = specs
+        if self._batch_journal is not None:
+            journaled = self._batch_journal.find_batches(fingerprint)
+            if journaled:
+                logger.info(
+                    "Resuming %d previously submitted batch(es) for %d tables",
+                    len(journaled), len(specs),
+                )
+                for batch_id, n_requests in journaled:
+                    results.update(self._poll_batch(batch_id, n_requests))
+                # Sub-batches that were never submitted before the interruption
+                if sum(n for _bid, n in journaled) < len(specs):
+                    todo = [s for s in specs if f"{s.table_id}__transcriber" not in results]
+                else:
+                    todo = []
+
+        # custom_id -> result cache key, for responses to store once parsed
+        uncached: dict[str, str] = {}
+        if todo:
+            requests: list[dict] = []
+            cache_keys: dict[str, str] = {}
+            request_meta: dict[str, dict] = {}
+            for spec, images in zip(todo, self._render_tables(todo)):
+                request = self._build_request(spec, images)
+                requests.append(request)
+                request_meta[request["custom_id"]] = {"spec": _spec_record(spec)}
+                if self._result_cache is not None:
+                    ctx = build_common_ctx(spec.raw_text, spec.caption, spec.garbled)
+                    cache_keys[request["custom_id"]] = VisionResultCache.key(
+                        self._model, VISION_PROMPT_VERSION, ctx, images,
+                    )
+            if cache_keys:
+                cached = self._result_cache.get_many(list(cache_keys.values()))
+                for cid, key in cache_keys.items():
+                    if key in cached:
+                        results[cid] = cached[key]
+                    else:
+                        uncached[cid] = key
+                if len(uncached) < len(cache_keys):
+                    logger.info(
+                        "Vision cache: %d/%d tables already transcribed",
+                        len(cache_keys) - len(uncached), len(cache_keys),
+                    )
+                requests = [r for r in requests if r["custom_id"] in uncached]
+                for cid, key in uncached.items():
+                    request_meta[cid]["cache_key"] = key
+            results.update(self._submit_and_poll(
+                requests, fingerprint=fingerprint, request_meta=request_meta,
+            ))
+
+        if self._batch_journal is not None:
+            self._batch_journal.finish_batches(fingerprint)
 
         responses: list[AgentResponse] = []
+        to_cache: dict[str, str] = {}
         for spec in specs:
-            raw_text = results.get(f"{spec.table_id}__transcriber")
+            cid = f"{spec.table_id}__transcriber"
+            raw_text = results.get(cid)
             if raw_text is not None:
-                responses.append(parse_agent_response(raw_text, "transcriber"))
+                response = parse_agent_response(raw_text, "transcriber")
+                responses.append(response)
+                if cid in uncached and response.parse_success:
+                    to_cache[uncached[cid]] = raw_text
             else:
                 responses.append(AgentResponse(
                     headers=[], rows=[], footnotes="",
@@ -397,4 +650,54 @@ class VisionAPI:
                     raw_response="",
                     recrop_needed=False, recrop_bbox_pct=None,
                 ))
+        if to_cache:
+            self._result_cache.put_many(to_cache)
         return responses
+
+    def resume_pending_batches(self) -> dict[str, str]:
+        """Collect batches left in the batch journal by an interrupted run.
+
+        Polls every journaled batch that carries per-request metadata,
+        whichever call submitted it, and stores each successfully parsed
+        response in the result cache under the key journaled with its
+        request.  The re-run's ``extract_tables_batch`` calls are then
+        answered from the cache even if their specs are grouped
+        differently.  Requires a result cache; without one, batches stay
+        journaled for ``extract_tables_batch`` to re-poll by fingerprint.
+
+        A batch the API no longer knows (404) is dropped from the journal;
+        other API errors are logged and the batch stays journaled for the
+        next run.
+
+        Returns:
+            {custom_id: response_text} for every collected result.
+        """
+        if self._batch_journal is None or self._result_cache is None:
+            return {}
+        collected: dict[str, str] = {}
+        for batch_id, n_requests in self._batch_journal.pending_batches():
+            meta = self._batch_journal.batch_requests(batch_id)
+            if not meta:
+                continue  # journaled without metadata; only resumable by fingerprint
+            logger.info("Collecting vision batch %s (%d requests) from an interrupted run", batch_id, n_requests)
+            try:
+                results = self._poll_batch(batch_id, n_requests)
+            except anthropic.NotFoundError as exc:
+                # Results expired, or the batch belongs to another key/workspace
+                logger.warning("Vision batch %s is no longer available, forgetting it: %s", batch_id, exc)
+                self._batch_journal.finish_batch(batch_id)
+                continue
+            except anthropic.APIError as exc:
+                logger.warning("Could not collect vision batch %s, will retry next run: %s", batch_id, exc)
+                continue
+            to_cache = {
+                meta[cid]["cache_key"]: text
+                for cid, text in results.items()
+                if meta.get(cid, {}).get("cache_key")
+                and parse_agent_response(text, "transcriber").parse_success
+            }
+            if to_cache:
+                self._result_cache.put_many(to_cache)
+            self._batch_journal.finish_batch(batch_id)
+            collected.update(results)
+        return collected
@@ -0,0 +1,132 @@
+"""Persistent cache of vision transcriptions keyed by request content.
+
+Re-indexing a PDF, or indexing a paper that exists under two Zotero
+items, renders byte-identical table crops with identical text context.
+This cache stores the model's raw response under
+sha256(model, prompt version, context text, rendered images), so an
+identical request is only ever paid for once.
+
+Only responses that parsed successfully are stored; failures are retried
+on the next run.  Entries are kept in SQLite and the least recently used
+ones are evicted beyond ``max_entries``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SQL_CHUNK = 500  # keys per IN (...) query
+
+
+class VisionResultCache:
+    """SQLite-backed LRU cache of raw vision responses.
+
+    Args:
+        path: SQLite file (created if missing).
+        max_entries: Entry limit; least recently used entries are evicted
+            beyond it.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 100_000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, response TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(last_used)")
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        model: str,
+        prompt_version: str,
+        context: str,
+        images: list[tuple[str, str]],
+    ) -> str:
+        """Content address of one vision request.
+
+        Args:
+            model: Model ID.
+            prompt_version: Identifies the system prompt.
+            context: User text sent with the images (raw text, caption,
+                garble warning).
+            images: (base64_data, media_type) pairs as sent.
+        """
+        h = hashlib.sha256(f"{model}\0{prompt_version}\0{context}\0".encode("utf-8"))
+        for b64, media_type in images:
+            h.update(f"{media_type}\0".encode("ascii"))
+            h.update(b64.encode("ascii"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Cached responses for ``keys``; counts each key as a hit or miss."""
+        out: dict[str, str] = {}
+        key_list = list(dict.fromkeys(keys))
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(key_list), _SQL_CHUNK):
+                chunk = key_list[i:i + _SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, response FROM responses WHERE key IN ({marks})", chunk
+                ).fetchall()
+                out.update(rows)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE responses SET last_used = ? WHERE key = ?",
+                        [(now, r[0]) for r in rows],
+                    )
+            n_hit = sum(1 for k in keys if k in out)
+            self.hits += n_hit
+            self.misses += len(keys) - n_hit
+        return out
+
+    def put_many(self, responses: dict[str, str]) -> None:
+        """Store raw responses by key."""
+        if not responses:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, response, last_used) VALUES (?, ?, ?)",
+                [(k, v, now) for k, v in responses.items()],
+            )
+            self._conn.execute("COMMIT")
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            logger.debug("Vision cache: evicted %d entries", excess)
+
+    def stats(self) -> dict:
+        """Entry count plus hit/miss counts since this instance was created."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
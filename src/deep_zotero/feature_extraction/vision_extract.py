@@ -11,6 +11,7 @@ from pathlib import Path
 import pymupdf
 
 from .captions import DetectedCaption
+from .image_optimizer import ImageOptions, content_rect, encode_pixmap
 
 logger = logging.getLogger(__name__)
 
@@ -696,10 +697,11 @@ def render_table_region(
     dpi_floor: int = 150,
     dpi_cap: int = 300,
     strip_dpi_threshold: int = 200,
+    image_options: ImageOptions | None = None,
 ) -> list[tuple[bytes, str]]:
-    """Render a table region as one or more PNGs.
+    """Render a table region as one or more images (PNG by default).
 
-    Returns list of (png_bytes, media_type). Usually 1 image; multiple
+    Returns list of (image_bytes, media_type). Usually 1 image; multiple
     when crop height > width and effective DPI < strip_dpi_threshold.
 
     The Anthropic API resizes images so the long edge is 1568px.
@@ -714,7 +716,15 @@ def render_table_region(
         strip_dpi_threshold: Multi-strip trigger. If height > width
             and effective_dpi < this value, split into strips.
             Default 200 for initial crops. Pass 250 for re-crops.
+        image_options: Encoding policy (see image_optimizer); None keeps
+            pymupdf's PNG output.  Whitespace trimming only applies when
+            ``bbox`` covers the whole page; the page is cut to its content
+            before DPI and strips are chosen, so strips share one frame.
     """
+    if image_options is not None and image_options.trim_whitespace and (
+        pymupdf.Rect(bbox).contains(page.rect)
+    ):
+        bbox = tuple(content_rect(page, pymupdf.Rect(bbox)))
     x0, y0, x1, y1 = bbox
     width_in = (x1 - x0) / 72
     height_in = (y1 - y0) / 72
@@ -730,14 +740,14 @@ def render_table_region(
             clip = pymupdf.Rect(sx0, sy0, sx1, sy1)
             mat = pymupdf.Matrix(optimal_dpi / 72, optimal_dpi / 72)
             pix = page.get_pixmap(matrix=mat, clip=clip)
-            results.append((pix.tobytes("png"), "image/png"))
+            results.append(encode_pixmap(pix, image_options))
         return results
     else:
         optimal_dpi = max(dpi_floor, min(dpi_cap, int(1568 / long_edge_in)))
         clip = pymupdf.Rect(x0, y0, x1, y1)
         mat = pymupdf.Matrix(optimal_dpi / 72, optimal_dpi / 72)
         pix = page.get_pixmap(matrix=mat, clip=clip)
-        return [(pix.tobytes("png"), "image/png")]
+        return [encode_pixmap(pix, image_options)]
 
 
 def compute_recrop_bbox(
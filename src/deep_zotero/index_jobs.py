@@ -0,0 +1,157 @@
+"""Background indexing jobs for the MCP server.
+
+``index_library`` starts an ``Indexer.index_all`` run in a worker thread
+and returns immediately with a job ID, so long runs (vision batches can
+take over an hour) neither hit client timeouts nor block search tools
+served by the same process.  The run reports its stage and per-paper
+progress through an ``IndexProgress``, which also carries cancellation
+requests back into the indexer.  Cancellation takes effect at the next
+paper boundary; finished papers stay indexed and spooled extractions are
+reused by the next run (see ``checkpoint.py``).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class IndexCancelled(Exception):
+    """Raised inside Indexer.index_all when its job has been cancelled."""
+
+
+class IndexProgress:
+    """Thread-safe stage/progress record for one indexing run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.stage = "starting"
+        self.done = 0
+        self.total = 0
+        self._stage_started = time.monotonic()
+
+    def update(self, stage: str, done: int, total: int) -> None:
+        """Record progress, raising IndexCancelled if cancellation was requested."""
+        with self._lock:
+            if stage != self.stage:
+                self.stage = stage
+                self._stage_started = time.monotonic()
+            self.done = done
+            self.total = total
+        if self._cancel.is_set():
+            raise IndexCancelled(f"cancelled during {stage}")
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def snapshot(self) -> dict:
+        """Stage, papers done/total, throughput (papers/min) and ETA (seconds)."""
+        with self._lock:
+            elapsed = time.monotonic() - self._stage_started
+            done, total = self.done, self.total
+            rate = done / elapsed if done and elapsed > 0 else 0.0
+            return {
+                "stage": self.stage,
+                "done": done,
+                "total": total,
+                "papers_per_minute": round(rate * 60, 2),
+                "eta_seconds": round((total - done) / rate) if rate else None,
+            }
+
+
+class IndexJob:
+    """One background indexing run."""
+
+    def __init__(self, params: dict):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.status = "running"  # running | completed | failed | cancelled
+        self.progress = IndexProgress()
+        self.result: dict | None = None
+        self.error: str | None = None
+        self.started_at = time.time()
+        self.finished_at: float | None = None
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "cancel_requested": self.progress.cancel_requested,
+            "params": self.params,
+            "elapsed_seconds": round(end - self.started_at, 1),
+            "progress": self.progress.snapshot(),
+            "error": self.error,
+            "result": self.result,
+        }
+
+
+class IndexJobManager:
+    """Runs at most one indexing job at a time and remembers recent ones.
+
+    Args:
+        history: Number of finished jobs kept for status queries.
+    """
+
+    def __init__(self, history: int = 20):
+        self._lock = threading.Lock()
+        self._jobs: dict[str, IndexJob] = {}
+        self._history = history
+
+    def start(self, run: Callable[[IndexProgress], dict], params: dict) -> IndexJob:
+        """Start ``run(progress)`` in a daemon thread.
+
+        Raises:
+            RuntimeError: If another job is still running.
+        """
+        with self._lock:
+            active = self.active()
+            if active is not None:
+                raise RuntimeError(f"Indexing job {active.job_id} is already running")
+            job = IndexJob(params)
+            self._jobs[job.job_id] = job
+            finished = [j for j in self._jobs.values() if j.status != "running"]
+            for old in finished[:max(0, len(finished) - self._history)]:
+                del self._jobs[old.job_id]
+
+        def target() -> None:
+            try:
+                job.result = run(job.progress)
+                job.status = "completed"
+            except IndexCancelled:
+                job.status = "cancelled"
+                logger.info(f"Indexing job {job.job_id} cancelled")
+            except Exception as e:
+                job.status = "failed"
+                job.error = f"{type(e).__name__}: {e}"
+                logger.exception(f"Indexing job {job.job_id} failed")
+            finally:
+                job.finished_at = time.time()
+
+        threading.Thread(target=target, name=f"deep-zotero-index-{job.job_id}", daemon=True).start()
+        return job
+
+    def get(self, job_id: str | None = None) -> IndexJob | None:
+        """Job by ID, or the most recently started job if job_id is None."""
+        with self._lock:
+            if job_id is None:
+                return next(reversed(self._jobs.values()), None)
+            return self._jobs.get(job_id)
+
+    def active(self) -> IndexJob | None:
+        return next((j for j in self._jobs.values() if j.status == "running"), None)
+
+    def cancel(self, job_id: str) -> IndexJob | None:
+        job = self.get(job_id)
+        if job is not None and job.status == "running":
+            job.progress.cancel()
+        return job
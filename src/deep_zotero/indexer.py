@@ -2,21 +2,36 @@
 import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Iterator
 from tqdm import tqdm
 from .config import Config
 from .zotero_client import ZoteroClient
-from .pdf_processor import extract_document
+from .pdf_processor import extract_document, EXTRACTOR_VERSION
+from .extraction_cache import ExtractionCache, file_hash
+from .checkpoint import IndexCheckpoint
+from .embedding_cache import EmbeddingCache
 from .chunker import Chunker
 from .embedder import create_embedder
 from .vector_store import VectorStore
 from .journal_ranker import JournalRanker
+from .index_jobs import IndexProgress
 from .models import ZoteroItem
 
 logger = logging.getLogger(__name__)
 
+# Runs a changed item may fail (PDF still missing, or indexing failed)
+# before the change feed stops retrying it.
+CHANGE_RETRY_MAX_ATTEMPTS = 5
+
 
 def _config_hash(config: Config) -> str:
     """Hash of config values that affect indexed content.
@@ -34,6 +49,72 @@ def _config_hash(config: Config) -> str:
     return hashlib.sha256(data.encode()).hexdigest()[:16]
 
 
+def _extract_in_worker(
+    pdf_path: Path,
+    images_dir: Path,
+    ocr_language: str,
+    collect_vision_specs: bool,
+    page_workers: int = 1,
+    page_parallel_min_pages: int = 100,
+):
+    """Run extract_document in a worker process.
+
+    Exceptions are converted to a message string so that unpicklable
+    exception types cannot take down the pool.
+
+    Returns:
+        (extraction, error) — exactly one of the two is None.
+    """
+    try:
+        extraction = extract_document(
+            pdf_path,
+            write_images=True,
+            images_dir=images_dir,
+            ocr_language=ocr_language,
+            collect_vision_specs=collect_vision_specs,
+            page_workers=page_workers,
+            page_parallel_min_pages=page_parallel_min_pages,
+        )
+        return extraction, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+@dataclass
+class _IndexTally:
+    """Per-run accumulators shared by the batched and streaming pipelines."""
+    results: list
+    empty_docs: dict[str, str]
+    quality_distribution: dict[str, int] = field(
+        default_factory=lambda: {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0})
+    extraction_stats: dict[str, int] = field(
+        default_factory=lambda: {"total_pages": 0, "text_pages": 0, "ocr_pages": 0, "empty_pages": 0})
+
+
+class _ExtractionSpool:
+    """On-disk parking area for extractions awaiting vision resolution."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, item_key: str) -> Path:
+        return self.directory / f"{item_key}.pkl"
+
+    def put(self, item_key: str, extraction) -> None:
+        tmp = self._path(item_key).with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(extraction, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(item_key))
+
+    def get(self, item_key: str):
+        with open(self._path(item_key), "rb") as f:
+            return pickle.load(f)
+
+    def remove(self, item_key: str) -> None:
+        self._path(item_key).unlink(missing_ok=True)
+
+
 @dataclass
 class IndexResult:
     """Outcome of indexing a single document."""
@@ -67,16 +148,45 @@ class Indexer:
         self.journal_ranker = JournalRanker()
         self._empty_docs_path = config.chroma_db_path / "empty_docs.json"
         self._config_hash_path = config.chroma_db_path / "config_hash.txt"
+        self._change_feed_path = config.chroma_db_path / "zotero_changes.json"
+        self._checkpoint = IndexCheckpoint(config.chroma_db_path / "index_checkpoint.sqlite")
+        self._progress: IndexProgress | None = None
+        self._spool = _ExtractionSpool(config.chroma_db_path / "vision_spool")
         if config.vision_enabled and config.anthropic_api_key:
+            from .feature_extraction.image_optimizer import ImageOptions
             from .feature_extraction.vision_api import VisionAPI
-            cost_log_path = config.chroma_db_path.parent / "vision_costs.json"
+            cost_log_path = config.chroma_db_path.parent / "vision_costs.jsonl"
+            result_cache = None
+            if config.vision_cache_enabled:
+                from .feature_extraction.vision_cache import VisionResultCache
+                result_cache = VisionResultCache(
+                    config.chroma_db_path.parent / "vision_cache.sqlite",
+                    max_entries=config.vision_cache_max_entries,
+                )
             self._vision_api = VisionAPI(
                 api_key=config.anthropic_api_key,
                 model=config.vision_model,
                 cost_log_path=cost_log_path,
+                batch_journal=self._checkpoint,
+                result_cache=result_cache,
+                render_workers=config.vision_render_workers,
+                image_options=ImageOptions(
+                    grayscale=config.vision_image_grayscale,
+                    colors=config.vision_image_colors,
+                    trim_whitespace=config.vision_image_trim,
+                    format=config.vision_image_format,
+                    quality=config.vision_image_quality,
+                ),
             )
         else:
             self._vision_api = None
+        if config.extraction_cache_enabled:
+            self._extraction_cache = ExtractionCache(
+                config.chroma_db_path.parent / "extraction_cache",
+                max_bytes=config.extraction_cache_max_mb * 1024 * 1024,
+            )
+        else:
+            self._extraction_cache = None
 
     # ------------------------------------------------------------------
     # Empty-doc tracking (keyed by item_key -> pdf file hash)
@@ -91,6 +201,38 @@ class Indexer:
     def _save_empty_docs(self, mapping: dict[str, str]) -> None:
         self._empty_docs_path.write_text(json.dumps(mapping, indent=2))
 
+    # ------------------------------------------------------------------
+    # Zotero change feed state ({"marker": ..., "retry": {item_key: attempts}})
+    # ------------------------------------------------------------------
+
+    def _load_change_state(self) -> dict | None:
+        if self._change_feed_path.exists():
+            state = json.loads(self._change_feed_path.read_text())
+            if isinstance(state.get("retry"), list):  # older files kept bare keys
+                state["retry"] = {key: 0 for key in state["retry"]}
+            return state
+        return None
+
+    def _save_change_state(
+        self, marker: str, previous: dict[str, int], failed: list[str], deferred: list[str],
+    ) -> None:
+        """Record the new marker and the item keys to check again next run.
+
+        ``failed`` keys cost an attempt and are dropped with a warning after
+        CHANGE_RETRY_MAX_ATTEMPTS; ``deferred`` keys (cut by ``limit``) keep
+        their count. Keys not listed in either succeeded or are no longer
+        returned by Zotero (e.g. the PDF attachment was removed) and drop out.
+        """
+        retry = {key: previous.get(key, 0) for key in deferred}
+        for key in dict.fromkeys(failed):
+            attempts = previous.get(key, 0) + 1
+            if attempts >= CHANGE_RETRY_MAX_ATTEMPTS:
+                logger.warning(f"Giving up on {key} after {attempts} failed change-feed runs")
+            else:
+                retry[key] = attempts
+        state = {"marker": marker, "retry": dict(sorted(retry.items()))}
+        self._change_feed_path.write_text(json.dumps(state, indent=2))
+
     @staticmethod
     def _pdf_hash(path: Path) -> str:
         """Fast hash of first 64 KiB of a PDF (enough to detect replacement)."""
@@ -133,6 +275,9 @@ class Indexer:
         limit: int | None = None,
         item_key: str | None = None,
         title_pattern: str | None = None,
+        streaming: bool = False,
+        changed_only: bool = False,
+        progress: IndexProgress | None = None,
     ) -> dict:
         """
         Index all PDFs in Zotero library.
@@ -142,11 +287,43 @@ class Indexer:
             limit: Maximum number of items to index
             item_key: If provided, only index this specific Zotero item key
             title_pattern: If provided, only index items matching this regex pattern
+            streaming: Store each document as soon as it is extracted, with
+                bounded memory (see _index_streaming), instead of extracting
+                the whole library first
+            changed_only: Only look at items Zotero reports as changed since
+                the previous changed_only run (see ZoteroClient.get_changed_items).
+                Indexed items whose PDF is unchanged get a metadata sync, and
+                trashed or erased items are removed. The first such run scans
+                the whole library and records the change marker.
+            progress: Receives stage and per-paper progress; cancelling it
+                stops the run at the next paper with IndexCancelled.
 
         Returns:
             Dict with 'results' (list[IndexResult]) and summary counts.
         """
-        items = self.zotero.get_all_items_with_pdfs()
+        self._progress = progress
+        self._report("discovering", 0, 0)
+        change_state = (
+            self._load_change_state() if changed_only and not force_reindex and not item_key else None
+        )
+        removed_keys: list[str] = []
+        previous_retry: dict[str, int] = change_state.get("retry", {}) if change_state else {}
+        if change_state:
+            changes = self.zotero.get_changed_items(change_state["marker"], also_keys=list(previous_retry))
+            items = changes.items
+            removed_keys = changes.removed_keys
+            change_marker = changes.marker
+            logger.info(
+                f"Zotero change feed: {len(items)} changed, {len(removed_keys)} removed "
+                f"since {change_state['marker']}"
+            )
+        else:
+            change_marker = self.zotero.get_change_marker() if changed_only else None
+            items = self.zotero.get_all_items_with_pdfs()
+        # Changed items whose PDF is not on disk yet (still downloading via
+        # Zotero file sync) are retried next run instead of being lost
+        # behind the advanced change marker.
+        retry_keys = [i.item_key for i in items if not (i.pdf_path and i.pdf_path.exists())] if change_state else []
         items = [i for i in items if i.pdf_path and i.pdf_path.exists()]
         logger.info(f"Discovered {len(items)} papers with PDFs in Zotero library")
 
@@ -163,7 +340,9 @@ class Indexer:
             items = [i for i in items if pattern.search(i.title)]
             logger.info(f"Title filter: {len(items)} papers match '{title_pattern}'")
 
+        deferred_keys: list[str] = []
         if limit:
+            deferred_keys = [i.item_key for i in items[limit:]]
             items = items[:limit]
             logger.info(f"Limit applied: processing at most {limit} papers")
 
@@ -178,6 +357,15 @@ class Indexer:
             indexed_ids = self.store.get_indexed_doc_ids()
             empty_docs = self._load_empty_docs()
 
+        n_removed = 0
+        for key in removed_keys:
+            if key in indexed_ids:
+                self.store.delete_document(key)
+                indexed_ids.discard(key)
+                n_removed += 1
+                logger.info(f"Removed {key}: deleted in Zotero")
+            empty_docs.pop(key, None)
+
         # Check for config mismatch
         current_hash = _config_hash(self.config)
         stored_hash = None
@@ -193,6 +381,16 @@ class Indexer:
         results: list[IndexResult] = []
         to_index: list[ZoteroItem] = []
         reindex_reasons: dict[str, str] = {}
+        metadata_updated = 0
+
+        # A previous run died while writing these; their chunks are partial
+        interrupted = set(self._checkpoint.items_in_stage("storing"))
+        for item in items:
+            if item.item_key in interrupted and item.item_key in indexed_ids:
+                self.store.delete_document(item.item_key)
+                indexed_ids.discard(item.item_key)
+                reindex_reasons[item.item_key] = "interrupted"
+                logger.info(f"Reindexing {item.item_key}: interrupted while storing")
 
         for item in items:
             if item.item_key in indexed_ids:
@@ -203,6 +401,9 @@ class Indexer:
                     reindex_reasons[item.item_key] = reason
                     logger.info(f"Reindexing {item.item_key}: {reason}")
                 else:
+                    if change_state and self.store.update_document_meta(
+                            item.item_key, self._bibliographic_meta(item)):
+                        metadata_updated += 1
                     continue
 
             if item.item_key in empty_docs:
@@ -229,59 +430,94 @@ class Indexer:
         if not to_index:
             logger.info("Nothing to index — all papers are up to date")
 
-        quality_distribution: dict[str, int] = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
-        aggregated_extraction_stats = {
-            "total_pages": 0,
-            "text_pages": 0,
-            "ocr_pages": 0,
-            "empty_pages": 0,
+        if self._vision_api is not None and to_index:
+            # Batches paid for by an interrupted run land in the vision cache
+            self._vision_api.resume_pending_batches()
+
+        tally = _IndexTally(results=results, empty_docs=empty_docs)
+        figures_dir = self.config.chroma_db_path.parent / "figures"
+        if streaming:
+            self._index_streaming(to_index, figures_dir, tally)
+        else:
+            self._index_batched(to_index, figures_dir, tally)
+
+        self._save_empty_docs(empty_docs)
+        self._checkpoint.forget(self._checkpoint.items_in_stage("indexed"))
+
+        counts = {
+            "indexed": sum(1 for r in results if r.status == "indexed"),
+            "failed": sum(1 for r in results if r.status == "failed"),
+            "empty": sum(1 for r in results if r.status == "empty"),
+            "skipped": sum(1 for r in results if r.status == "skipped"),
+            "already_indexed": len(indexed_ids),
+            "quality_distribution": tally.quality_distribution,
+            "extraction_stats": tally.extraction_stats,
         }
+        embedding_stats = getattr(self.embedder, "stats", None)
+        if isinstance(embedding_stats, dict):
+            counts["embedding_stats"] = embedding_stats
+        embedding_cache = getattr(self.embedder, "cache", None)
+        if isinstance(embedding_cache, EmbeddingCache):
+            counts["embedding_cache"] = embedding_cache.stats()
+        if self._vision_api is not None:
+            counts["vision_cost"] = {
+                "session_cost_usd": round(self._vision_api.session_cost, 4),
+                "cache": self._vision_api.cache_stats,
+            }
+        if changed_only:
+            counts["removed"] = n_removed
+            counts["metadata_updated"] = metadata_updated
+            # Filtered runs did not look at every changed item; keep the old marker
+            if change_marker is not None and not item_key and not title_pattern:
+                retry_keys += [r.item_key for r in results if r.status == "failed"]
+                self._save_change_state(change_marker, previous_retry, retry_keys, deferred_keys)
+
+        # Save config hash after successful indexing
+        if counts["indexed"] > 0 or counts["already_indexed"] > 0:
+            self._config_hash_path.write_text(current_hash)
 
+        return {"results": results, **counts}
+
+    def _index_batched(
+        self, to_index: list[ZoteroItem], figures_dir: Path, tally: "_IndexTally",
+    ) -> None:
+        """Extract everything, resolve vision in one batch, then store.
+
+        Minimises Batch API round-trips at the cost of holding every
+        extraction in memory until Phase 3.
+        """
         # ---- Phase 1: Extract all documents (vision specs collected but deferred) ----
-        figures_dir = self.config.chroma_db_path.parent / "figures"
         doc_extractions: dict[str, tuple[ZoteroItem, object]] = {}  # item_key -> (item, extraction)
 
         total_to_extract = len(to_index)
-        extraction_times: list[float] = []
         phase1_start = time.perf_counter()
         log_interval = 5  # log every N papers
 
-        for i, item in enumerate(tqdm(to_index, desc="Extracting"), 1):
-            t0 = time.perf_counter()
-            try:
-                logger.debug(
-                    f"Starting extraction {item.item_key}: "
-                    f"title={item.title!r}, pdf={item.pdf_path}"
-                )
-                extraction = extract_document(
-                    item.pdf_path,
-                    write_images=True,
-                    images_dir=figures_dir,
-                    ocr_language=self.config.ocr_language,
-                    vision_api=self._vision_api,
-                )
+        for i, (item, extraction, error) in enumerate(
+            tqdm(self._iter_extractions(to_index, figures_dir), total=total_to_extract, desc="Extracting"),
+            1,
+        ):
+            if extraction is not None:
+                # The extraction cache already covers resolved documents
+                needs_spool = extraction.pending_vision is not None or self._extraction_cache is None
+                if needs_spool and self._checkpoint.get_stage(
+                    item.item_key, self._checkpoint_fingerprint(item),
+                ) is None:
+                    self._checkpoint_save(item, extraction, "extracted")
                 doc_extractions[item.item_key] = (item, extraction)
-            except Exception as e:
-                logger.error(f"Failed to extract {item.item_key}: {type(e).__name__}: {e}")
-                results.append(IndexResult(
-                    item.item_key, item.title, "failed",
-                    reason=f"{type(e).__name__}: {e}"))
-
-            elapsed = time.perf_counter() - t0
-            extraction_times.append(elapsed)
+            else:
+                logger.error(f"Failed to extract {item.item_key}: {error}")
+                tally.results.append(IndexResult(item.item_key, item.title, "failed", reason=error))
 
             if i % log_interval == 0 or i == total_to_extract:
-                avg_time = sum(extraction_times) / len(extraction_times)
-                remaining = total_to_extract - i
-                eta_secs = avg_time * remaining
-                if eta_secs >= 60:
-                    eta_str = f"{eta_secs / 60:.1f}m"
-                else:
-                    eta_str = f"{eta_secs:.0f}s"
-                logger.info(
-                    f"Extraction: {i}/{total_to_extract} papers "
-                    f"({avg_time:.1f}s avg, ETA {eta_str})"
-                )
+                self._log_progress("Extraction", i, total_to_extract, phase1_start)
+            self._report("extracting", i, total_to_extract)
+
+        # Completion order differs from library order with parallel workers
+        doc_extractions = {
+            item.item_key: doc_extractions[item.item_key]
+            for item in to_index if item.item_key in doc_extractions
+        }
 
         phase1_elapsed = time.perf_counter() - phase1_start
         if total_to_extract > 0:
@@ -290,82 +526,30 @@ class Indexer:
                 f"{phase1_elapsed:.1f}s ({phase1_elapsed / total_to_extract:.1f}s avg)"
             )
 
-        # ---- Phase 2: Resolve vision batch (one API call for all papers) ----
-        if self._vision_api and doc_extractions:
-            from .pdf_processor import resolve_pending_vision, PendingVisionWork
-            pending_count = sum(
-                len(v[1].pending_vision.specs)
-                for v in doc_extractions.values()
-                if v[1].pending_vision is not None and v[1].pending_vision.specs
-            )
-            pending_docs = sum(
-                1 for v in doc_extractions.values()
-                if v[1].pending_vision is not None and v[1].pending_vision.specs
-            )
-            if pending_count > 0:
-                logger.info(
-                    f"Vision: {pending_count} tables across {pending_docs} papers "
-                    f"queued for Batch API (up to 3 waves, est. 10-30min per wave)"
-                )
-            phase2_start = time.perf_counter()
-            resolve_pending_vision(
-                {k: v[1] for k, v in doc_extractions.items()},
-                self._vision_api,
-            )
-            phase2_elapsed = time.perf_counter() - phase2_start
-            if pending_count > 0:
-                logger.info(
-                    f"Vision complete: {pending_count} tables in "
-                    f"{phase2_elapsed / 60:.1f}min ({phase2_elapsed / max(pending_count, 1):.1f}s avg/table)"
-                )
-
-        # ---- Phase 3: Index each document (chunk, store, etc.) ----
+        # ---- Phase 2 + 3: Resolve vision, index each document (chunk, store, etc.) ----
+        # Papers are stored as soon as their vision tables settle; the rest
+        # once vision is done.
         total_to_index = len(doc_extractions)
-        index_times: list[float] = []
         phase3_start = time.perf_counter()
-        if total_to_index > 0:
-            logger.info(f"Indexing: chunking and storing {total_to_index} papers")
-
-        for idx, (item_key, (item, extraction)) in enumerate(doc_extractions.items(), 1):
-            t0 = time.perf_counter()
-            try:
-                n_chunks, n_tables, reason, extraction_stats, quality_grade = self._index_extraction(item, extraction)
-
-                # Aggregate extraction stats
-                for key in ["total_pages", "text_pages", "ocr_pages", "empty_pages"]:
-                    aggregated_extraction_stats[key] += extraction_stats.get(key, 0)
+        stored: set[str] = set()
 
-                # Track quality distribution
-                if quality_grade in quality_distribution:
-                    quality_distribution[quality_grade] += 1
+        def store(item: ZoteroItem, extraction) -> None:
+            self._store_extraction(item, extraction, tally)
+            stored.add(item.item_key)
+            idx = len(stored)
+            if idx % log_interval == 0 or idx == total_to_index:
+                self._log_progress("Indexing", idx, total_to_index, phase3_start)
+            self._report("storing", idx, total_to_index)
 
-                if n_chunks > 0:
-                    results.append(IndexResult(
-                        item.item_key, item.title, "indexed",
-                        n_chunks=n_chunks, n_tables=n_tables,
-                        quality_grade=quality_grade))
-                else:
-                    empty_docs[item.item_key] = self._pdf_hash(item.pdf_path)
-                    results.append(IndexResult(
-                        item.item_key, item.title, "empty", reason=reason,
-                        quality_grade=quality_grade))
-                logger.debug(f"Completed {item.item_key}: {n_chunks} chunks, {n_tables} tables, quality {quality_grade}")
-            except Exception as e:
-                logger.error(f"Failed to index {item.item_key}: {type(e).__name__}: {e}")
-                results.append(IndexResult(
-                    item.item_key, item.title, "failed",
-                    reason=f"{type(e).__name__}: {e}"))
+        if self._vision_api and doc_extractions:
+            self._report("vision", 0, len(doc_extractions))
+            self._resolve_vision(doc_extractions, on_resolved=store)
 
-            index_times.append(time.perf_counter() - t0)
-            if idx % log_interval == 0 or idx == total_to_index:
-                avg_t = sum(index_times) / len(index_times)
-                remaining = total_to_index - idx
-                eta_secs = avg_t * remaining
-                eta_str = f"{eta_secs / 60:.1f}m" if eta_secs >= 60 else f"{eta_secs:.0f}s"
-                logger.info(
-                    f"Indexing: {idx}/{total_to_index} papers "
-                    f"({avg_t:.1f}s avg, ETA {eta_str})"
-                )
+        if total_to_index > len(stored):
+            logger.info(f"Indexing: chunking and storing {total_to_index - len(stored)} papers")
+        for item, extraction in doc_extractions.values():
+            if item.item_key not in stored:
+                store(item, extraction)
 
         phase3_elapsed = time.perf_counter() - phase3_start
         if total_to_index > 0:
@@ -374,23 +558,350 @@ class Indexer:
                 f"{phase3_elapsed:.1f}s ({phase3_elapsed / total_to_index:.1f}s avg)"
             )
 
-        self._save_empty_docs(empty_docs)
+    def _index_streaming(
+        self, to_index: list[ZoteroItem], figures_dir: Path, tally: "_IndexTally",
+    ) -> None:
+        """Extract and store documents as a pipeline with bounded memory.
+
+        A writer thread chunks, embeds and stores documents while extraction
+        continues; the queue between them holds at most
+        ``config.stream_queue_depth`` documents.  Documents waiting on vision
+        are spooled to disk and resolved afterwards in groups of
+        ``config.stream_vision_batch_docs``, so peak memory depends on those
+        two settings rather than on library size.
+        """
+        depth = max(1, self.config.stream_queue_depth)
+        pending: queue.Queue = queue.Queue(maxsize=depth)
+        spooled: list[ZoteroItem] = []
+
+        def writer() -> None:
+            while True:
+                entry = pending.get()
+                if entry is None:
+                    return
+                item, extraction = entry
+                try:
+                    if self._store_extraction(item, extraction, tally) == "empty":
+                        self._save_empty_docs(tally.empty_docs)
+                except Exception as e:  # never let the writer die with a full queue
+                    logger.error(f"Writer failed on {item.item_key}: {type(e).__name__}: {e}")
+
+        writer_thread = threading.Thread(target=writer, name="deep-zotero-writer", daemon=True)
+        writer_thread.start()
+
+        total = len(to_index)
+        start = time.perf_counter()
+        log_interval = 5
+        try:
+            for i, (item, extraction, error) in enumerate(
+                tqdm(self._iter_extractions(to_index, figures_dir), total=total, desc="Indexing"),
+                1,
+            ):
+                if extraction is None:
+                    logger.error(f"Failed to extract {item.item_key}: {error}")
+                    tally.results.append(IndexResult(item.item_key, item.title, "failed", reason=error))
+                elif extraction.pending_vision is not None and extraction.pending_vision.specs:
+                    self._checkpoint_save(item, extraction, "extracted")
+                    spooled.append(item)
+                else:
+                    pending.put((item, extraction))  # blocks while the writer is behind
+                del extraction
+
+                if i % log_interval == 0 or i == total:
+                    self._log_progress("Extraction", i, total, start)
+                self._report("indexing", i, total)
+        finally:
+            pending.put(None)
+            writer_thread.join()
+
+        if not spooled:
+            return
+
+        group_size = max(1, self.config.stream_vision_batch_docs)
+        logger.info(f"Vision: resolving {len(spooled)} spooled papers in groups of {group_size}")
+        for g in range(0, len(spooled), group_size):
+            self._report("vision", g, len(spooled))
+            group: dict[str, tuple[ZoteroItem, object]] = {}
+            for item in spooled[g:g + group_size]:
+                try:
+                    group[item.item_key] = (item, self._spool.get(item.item_key))
+                except Exception as e:
+                    logger.error(f"Failed to load spooled {item.item_key}: {type(e).__name__}: {e}")
+                    tally.results.append(IndexResult(
+                        item.item_key, item.title, "failed", reason=f"{type(e).__name__}: {e}"))
+            stored: set[str] = set()
+
+            def store(item: ZoteroItem, extraction) -> None:
+                self._store_extraction(item, extraction, tally)
+                stored.add(item.item_key)
+
+            self._resolve_vision(group, on_resolved=store)
+            for item, extraction in group.values():
+                if item.item_key not in stored:
+                    store(item, extraction)
+
+    def _resolve_vision(
+        self,
+        doc_extractions: dict[str, tuple[ZoteroItem, object]],
+        on_resolved: Callable[[ZoteroItem, object], None] | None = None,
+    ) -> None:
+        """Run resolve_pending_vision with progress logging, caching each result.
 
-        counts = {
-            "indexed": sum(1 for r in results if r.status == "indexed"),
-            "failed": sum(1 for r in results if r.status == "failed"),
-            "empty": sum(1 for r in results if r.status == "empty"),
-            "skipped": sum(1 for r in results if r.status == "skipped"),
-            "already_indexed": len(indexed_ids),
-            "quality_distribution": quality_distribution,
-            "extraction_stats": aggregated_extraction_stats,
-        }
+        Args:
+            doc_extractions: item_key -> (item, extraction); extractions are
+                resolved in place.
+            on_resolved: Called with (item, extraction) as each paper's
+                vision work settles and its result is cached, while other
+                papers may still be waiting on vision.  Runs on the vision
+                notifier thread, so storing overlaps with vision requests.
+        """
+        from .pdf_processor import resolve_pending_vision
+        extractions = {k: v[1] for k, v in doc_extractions.items()}
+        pending = [
+            ext.pending_vision for ext in extractions.values()
+            if ext.pending_vision is not None and ext.pending_vision.specs
+        ]
+        was_pending = [k for k, ext in extractions.items() if ext.pending_vision is not None]
+        pending_count = sum(len(p.specs) for p in pending)
+        if pending_count > 0:
+            logger.info(
+                f"Vision: {pending_count} tables across {len(pending)} papers "
+                f"queued for Batch API (up to 3 waves, est. 10-30min per wave)"
+            )
+        resolved: set[str] = set()
+
+        def settle(key: str, _extraction=None) -> None:
+            item, extraction = doc_extractions[key]
+            self._cache_put(item, extraction)
+            self._checkpoint_save(item, extraction, "vision_resolved")
+            resolved.add(key)
+            if on_resolved is not None:
+                on_resolved(item, extraction)
+
+        phase2_start = time.perf_counter()
+        resolve_pending_vision(extractions, self._vision_api, on_document=settle)
+        phase2_elapsed = time.perf_counter() - phase2_start
+        if pending_count > 0:
+            logger.info(
+                f"Vision complete: {pending_count} tables in "
+                f"{phase2_elapsed / 60:.1f}min ({phase2_elapsed / max(pending_count, 1):.1f}s avg/table)"
+            )
+        for key in was_pending:
+            if key not in resolved:
+                settle(key)
 
-        # Save config hash after successful indexing
-        if counts["indexed"] > 0 or counts["already_indexed"] > 0:
-            self._config_hash_path.write_text(current_hash)
+    def _store_extraction(self, item: ZoteroItem, extraction, tally: "_IndexTally") -> str:
+        """Index one resolved extraction and record the outcome in ``tally``.
 
-        return {"results": results, **counts}
+        Returns:
+            The IndexResult status ("indexed", "empty" or "failed").
+        """
+        fingerprint = self._checkpoint_fingerprint(item)
+        self._checkpoint.mark(item.item_key, fingerprint, "storing")
+        try:
+            n_chunks, n_tables, reason, extraction_stats, quality_grade = self._index_extraction(item, extraction)
+        except Exception as e:
+            logger.error(f"Failed to index {item.item_key}: {type(e).__name__}: {e}")
+            tally.results.append(IndexResult(
+                item.item_key, item.title, "failed",
+                reason=f"{type(e).__name__}: {e}"))
+            return "failed"
+
+        self._checkpoint.mark(item.item_key, fingerprint, "indexed")
+        self._spool.remove(item.item_key)
+
+        # Aggregate extraction stats
+        for key in tally.extraction_stats:
+            tally.extraction_stats[key] += extraction_stats.get(key, 0)
+
+        # Track quality distribution
+        if quality_grade in tally.quality_distribution:
+            tally.quality_distribution[quality_grade] += 1
+
+        logger.debug(f"Completed {item.item_key}: {n_chunks} chunks, {n_tables} tables, quality {quality_grade}")
+        if n_chunks > 0:
+            tally.results.append(IndexResult(
+                item.item_key, item.title, "indexed",
+                n_chunks=n_chunks, n_tables=n_tables,
+                quality_grade=quality_grade))
+            return "indexed"
+        tally.empty_docs[item.item_key] = self._pdf_hash(item.pdf_path)
+        tally.results.append(IndexResult(
+            item.item_key, item.title, "empty", reason=reason,
+            quality_grade=quality_grade))
+        return "empty"
+
+    def _report(self, stage: str, done: int, total: int) -> None:
+        """Forward progress to the run's IndexProgress (raises IndexCancelled)."""
+        if self._progress is not None:
+            self._progress.update(stage, done, total)
+
+    @staticmethod
+    def _log_progress(stage: str, done: int, total: int, started: float) -> None:
+        # Wall-clock average, so the ETA stays honest with parallel workers
+        avg_time = (time.perf_counter() - started) / done
+        eta_secs = avg_time * (total - done)
+        eta_str = f"{eta_secs / 60:.1f}m" if eta_secs >= 60 else f"{eta_secs:.0f}s"
+        logger.info(f"{stage}: {done}/{total} papers ({avg_time:.1f}s avg, ETA {eta_str})")
+
+    # ------------------------------------------------------------------
+    # Checkpointing (resume after an interrupted run)
+    # ------------------------------------------------------------------
+
+    def _checkpoint_fingerprint(self, item: ZoteroItem) -> str:
+        """PDF hash plus every setting that shapes a spooled extraction."""
+        vision = self.config.vision_model if self._vision_api else ""
+        return f"{self._pdf_hash(item.pdf_path)}:{_config_hash(self.config)}:{vision}:{EXTRACTOR_VERSION}"
+
+    def _checkpoint_save(self, item: ZoteroItem, extraction, stage: str) -> None:
+        """Spool ``extraction`` and record ``stage`` for ``item``."""
+        try:
+            self._spool.put(item.item_key, extraction)
+        except Exception as e:
+            logger.warning(f"Could not spool extraction for {item.item_key}: {e}")
+            return
+        self._checkpoint.mark(item.item_key, self._checkpoint_fingerprint(item), stage)
+
+    def _checkpoint_load(self, item: ZoteroItem):
+        """Spooled extraction left by an interrupted run, or None."""
+        stage = self._checkpoint.get_stage(item.item_key, self._checkpoint_fingerprint(item))
+        if stage not in ("extracted", "vision_resolved", "storing"):
+            return None
+        try:
+            extraction = self._spool.get(item.item_key)
+        except Exception:
+            return None
+        logger.info(f"Resuming {item.item_key} from checkpoint (stage: {stage})")
+        return extraction
+
+    # ------------------------------------------------------------------
+    # Extraction cache
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, item: ZoteroItem) -> str:
+        return ExtractionCache.make_key(
+            file_hash(item.pdf_path),
+            extractor_version=EXTRACTOR_VERSION,
+            ocr_language=self.config.ocr_language,
+            vision=self.config.vision_model if self._vision_api else "",
+        )
+
+    def _cache_get(self, item: ZoteroItem):
+        if self._extraction_cache is None:
+            return None
+        try:
+            return self._extraction_cache.get(self._cache_key(item))
+        except OSError as e:
+            logger.warning(f"Extraction cache lookup failed for {item.item_key}: {e}")
+            return None
+
+    def _cache_put(self, item: ZoteroItem, extraction) -> None:
+        """Cache a resolved extraction; call before indexing mutates it."""
+        if self._extraction_cache is None or extraction.pending_vision is not None:
+            return
+        try:
+            self._extraction_cache.put(self._cache_key(item), extraction)
+        except Exception as e:
+            logger.warning(f"Could not cache extraction for {item.item_key}: {e}")
+
+    def _iter_extractions(
+        self, items: list[ZoteroItem], figures_dir: Path,
+    ) -> Iterator[tuple[ZoteroItem, object, str | None]]:
+        """Extract documents, serving unchanged PDFs from the extraction cache.
+
+        Yields (item, extraction, error).  Extractions spooled by an
+        interrupted run and cache hits come first, then fresh extractions as they finish (completion order with a worker pool).
+        Vision specs are collected but left pending.
+        """
+        misses: list[ZoteroItem] = []
+        for item in items:
+            resumed = self._checkpoint_load(item)
+            if resumed is not None:
+                yield item, resumed, None
+                continue
+            cached = self._cache_get(item)
+            if cached is not None:
+                logger.debug(f"Extraction cache hit for {item.item_key}")
+                yield item, cached, None
+            else:
+                misses.append(item)
+        if self._extraction_cache is not None:
+            logger.info(f"Extraction cache: {len(items) - len(misses)} hits, {len(misses)} to extract")
+
+        for item, extraction, error in self._extract_uncached(misses, figures_dir):
+            if extraction is not None:
+                self._cache_put(item, extraction)
+            yield item, extraction, error
+
+    def _extract_uncached(
+        self, items: list[ZoteroItem], figures_dir: Path,
+    ) -> Iterator[tuple[ZoteroItem, object, str | None]]:
+        """Extract documents, in-process or across a worker pool.
+
+        Yields (item, extraction, error) as each document finishes; with
+        ``config.extraction_workers > 1`` this is completion order, not
+        input order.
+        """
+        workers = min(self.config.extraction_workers, len(items))
+        if workers <= 1:
+            for item in items:
+                logger.debug(
+                    f"Starting extraction {item.item_key}: "
+                    f"title={item.title!r}, pdf={item.pdf_path}"
+                )
+                try:
+                    extraction = extract_document(
+                        item.pdf_path,
+                        write_images=True,
+                        images_dir=figures_dir,
+                        ocr_language=self.config.ocr_language,
+                        vision_api=self._vision_api,
+                        page_workers=self.config.extraction_page_workers,
+                        page_parallel_min_pages=self.config.extraction_page_parallel_min_pages,
+                    )
+                    yield item, extraction, None
+                except Exception as e:
+                    yield item, None, f"{type(e).__name__}: {e}"
+            return
+
+        logger.info(f"Extracting with {workers} worker processes")
+        # spawn, not fork: the parent holds ChromaDB and HTTP client threads
+        ctx = multiprocessing.get_context("spawn")
+        queue = iter(items)
+        max_in_flight = workers * 2
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            in_flight: dict = {}
+
+            def submit_next() -> bool:
+                item = next(queue, None)
+                if item is None:
+                    return False
+                logger.debug(f"Submitting extraction {item.item_key}: pdf={item.pdf_path}")
+                future = pool.submit(
+                    _extract_in_worker,
+                    item.pdf_path,
+                    figures_dir,
+                    self.config.ocr_language,
+                    self._vision_api is not None,
+                    self.config.extraction_page_workers,
+                    self.config.extraction_page_parallel_min_pages,
+                )
+                in_flight[future] = item
+                return True
+
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        extraction, error = future.result()
+                    except Exception as e:
+                        # Worker died (e.g. segfault in a native library)
+                        extraction, error = None, f"{type(e).__name__}: {e}"
+                    yield item, extraction, error
+                    submit_next()
 
     def _index_document_detailed(self, item: ZoteroItem) -> tuple[int, int, str, dict, str]:
         """
@@ -402,18 +913,23 @@ class Indexer:
             raise FileNotFoundError(f"PDF not found for {item.item_key}")
 
         figures_dir = self.config.chroma_db_path.parent / "figures"
-        extraction = extract_document(
-            item.pdf_path,
-            write_images=True,
-            images_dir=figures_dir,
-            ocr_language=self.config.ocr_language,
-            vision_api=self._vision_api,
-        )
+        extraction = self._cache_get(item)
+        if extraction is None:
+            extraction = extract_document(
+                item.pdf_path,
+                write_images=True,
+                images_dir=figures_dir,
+                ocr_language=self.config.ocr_language,
+                vision_api=self._vision_api,
+                page_workers=self.config.extraction_page_workers,
+                page_parallel_min_pages=self.config.extraction_page_parallel_min_pages,
+            )
 
-        # Resolve vision for this single document
-        if extraction.pending_vision is not None and self._vision_api:
-            from .pdf_processor import resolve_pending_vision
-            resolve_pending_vision({item.item_key: extraction}, self._vision_api)
+            # Resolve vision for this single document
+            if extraction.pending_vision is not None and self._vision_api:
+                from .pdf_processor import resolve_pending_vision
+                resolve_pending_vision({item.item_key: extraction}, self._vision_api)
+            self._cache_put(item, extraction)
 
         return self._index_extraction(item, extraction)
 
@@ -451,20 +967,9 @@ class Indexer:
             return 0, 0, f"{len(extraction.pages)} pages, {total_chars} chars but no chunks created", extraction.stats, quality_grade
         logger.debug(f"  Created {len(chunks)} chunks")
 
-        # Look up journal quartile
-        journal_quartile = self.journal_ranker.lookup(item.publication)
-
         # Store text chunks
         doc_meta = {
-            "title": item.title,
-            "authors": item.authors,
-            "year": item.year,
-            "citation_key": item.citation_key,
-            "publication": item.publication,
-            "journal_quartile": journal_quartile or "",
-            "doi": item.doi,
-            "tags": item.tags,
-            "collections": item.collections,
+            **self._bibliographic_meta(item),
             "pdf_hash": self._pdf_hash(item.pdf_path),
             "quality_grade": quality_grade,
         }
@@ -520,6 +1025,62 @@ class Indexer:
         logger.debug(f"Indexed {item.item_key}: {len(chunks)} chunks, {n_tables} tables, {n_figures} figures, quality {quality_grade}")
         return len(chunks), n_tables, "", extraction.stats, quality_grade
 
+    def _bibliographic_meta(self, item: ZoteroItem) -> dict:
+        """Document metadata that comes from Zotero (not from the PDF)."""
+        journal_quartile = self.journal_ranker.lookup(item.publication)
+        return {
+            "title": item.title,
+            "authors": item.authors,
+            "year": item.year,
+            "citation_key": item.citation_key,
+            "publication": item.publication,
+            "journal_quartile": journal_quartile or "",
+            "doi": item.doi,
+            "tags": item.tags,
+            "collections": item.collections,
+        }
+
+    def sync_metadata(self, item_key: str | None = None) -> dict:
+        """Push Zotero metadata edits (tags, collections, title, DOI, ...) into the index.
+
+        Compares each indexed item's current Zotero metadata with the stored
+        document metadata and updates changed documents in place. Nothing is
+        extracted or re-embedded, so a library-wide retag takes seconds.
+
+        Args:
+            item_key: Sync only this item
+
+        Returns:
+            Dict with counts (checked, updated, unchanged, not_indexed),
+            ``changes`` mapping item_key to the changed field names, and
+            elapsed ``seconds``
+        """
+        started = time.perf_counter()
+        items = self.zotero.get_all_items_with_pdfs()
+        if item_key:
+            items = [i for i in items if i.item_key == item_key]
+
+        counts = {"checked": 0, "updated": 0, "unchanged": 0, "not_indexed": 0}
+        changes: dict[str, list[str]] = {}
+        for item in items:
+            changed = self.store.update_document_meta(item.item_key, self._bibliographic_meta(item))
+            if changed is None:
+                counts["not_indexed"] += 1
+                continue
+            counts["checked"] += 1
+            if changed:
+                counts["updated"] += 1
+                changes[item.item_key] = changed
+                logger.info(f"Updated metadata for {item.item_key}: {', '.join(changed)}")
+            else:
+                counts["unchanged"] += 1
+
+        return {
+            **counts,
+            "changes": changes,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+
     def index_document(self, item: ZoteroItem) -> int:
         """Index a single document. Returns number of chunks created."""
         n_chunks, _n_tables, _reason, _stats, _quality = self._index_document_detailed(item)
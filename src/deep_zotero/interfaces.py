@@ -4,11 +4,13 @@ Allows parallel development against interfaces.
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Protocol
 
 from .models import (
     ZoteroItem,
+    ZoteroChangeSet,
     PageExtraction,
     DocumentExtraction,
     Chunk,
@@ -29,6 +31,14 @@ class ZoteroClientProtocol(Protocol):
         """Get a specific item by key."""
         ...
 
+    def get_change_marker(self) -> str:
+        """Current high-water mark of library changes."""
+        ...
+
+    def get_changed_items(self, since: str, also_keys: Iterable[str] = ()) -> ZoteroChangeSet:
+        """Items changed at or after `since`, plus removed item keys."""
+        ...
+
 
 class PDFProcessorProtocol(Protocol):
     """Interface for PDF extraction via pymupdf-layout + pymupdf4llm."""
@@ -70,7 +80,14 @@ class VectorStoreProtocol(Protocol):
         """Add chunks for a document."""
         ...
 
-    def search(self, query: str, top_k: int = 10, filters: dict | None = None) -> list[StoredChunk]:
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: dict | None = None,
+        required_terms: list[str] | None = None,
+        hybrid: bool = False,
+    ) -> list[StoredChunk]:
         """Search for similar chunks."""
         ...
 
@@ -78,6 +95,12 @@ class VectorStoreProtocol(Protocol):
         """Get chunks adjacent to a given chunk."""
         ...
 
+    def get_adjacent_chunks_bulk(
+        self, centers: list[tuple[str, int]], window: int = 2
+    ) -> dict[tuple[str, int], list[StoredChunk]]:
+        """Get adjacent chunks for many (doc_id, chunk_index) centers at once."""
+        ...
+
     def delete_document(self, doc_id: str) -> None:
         """Delete all chunks for a document."""
         ...
@@ -99,7 +122,9 @@ class RetrieverProtocol(Protocol):
         query: str,
         top_k: int = 10,
         context_window: int = 1,
-        filters: dict | None = None
+        filters: dict | None = None,
+        required_terms: list[str] | None = None,
+        hybrid: bool = False,
     ) -> list[RetrievalResult]:
         """Search and expand context."""
         ...
@@ -0,0 +1,186 @@
+"""Chunk-level full-text index (SQLite FTS5) for hybrid retrieval.
+
+Mirrors the text of every chunk stored in ChromaDB so that exact-term
+constraints (``required_terms``) can be answered completely from an
+inverted index, and so BM25 rankings can be fused with vector rankings.
+
+Tokenization is FTS5 ``unicode61`` with diacritics removed: matching is
+case-insensitive and whole-word, and punctuation splits words
+("heart-rate" is the phrase "heart rate").
+"""
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunk_rows (
+    rowid    INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    doc_id   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunk_rows_doc ON chunk_rows(doc_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunk_fts USING fts5(
+    text, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS index_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_QUERY_TOKENS = 32
+
+
+def _phrase(text: str) -> str | None:
+    """Quote ``text`` as an FTS5 phrase of its word tokens."""
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"'
+
+
+def build_match_expression(query: str | None, required_terms: list[str] | None = None) -> str | None:
+    """Build an FTS5 MATCH expression.
+
+    Query words are OR'ed (BM25 ranks documents matching more and rarer
+    words higher); each required term must match as a phrase.
+
+    Returns:
+        The expression, or None if neither argument contains a word.
+    """
+    parts = []
+    required = [p for p in (_phrase(t) for t in required_terms or []) if p]
+    if required:
+        parts.append(" AND ".join(required))
+    words = list(dict.fromkeys(t.lower() for t in _TOKEN_RE.findall(query or "")))
+    if words:
+        parts.append("(" + " OR ".join(f'"{w}"' for w in words[:_MAX_QUERY_TOKENS]) + ")")
+    if not parts:
+        return None
+    return " AND ".join(parts)
+
+
+class LexicalIndex:
+    """SQLite FTS5 index over chunk texts, keyed by Chroma chunk ID.
+
+    Args:
+        path: SQLite file (created if missing).
+
+    Raises:
+        sqlite3.OperationalError: If this SQLite build lacks FTS5.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, doc_id: str, chunk_ids: list[str], texts: list[str]) -> None:
+        """Index chunk texts, replacing any existing entries with the same IDs."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete_ids_locked(chunk_ids)
+                for chunk_id, text in zip(chunk_ids, texts):
+                    cur = self._conn.execute(
+                        "INSERT INTO chunk_rows (chunk_id, doc_id) VALUES (?, ?)", (chunk_id, doc_id)
+                    )
+                    self._conn.execute(
+                        "INSERT INTO chunk_fts (rowid, text) VALUES (?, ?)", (cur.lastrowid, text)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _delete_ids_locked(self, chunk_ids: list[str]) -> None:
+        for chunk_id in chunk_ids:
+            row = self._conn.execute(
+                "SELECT rowid FROM chunk_rows WHERE chunk_id = ?", (chunk_id,)
+            ).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM chunk_fts WHERE rowid = ?", row)
+                self._conn.execute("DELETE FROM chunk_rows WHERE rowid = ?", row)
+
+    def delete_document(self, doc_id: str) -> None:
+        """Remove every chunk of ``doc_id``."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "DELETE FROM chunk_fts WHERE rowid IN (SELECT rowid FROM chunk_rows WHERE doc_id = ?)",
+                (doc_id,),
+            )
+            self._conn.execute("DELETE FROM chunk_rows WHERE doc_id = ?", (doc_id,))
+            self._conn.execute("COMMIT")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM chunk_fts")
+            self._conn.execute("DELETE FROM chunk_rows")
+
+    def is_complete(self) -> bool:
+        """Whether the last full rebuild from Chroma finished."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM index_state WHERE key = 'complete'"
+            ).fetchone()
+        return row is not None and row[0] == "1"
+
+    def set_complete(self, complete: bool) -> None:
+        """Record whether the index mirrors Chroma (set after a full rebuild)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO index_state (key, value) VALUES ('complete', ?)",
+                ("1" if complete else "0",),
+            )
+
+    def count(self) -> int:
+        """Number of indexed chunks."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunk_rows").fetchone()[0]
+
+    def search(
+        self,
+        query: str | None,
+        limit: int = 50,
+        required_terms: list[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Rank chunks by BM25.
+
+        Args:
+            query: Free-text query; any of its words may match.
+            limit: Maximum results; None for all matches.
+            required_terms: Terms that must all appear (whole word or phrase).
+
+        Returns:
+            (chunk_id, bm25) pairs, best first.  FTS5 BM25 values are
+            negative; smaller is better.
+        """
+        expr = build_match_expression(query, required_terms)
+        if expr is None:
+            return []
+        sql = (
+            "SELECT r.chunk_id, bm25(chunk_fts) AS score FROM chunk_fts "
+            "JOIN chunk_rows r ON r.rowid = chunk_fts.rowid "
+            "WHERE chunk_fts MATCH ? ORDER BY score"
+        )
+        params: tuple = (expr,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            return [(r[0], r[1]) for r in self._conn.execute(sql, params)]
+
+    def matching_ids(self, required_terms: list[str]) -> list[str]:
+        """IDs of every chunk containing all ``required_terms``, best BM25 first."""
+        return [chunk_id for chunk_id, _ in self.search(None, limit=None, required_terms=required_terms)]
@@ -35,6 +35,14 @@ class ZoteroItem:
     collections: str = ""     # Semicolon-separated collection names
 
 
+@dataclass
+class ZoteroChangeSet:
+    """Items changed in Zotero since a previous change marker."""
+    items: list[ZoteroItem]   # Changed items that have PDF attachments
+    removed_keys: list[str]   # Items moved to the trash or erased
+    marker: str               # High-water mark to pass as `since` next time
+
+
 # =============================================================================
 # PDF EXTRACTION MODELS
 # =============================================================================
@@ -14,6 +14,7 @@ import re
 
 import pymupdf
 
+from .feature_extraction.captions import PageTextCache
 from .models import ExtractedFigure, ExtractedTable, SectionSpan, PageExtraction
 
 logger = logging.getLogger(__name__)
@@ -66,6 +67,7 @@ def run_recovery(
     page_chunks: list[dict],
     sections: list[SectionSpan] | None = None,
     pages: list[PageExtraction] | None = None,
+    page_cache: PageTextCache | None = None,
 ) -> tuple[list[ExtractedFigure], list[ExtractedTable]]:
     """Run post-extraction recovery to fill orphan captions.
 
@@ -76,20 +78,23 @@ def run_recovery(
         page_chunks: Output of pymupdf4llm.to_markdown(page_chunks=True).
         sections: Section spans (unused currently, reserved for future).
         pages: Page extractions (unused currently, reserved for future).
+        page_cache: PageTextCache shared with the other extraction stages.
+            A private one is created for ``doc`` if omitted.
 
     Returns:
         Updated (figures, tables) with recovered captions filled in.
     """
-    from .feature_extraction.captions import find_all_captions
+    if page_cache is None:
+        page_cache = PageTextCache(doc)
 
     max_y_dist = _adaptive_max_y_distance(doc)
 
     fig_recoveries = _recover_captions(
-        doc, figures, find_all_captions,
+        page_cache, figures,
         _FIG_REF_RE, kind="figure", max_y_distance=max_y_dist,
     )
     tab_recoveries = _recover_captions(
-        doc, tables, find_all_captions,
+        page_cache, tables,
         _TABLE_REF_RE, kind="table", max_y_distance=max_y_dist,
     )
 
@@ -103,9 +108,8 @@ def run_recovery(
 
 
 def _recover_captions(
-    doc: pymupdf.Document,
+    page_cache: PageTextCache,
     items: list[ExtractedFigure] | list[ExtractedTable],
-    caption_finder,
     ref_re: re.Pattern,
     kind: str,
     max_y_distance: float,
@@ -140,10 +144,10 @@ def _recover_captions(
     # Also collect distances from assigned captions to their items for calibration
     floating_captions: list[dict] = []  # {num, y_center, text, page_num}
     matched_distances: list[float] = []
-    for page_num_0, page in enumerate(doc):
+    for page_num_0 in range(len(page_cache)):
         page_num = page_num_0 + 1
-        detected = caption_finder(
-            page,
+        detected = page_cache.captions(
+            page_num_0,
             include_figures=include_figures,
             include_tables=include_tables,
         )
@@ -262,10 +266,10 @@ def _recover_captions(
                        for n in int_nums if n > gap_num]
 
         page_lo = max(lower_pages) if lower_pages else 1
-        page_hi = min(upper_pages) if upper_pages else len(doc)
+        page_hi = min(upper_pages) if upper_pages else len(page_cache)
 
         found_caption = _search_page_text_for_caption(
-            doc, ref_re, gap_num, page_lo, page_hi, kind,
+            page_cache, ref_re, gap_num, page_lo, page_hi, kind,
         )
         if not found_caption:
             continue
@@ -298,7 +302,7 @@ def _recover_captions(
 
 
 def _search_page_text_for_caption(
-    doc: pymupdf.Document,
+    page_cache: PageTextCache,
     ref_re: re.Pattern,
     target_num: int,
     page_lo: int,
@@ -310,10 +314,9 @@ def _search_page_text_for_caption(
     Returns (caption_text, page_num) or None.
     Rejects body-text references like "as shown in Figure N".
     """
-    for page_num_0 in range(page_lo - 1, min(page_hi, len(doc))):
-        page = doc[page_num_0]
+    for page_num_0 in range(page_lo - 1, min(page_hi, len(page_cache))):
         page_num = page_num_0 + 1
-        text_dict = page.get_text("dict")
+        text_dict = page_cache.text_dict(page_num_0)
 
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
@@ -6,11 +6,21 @@ ML-based layout detection (tables, figures, headers, footers, OCR).
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import queue
 import re
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import pymupdf.layout  # noqa: F401 — activates layout engine, MUST be before pymupdf4llm
 import pymupdf4llm
@@ -28,7 +38,8 @@ from .models import (
 from .section_classifier import categorize_heading
 from .feature_extraction.vision_extract import compute_all_crops, compute_recrop_bbox
 from .feature_extraction.postprocessors.cell_cleaning import clean_cells
-from .feature_extraction.captions import find_all_captions
+from .feature_extraction.captions import PageTextCache, find_all_captions
+from .feature_extraction.doc_pool import DocumentPool
 from .orphan_recovery import run_recovery
 
 if TYPE_CHECKING:
@@ -51,6 +62,10 @@ _CAP_PATTERNS = (_TABLE_CAPTION_RE, _TABLE_CAPTION_RE_RELAXED, _TABLE_LABEL_ONLY
 # Prefix for synthetic captions assigned to orphan tables/figures
 SYNTHETIC_CAPTION_PREFIX = "Uncaptioned "
 
+# Bump whenever a change alters DocumentExtraction output, so cached
+# extractions (see extraction_cache.py) from older code are not reused.
+EXTRACTOR_VERSION = 1
+
 
 # ---------------------------------------------------------------------------
 # Deferred vision work dataclasses
@@ -238,6 +253,74 @@ def _extract_figures_for_page(
     return figures
 
 
+# ---------------------------------------------------------------------------
+# Page-parallel layout analysis
+# ---------------------------------------------------------------------------
+
+# Smallest page range worth shipping to a separate process
+_MIN_PAGES_PER_WORKER = 20
+
+
+def _parse_page_range(pdf_path: str, pages: list[int]):
+    """Run pymupdf-layout analysis on ``pages`` (0-based) in a worker process.
+
+    Uses the same options ``pymupdf4llm.to_markdown`` passes on the layout
+    path, so merged ranges match a whole-document parse.
+    """
+    from pymupdf4llm.helpers.document_layout import parse_document
+    return parse_document(pdf_path, pages=pages, force_text=True, use_ocr=True)
+
+
+def _page_ranges(page_count: int, workers: int) -> list[list[int]]:
+    """Split 0..page_count-1 into at most ``workers`` contiguous ranges."""
+    n = max(1, min(workers, page_count // _MIN_PAGES_PER_WORKER))
+    size = -(-page_count // n)
+    return [list(range(start, min(start + size, page_count))) for start in range(0, page_count, size)]
+
+
+def _layout_page_chunks(pdf_path: Path, page_workers: int, min_pages: int) -> list[dict]:
+    """pymupdf4llm page chunks, analysing page ranges in parallel for long PDFs.
+
+    Layout analysis (and OCR) runs per page range in worker processes; the
+    parsed pages are merged in page order and rendered once.  Heading levels
+    depend on the font sizes of every heading in the document, so they are
+    recomputed over the merged pages before rendering.  The result equals a
+    single ``to_markdown`` call.
+    """
+    kwargs: dict = dict(
+        page_chunks=True,
+        write_images=False,
+        header=False,
+        footer=False,
+        show_progress=False,
+    )
+    if page_workers <= 1 or not getattr(pymupdf4llm, "_use_layout", False):
+        return pymupdf4llm.to_markdown(str(pdf_path), **kwargs)
+    with pymupdf.open(str(pdf_path)) as doc:
+        page_count = doc.page_count
+    ranges = _page_ranges(page_count, page_workers)
+    if page_count < min_pages or len(ranges) < 2:
+        return pymupdf4llm.to_markdown(str(pdf_path), **kwargs)
+
+    from pymupdf4llm.helpers.document_layout import update_header_tags
+
+    logger.debug(f"Layout analysis of {pdf_path.name}: {page_count} pages in {len(ranges)} processes")
+    # spawn, not fork: callers may hold ChromaDB and HTTP client threads
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=ctx) as pool:
+        parts = list(pool.map(_parse_page_range, [str(pdf_path)] * len(ranges), ranges))
+
+    parsed = parts[0]
+    parsed.pages = [page for part in parts for page in part.pages]
+    header_fontsizes = {
+        box.max_fontsize
+        for page in parsed.pages for box in page.boxes
+        if box.boxclass in ("title", "section-header")
+    }
+    if header_fontsizes:
+        update_header_tags(parsed.pages, header_fontsizes)
+    return parsed.to_markdown(header=False, footer=False, write_images=False, page_chunks=True)
+
 
 def extract_document(
     pdf_path: Path | str,
@@ -246,19 +329,25 @@ def extract_document(
     images_dir: Path | str | None = None,
     ocr_language: str = "eng",
     vision_api: "VisionAPI | None" = None,
+    collect_vision_specs: bool = False,
+    page_workers: int = 1,
+    page_parallel_min_pages: int = 100,
 ) -> DocumentExtraction:
-    """Extract a PDF document using pymupdf4llm with layout detection."""
-    pdf_path = Path(pdf_path)
+    """Extract a PDF document using pymupdf4llm with layout detection.
 
-    kwargs: dict = dict(
-        page_chunks=True,
-        write_images=False,
-        header=False,
-        footer=False,
-        show_progress=False,
-    )
+    Table vision specs are collected (and table construction deferred to
+    ``resolve_pending_vision``) when ``vision_api`` is given, or when
+    ``collect_vision_specs`` is True.  The latter lets worker processes,
+    which cannot receive a live API client, defer vision to the parent.
 
-    page_chunks: list[dict] = pymupdf4llm.to_markdown(str(pdf_path), **kwargs)
+    Documents of at least ``page_parallel_min_pages`` pages have their
+    layout analysis split across up to ``page_workers`` processes (see
+    ``_layout_page_chunks``); the output is identical either way.
+    """
+    pdf_path = Path(pdf_path)
+    collect_vision = vision_api is not None or collect_vision_specs
+
+    page_chunks: list[dict] = _layout_page_chunks(pdf_path, page_workers, page_parallel_min_pages)
 
     # Build pages and full markdown
     pages: list[PageExtraction] = []
@@ -294,12 +383,14 @@ def extract_document(
 
     # --- STRUCTURED EXTRACTION (use native PyMuPDF) ---
     doc = pymupdf.open(str(pdf_path))
+    # Shared by every stage below so each page is parsed once
+    page_cache = PageTextCache(doc, caption_finder=find_all_captions)
 
     # --- Abstract detection ---
     # If no section is labelled "abstract", check first pages for abstract text
     has_abstract = any(s.label == "abstract" for s in sections)
     if not has_abstract and pages:
-        abstract_span = _detect_abstract(pages, full_markdown, doc, sections)
+        abstract_span = _detect_abstract(pages, full_markdown, doc, sections, page_cache=page_cache)
         if abstract_span:
             sections = _insert_abstract(sections, abstract_span)
 
@@ -324,7 +415,7 @@ def extract_document(
             if page_label in ("references", "appendix"):
                 continue
 
-        all_captions_on_page = find_all_captions(page)
+        all_captions_on_page = page_cache.captions(pnum - 1)
 
         page_figs = _extract_figures_for_page(
             page, pnum, chunk, write_images, images_dir, doc,
@@ -335,7 +426,7 @@ def extract_document(
             figures.append(f)
             fig_idx += 1
 
-        if vision_api is not None:
+        if collect_vision:
             for cap, crop_bbox in compute_all_crops(page, all_captions_on_page, caption_type="table"):
                 _table_crops.append((pnum, page, cap, crop_bbox))
 
@@ -343,7 +434,7 @@ def extract_document(
     tables: list[ExtractedTable] = []
     pending: PendingVisionWork | None = None
 
-    if vision_api is not None and _table_crops:
+    if collect_vision and _table_crops:
         from .feature_extraction.vision_api import TableVisionSpec
 
         specs: list[TableVisionSpec] = []
@@ -371,12 +462,12 @@ def extract_document(
         f.caption = _normalize_ligatures(f.caption)
 
     # Orphan recovery: match floating captions to captionless figures
-    run_recovery(doc, figures, tables, page_chunks)
+    run_recovery(doc, figures, tables, page_chunks, page_cache=page_cache)
 
     figures = [f for f in figures if f.caption is not None]
 
     # Compute stats (needs open doc, but not tables)
-    stats = _compute_stats(pages, page_chunks, doc)
+    stats = _compute_stats(pages, page_chunks, doc, page_cache=page_cache)
 
     if pending is not None:
         # Vision requested: defer table construction, post-processing,
@@ -396,7 +487,9 @@ def extract_document(
         )
 
     # No vision: compute completeness with empty tables and finalize.
-    completeness = _compute_completeness(doc, pages, sections, tables, figures, stats)
+    completeness = _compute_completeness(
+        doc, pages, sections, tables, figures, stats, page_cache=page_cache,
+    )
     doc.close()
 
     for f in figures:
@@ -424,293 +517,363 @@ def extract_document(
 def resolve_pending_vision(
     extractions: dict[str, DocumentExtraction],
     vision_api: "VisionAPI",
+    doc_pool: DocumentPool | None = None,
+    on_document: Callable[[str, DocumentExtraction], None] | None = None,
 ) -> None:
-    """Batch all pending vision specs across documents into a single API call.
+    """Resolve all pending vision specs across documents.
 
     Mutates each DocumentExtraction in-place: populates tables, vision_details,
     completeness, and quality_grade.
 
     Call this after extracting all documents with ``extract_document(...,
-    vision_api=api)`` so that every table across every paper is submitted in
-    one Anthropic Batch API request (plus one re-crop batch if needed, plus
-    one full-page resend batch for incomplete/unparsable/empty responses).
+    vision_api=api)``.  Each table moves through its own sequence of
+    attempts: the initial crop, then a re-crop (if the model asked for a
+    tighter crop) or a full-page resend (for incomplete, unparsable or
+    empty responses), then a full-page resend if the re-crop also failed.
+
+    With a batch backend (VisionAPI) the tables' current attempts are
+    submitted together, so every table's initial crop goes in one Anthropic
+    Batch API request, followed by at most two follow-up batches.  With a
+    backend that sets ``supports_pipelining`` (LocalVisionAPI) tables are
+    sent individually and a table's follow-up is sent as soon as its own
+    response arrives.  In both modes a document is finalized as soon as
+    all of its tables have settled, and handed to ``on_document`` on a
+    separate thread so slow callbacks (chunking, embedding, storing) do
+    not hold up dispatching.
 
     Args:
         extractions: Mapping of doc_key -> DocumentExtraction with
             ``pending_vision`` set by ``extract_document()``.
-        vision_api: VisionAPI instance.
+        vision_api: VisionAPI or LocalVisionAPI instance.
+        doc_pool: Pool the PDFs are opened through, so re-crop/full-page
+            spec building and post-processing reuse handles. A private
+            pool, closed on return, is used if omitted.
+        on_document: Called with (doc_key, extraction) as each document
+            with pending vision work is finalized.  Calls are made one at a
+            time, in finalization order, from a notifier thread; all have
+            returned when this function returns.  An exception raised by
+            the callback stops resolution and is re-raised here.
     """
-    from .feature_extraction.vision_api import TableVisionSpec
+    if doc_pool is None:
+        with DocumentPool() as pool:
+            return resolve_pending_vision(
+                extractions, vision_api, doc_pool=pool, on_document=on_document,
+            )
 
-    # --- Collect all specs across all documents ---
-    all_specs: list[TableVisionSpec] = []
-    mapping: list[tuple[str, int]] = []  # (doc_key, local_index)
+    scheduler = _VisionScheduler(extractions, doc_pool, on_document)
+    try:
+        initial = scheduler.start()
+        if initial:
+            if getattr(vision_api, "supports_pipelining", False) is True:
+                scheduler.run_pipelined(vision_api, initial)
+            else:
+                scheduler.run_waves(vision_api, initial)
+    finally:
+        scheduler.close()
+    scheduler.raise_callback_error()
 
-    for doc_key, ext in extractions.items():
-        pending: PendingVisionWork | None = ext.pending_vision  # type: ignore[assignment]
-        if pending is None or not pending.specs:
-            continue
-        for i, spec in enumerate(pending.specs):
-            # Make table_id globally unique for the batch
-            spec.table_id = f"{doc_key}__{spec.table_id}"
-            all_specs.append(spec)
-            mapping.append((doc_key, i))
-
-    if not all_specs:
-        # No tables anywhere — still finalize each document
-        for _doc_key, ext in extractions.items():
-            if ext.pending_vision is not None:
-                _finalize_document_no_tables(ext)
-        return
-
-    import time as _time
-
-    n_docs = len({dk for dk, _ in mapping})
-    logger.info(
-        "Vision wave 1/3: submitting %d tables across %d documents "
-        "(est. 10-30min for batch processing)",
-        len(all_specs), n_docs,
-    )
 
-    # --- Single batch call for all tables ---
-    _w1_start = _time.perf_counter()
-    all_responses = vision_api.extract_tables_batch(all_specs)
-    _w1_elapsed = _time.perf_counter() - _w1_start
-    n_parse_ok = sum(1 for r in all_responses if r.parse_success)
-    logger.info(
-        "Vision wave 1/3 complete: %d/%d parsed OK in %.1fmin",
-        n_parse_ok, len(all_responses), _w1_elapsed / 60,
-    )
+# (doc_key, local_index, attempt) — attempt is "initial", "recrop" or "fullpage"
+_TableAttempt = tuple[str, int, str]
 
-    # Distribute responses back to per-document lists
-    per_doc_responses: dict[str, list] = defaultdict(list)
-    for (doc_key, _local_idx), resp in zip(mapping, all_responses):
-        per_doc_responses[doc_key].append(resp)
-
-    # --- Batch 2: recrop + full-page combined ---
-    # After batch 1, two disjoint sets need a second attempt:
-    #   Recrops:   model parsed OK but requests a tighter crop
-    #   Full-page: parse failure, incomplete w/o recrop coords, or parsed-but-empty
-    # These are disjoint (recrop requires parse_success=True) so they share one batch.
-    b2_specs: list[TableVisionSpec] = []
-    b2_mapping: list[tuple[str, int, str]] = []  # (doc_key, local_index, "recrop"|"fullpage")
-
-    for doc_key, ext in extractions.items():
-        pending = ext.pending_vision  # type: ignore[assignment]
-        if pending is None or not pending.specs:
-            continue
-        responses = per_doc_responses.get(doc_key, [])
-        if not responses:
-            continue
 
-        doc = pymupdf.open(str(pending.pdf_path))
-        try:
-            for local_idx, resp in enumerate(responses):
-                crop_info = pending.crop_infos[local_idx]
-                page = doc[crop_info.page_num - 1]
+class _VisionScheduler:
+    """Per-table state machine behind resolve_pending_vision.
 
-                # Recrop: parsed OK, model says crop needs adjustment
-                if resp.recrop_needed and resp.recrop_bbox_pct is not None:
-                    new_bbox = compute_recrop_bbox(
-                        crop_info.crop_bbox, resp.recrop_bbox_pct,
-                    )
-                    new_raw_text = page.get_text(
-                        "text", clip=pymupdf.Rect(new_bbox),
-                    )
-                    b2_specs.append(TableVisionSpec(
-                        table_id=f"{doc_key}__recrop_p{crop_info.page_num}_t{local_idx}",
-                        pdf_path=pending.pdf_path,
-                        page_num=crop_info.page_num,
-                        bbox=new_bbox,
-                        raw_text=new_raw_text,
-                        caption=crop_info.caption_text,
-                        garbled=False,
-                    ))
-                    b2_mapping.append((doc_key, local_idx, "recrop"))
-                    continue
+    ``advance`` records a table's response for its current attempt and
+    returns the follow-up attempt, if any; when a document's last table
+    settles, the document is finalized and queued for ``on_document``,
+    which a notifier thread calls so the drivers keep dispatching.
+    """
 
-                # Full-page triggers (disjoint from recrop):
-                needs_fullpage = False
-                if resp.is_incomplete and not resp.recrop_needed:
-                    needs_fullpage = True
-                elif resp.parse_success and not resp.headers and not resp.rows:
-                    needs_fullpage = True
-                elif not resp.parse_success:
-                    needs_fullpage = True
-
-                if needs_fullpage:
-                    full_rect = page.rect
-                    full_bbox = (full_rect.x0, full_rect.y0, full_rect.x1, full_rect.y1)
-                    raw_text = page.get_text("text")
-                    b2_specs.append(TableVisionSpec(
-                        table_id=f"{doc_key}__fullpage_p{crop_info.page_num}_t{local_idx}",
-                        pdf_path=pending.pdf_path,
-                        page_num=crop_info.page_num,
-                        bbox=full_bbox,
-                        raw_text=raw_text,
-                        caption=crop_info.caption_text,
-                        garbled=False,
-                    ))
-                    b2_mapping.append((doc_key, local_idx, "fullpage"))
-        finally:
-            doc.close()
-
-    per_doc_recrop: dict[str, dict[int, object]] = defaultdict(dict)
-    per_doc_fullpage: dict[str, dict[int, object]] = defaultdict(dict)
-    if b2_specs:
-        n_recrop = sum(1 for _, _, k in b2_mapping if k == "recrop")
-        n_fullpage = len(b2_specs) - n_recrop
-        logger.info(
-            "Vision wave 2/3: %d tables (%d recrop + %d full-page) "
-            "(est. 10-30min for batch processing)",
-            len(b2_specs), n_recrop, n_fullpage,
-        )
-        _w2_start = _time.perf_counter()
-        b2_responses = vision_api.extract_tables_batch(b2_specs)
-        _w2_elapsed = _time.perf_counter() - _w2_start
-        logger.info(
-            "Vision wave 2/3 complete in %.1fmin", _w2_elapsed / 60,
-        )
-        for (doc_key, local_idx, kind), resp in zip(b2_mapping, b2_responses):
-            if kind == "recrop":
-                per_doc_recrop[doc_key][local_idx] = resp
-            else:
-                per_doc_fullpage[doc_key][local_idx] = resp
+    def __init__(
+        self,
+        extractions: dict[str, DocumentExtraction],
+        doc_pool: DocumentPool,
+        on_document: Callable[[str, DocumentExtraction], None] | None,
+    ):
+        self._extractions = extractions
+        self._doc_pool = doc_pool
+        self._on_document = on_document
+        self._responses: dict[str, dict[int, object]] = defaultdict(dict)
+        self._recrop: dict[str, dict[int, object]] = defaultdict(dict)
+        self._fullpage: dict[str, dict[int, object]] = defaultdict(dict)
+        self._unsettled: dict[str, int] = {}
+        self._settled: queue.Queue[str | None] = queue.Queue()
+        self._callback_error: BaseException | None = None
+        self._notifier: threading.Thread | None = None
+        if on_document is not None:
+            self._notifier = threading.Thread(
+                target=self._run_notifier, name="deep-zotero-vision-notify", daemon=True,
+            )
+            self._notifier.start()
+
+    def start(self) -> list[tuple["TableVisionSpec", _TableAttempt]]:
+        """Initial attempt for every table; finalizes documents without tables."""
+        initial: list[tuple[TableVisionSpec, _TableAttempt]] = []
+        for doc_key, ext in self._extractions.items():
+            pending: PendingVisionWork | None = ext.pending_vision  # type: ignore[assignment]
+            if pending is None:
+                continue
+            if not pending.specs:
+                _finalize_document_no_tables(ext, self._doc_pool)
+                self._notify(doc_key)
+                continue
+            self._unsettled[doc_key] = len(pending.specs)
+            for i, spec in enumerate(pending.specs):
+                # Make table_id globally unique for the batch
+                spec.table_id = f"{doc_key}__{spec.table_id}"
+                initial.append((spec, (doc_key, i, "initial")))
+        return initial
+
+    def advance(
+        self, attempt: _TableAttempt, resp,
+    ) -> tuple["TableVisionSpec", _TableAttempt] | None:
+        """Record ``resp`` for ``attempt``; return the table's next attempt."""
+        doc_key, local_idx, kind = attempt
+        follow_up = None
+        if kind == "initial":
+            self._responses[doc_key][local_idx] = resp
+            if resp.recrop_needed and resp.recrop_bbox_pct is not None:
+                # Parsed OK, model says crop needs adjustment
+                follow_up = self._spec(doc_key, local_idx, "recrop", resp.recrop_bbox_pct)
+            elif _needs_fullpage(resp):
+                follow_up = self._spec(doc_key, local_idx, "fullpage")
+        elif kind == "recrop":
+            self._recrop[doc_key][local_idx] = resp
+            # A broken recrop (still incomplete, parse failure, or empty)
+            # falls back to full-page
+            if not (resp.parse_success and not resp.is_incomplete and (resp.headers or resp.rows)):
+                follow_up = self._spec(doc_key, local_idx, "fullpage")
+        else:
+            self._fullpage[doc_key][local_idx] = resp
 
-    # --- Batch 3: failed-recrop follow-up (rare) ---
-    # If any recrop came back broken (still incomplete, parse failure, or empty),
-    # fall back to full-page for those tables only.
-    b3_specs: list[TableVisionSpec] = []
-    b3_mapping: list[tuple[str, int]] = []
+        if follow_up is None:
+            self._unsettled[doc_key] -= 1
+            if not self._unsettled[doc_key]:
+                self._finalize(doc_key)
+        return follow_up
 
-    for doc_key, recrop_dict in per_doc_recrop.items():
-        pending = extractions[doc_key].pending_vision  # type: ignore[assignment]
-        if pending is None:
-            continue
-        need_followup: list[tuple[int, object]] = []
-        for local_idx, rc_resp in recrop_dict.items():
-            if rc_resp.parse_success and not rc_resp.is_incomplete and (rc_resp.headers or rc_resp.rows):
-                continue
-            need_followup.append((local_idx, rc_resp))
+    def _spec(
+        self, doc_key: str, local_idx: int, kind: str, recrop_bbox_pct=None,
+    ) -> tuple["TableVisionSpec", _TableAttempt]:
+        from .feature_extraction.vision_api import TableVisionSpec
 
-        if not need_followup:
-            continue
+        pending: PendingVisionWork = self._extractions[doc_key].pending_vision  # type: ignore[assignment]
+        crop_info = pending.crop_infos[local_idx]
+        page = self._doc_pool.get(pending.pdf_path)[crop_info.page_num - 1]
+        if kind == "recrop":
+            bbox = compute_recrop_bbox(crop_info.crop_bbox, recrop_bbox_pct)
+            raw_text = page.get_text("text", clip=pymupdf.Rect(bbox))
+        else:
+            full_rect = page.rect
+            bbox = (full_rect.x0, full_rect.y0, full_rect.x1, full_rect.y1)
+            raw_text = page.get_text("text")
+        spec = TableVisionSpec(
+            table_id=f"{doc_key}__{kind}_p{crop_info.page_num}_t{local_idx}",
+            pdf_path=pending.pdf_path,
+            page_num=crop_info.page_num,
+            bbox=bbox,
+            raw_text=raw_text,
+            caption=crop_info.caption_text,
+            garbled=False,
+        )
+        return spec, (doc_key, local_idx, kind)
+
+    def _finalize(self, doc_key: str) -> None:
+        ext = self._extractions[doc_key]
+        pending: PendingVisionWork = ext.pending_vision  # type: ignore[assignment]
+        responses = [self._responses[doc_key][i] for i in range(len(pending.specs))]
+        _finalize_document_tables(
+            ext, responses, self._recrop.get(doc_key, {}), self._fullpage.get(doc_key, {}),
+            self._doc_pool,
+        )
+        self._notify(doc_key)
 
-        doc = pymupdf.open(str(pending.pdf_path))
-        try:
-            for local_idx, _rc_resp in need_followup:
-                crop_info = pending.crop_infos[local_idx]
-                page = doc[crop_info.page_num - 1]
-                full_rect = page.rect
-                full_bbox = (full_rect.x0, full_rect.y0, full_rect.x1, full_rect.y1)
-                raw_text = page.get_text("text")
-                b3_specs.append(TableVisionSpec(
-                    table_id=f"{doc_key}__fullpage_p{crop_info.page_num}_t{local_idx}",
-                    pdf_path=pending.pdf_path,
-                    page_num=crop_info.page_num,
-                    bbox=full_bbox,
-                    raw_text=raw_text,
-                    caption=crop_info.caption_text,
-                    garbled=False,
-                ))
-                b3_mapping.append((doc_key, local_idx))
-        finally:
-            doc.close()
+    def _notify(self, doc_key: str) -> None:
+        self.raise_callback_error()
+        if self._notifier is not None:
+            self._settled.put(doc_key)
+
+    def _run_notifier(self) -> None:
+        while (doc_key := self._settled.get()) is not None:
+            if self._callback_error is not None:
+                continue  # drain without calling back
+            try:
+                self._on_document(doc_key, self._extractions[doc_key])
+            except BaseException as exc:
+                self._callback_error = exc
+
+    def close(self) -> None:
+        """Wait for queued ``on_document`` calls to finish."""
+        if self._notifier is not None:
+            self._settled.put(None)
+            self._notifier.join()
+            self._notifier = None
+
+    def raise_callback_error(self) -> None:
+        """Re-raise an exception from ``on_document`` on the calling thread."""
+        if self._callback_error is not None:
+            raise self._callback_error
+
+    # ------------------------------------------------------------------
+    # Drivers
+    # ------------------------------------------------------------------
+
+    def run_waves(
+        self, vision_api, initial: list[tuple["TableVisionSpec", _TableAttempt]],
+    ) -> None:
+        """Submit every table's current attempt together, one batch per wave."""
+        import time as _time
+
+        wave = initial
+        n_wave = 0
+        while wave:
+            n_wave += 1
+            n_recrop = sum(1 for _, (_dk, _i, kind) in wave if kind == "recrop")
+            if n_wave == 1:
+                logger.info(
+                    "Vision wave 1/3: submitting %d tables across %d documents "
+                    "(est. 10-30min for batch processing)",
+                    len(wave), len({dk for _, (dk, _i, _k) in wave}),
+                )
+            else:
+                logger.info(
+                    "Vision wave %d/3: %d tables (%d recrop + %d full-page) "
+                    "(est. 10-30min for batch processing)",
+                    n_wave, len(wave), n_recrop, len(wave) - n_recrop,
+                )
+            start = _time.perf_counter()
+            responses = vision_api.extract_tables_batch([spec for spec, _ in wave])
+            elapsed = _time.perf_counter() - start
+            logger.info(
+                "Vision wave %d/3 complete: %d/%d parsed OK in %.1fmin",
+                n_wave, sum(1 for r in responses if r.parse_success), len(responses), elapsed / 60,
+            )
 
-    if b3_specs:
+            next_wave = []
+            for (_spec, attempt), resp in zip(wave, responses):
+                follow_up = self.advance(attempt, resp)
+                if follow_up is not None:
+                    next_wave.append(follow_up)
+            wave = next_wave
+
+    def run_pipelined(
+        self, vision_api, initial: list[tuple["TableVisionSpec", _TableAttempt]],
+    ) -> None:
+        """Send tables individually; follow-ups go out as responses arrive.
+
+        Rendering stays on this thread (pymupdf is not thread-safe) and
+        overlaps with requests in flight.  At most ``max_workers``
+        requests are in flight, and follow-ups are sent ahead of tables
+        still waiting for their initial attempt.
+        """
+        import time as _time
+
+        window = max(1, vision_api.max_workers)
+        waiting: deque[tuple[TableVisionSpec, _TableAttempt]] = deque(initial)
+        in_flight: dict[Future, _TableAttempt] = {}
+        n_sent = 0
+        start = _time.perf_counter()
         logger.info(
-            "Vision wave 3/3 (failed-recrop follow-up): %d tables "
-            "(est. 10-30min for batch processing)",
-            len(b3_specs),
+            "Vision: sending %d tables across %d documents, %d in flight",
+            len(initial), len(self._unsettled), window,
         )
-        _w3_start = _time.perf_counter()
-        b3_responses = vision_api.extract_tables_batch(b3_specs)
-        n_recovered = 0
-        for (doc_key, local_idx), resp in zip(b3_mapping, b3_responses):
-            per_doc_fullpage[doc_key][local_idx] = resp
-            if resp.parse_success and (resp.headers or resp.rows):
-                n_recovered += 1
-        _w3_elapsed = _time.perf_counter() - _w3_start
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            while waiting or in_flight:
+                while waiting and len(in_flight) < window:
+                    spec, attempt = waiting.popleft()
+                    images = vision_api.render_table(spec, doc_pool=self._doc_pool)
+                    in_flight[pool.submit(vision_api.extract_table, spec, images)] = attempt
+                    n_sent += 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    follow_up = self.advance(in_flight.pop(future), future.result())
+                    if follow_up is not None:
+                        waiting.appendleft(follow_up)
         logger.info(
-            "Vision wave 3/3 complete in %.1fmin: recovered %d/%d failed recrops",
-            _w3_elapsed / 60, n_recovered, len(b3_specs),
+            "Vision complete: %d requests for %d tables in %.1fmin",
+            n_sent, len(initial), (_time.perf_counter() - start) / 60,
         )
 
-    # --- Build tables and finalize each document ---
-    for doc_key, ext in extractions.items():
-        pending = ext.pending_vision  # type: ignore[assignment]
-        if pending is None:
-            continue
-        if not pending.specs:
-            _finalize_document_no_tables(ext)
-            continue
 
-        responses = per_doc_responses.get(doc_key, [])
-        recrop_for_doc = per_doc_recrop.get(doc_key, {})
-        fullpage_for_doc = per_doc_fullpage.get(doc_key, {})
-        tables, vision_details = _build_tables_from_responses(
-            responses, pending.crop_infos, recrop_for_doc,
-            fullpage_responses=fullpage_for_doc,
-        )
+def _needs_fullpage(resp) -> bool:
+    """Whether an initial response (without recrop coords) needs a full-page resend."""
+    if resp.is_incomplete and not resp.recrop_needed:
+        return True
+    if resp.parse_success and not resp.headers and not resp.rows:
+        return True
+    return not resp.parse_success
 
-        # --- Post-process tables (needs doc re-opened) ---
-        doc = pymupdf.open(str(pending.pdf_path))
-        try:
-            if tables:
-                _assign_heading_captions(doc, tables)
-                _assign_continuation_captions(tables)
-                for t in tables:
-                    t.caption = _normalize_ligatures(t.caption)
-                for t in tables:
-                    t.artifact_type = _classify_artifact(t)
-                    if t.artifact_type:
-                        logger.info(
-                            "Tagged table on page %d as artifact: %s",
-                            t.page_num, t.artifact_type,
-                        )
-
-                # Figure-table overlap detection
-                _tag_figure_data_tables(tables, ext.figures)
-
-                tables = [t for t in tables if not t.artifact_type]
-
-            # Orphan recovery for figures (cross-page caption matching)
-            # page_chunks not available here; pass empty list — recovery
-            # still works via caption scanning on the open doc.
-            run_recovery(doc, ext.figures, tables, [])
-
-            completeness = _compute_completeness(
-                doc, ext.pages, ext.sections, tables, ext.figures, ext.stats,
-            )
-        finally:
-            doc.close()
 
-        # Synthetic captions
+def _finalize_document_tables(
+    ext: DocumentExtraction,
+    responses: list,
+    recrop_responses: dict[int, object],
+    fullpage_responses: dict[int, object],
+    doc_pool: DocumentPool,
+) -> None:
+    """Build tables from settled vision responses and finalize the document."""
+    pending: PendingVisionWork = ext.pending_vision  # type: ignore[assignment]
+    tables, vision_details = _build_tables_from_responses(
+        responses, pending.crop_infos, recrop_responses,
+        fullpage_responses=fullpage_responses,
+    )
+
+    # --- Post-process tables (needs the document) ---
+    doc = doc_pool.get(pending.pdf_path)
+    if tables:
+        _assign_heading_captions(doc, tables)
+        _assign_continuation_captions(tables)
         for t in tables:
-            if not t.caption:
-                t.caption = f"{SYNTHETIC_CAPTION_PREFIX}table on page {t.page_num}"
-        for f in ext.figures:
-            if not f.caption:
-                f.caption = f"{SYNTHETIC_CAPTION_PREFIX}figure on page {f.page_num}"
+            t.caption = _normalize_ligatures(t.caption)
+        for t in tables:
+            t.artifact_type = _classify_artifact(t)
+            if t.artifact_type:
+                logger.info(
+                    "Tagged table on page %d as artifact: %s",
+                    t.page_num, t.artifact_type,
+                )
+
+        # Figure-table overlap detection
+        _tag_figure_data_tables(tables, ext.figures)
+
+        tables = [t for t in tables if not t.artifact_type]
+
+    # Orphan recovery for figures (cross-page caption matching)
+    # page_chunks not available here; pass empty list — recovery
+    # still works via caption scanning on the open doc.
+    page_cache = PageTextCache(doc)
+    run_recovery(doc, ext.figures, tables, [], page_cache=page_cache)
+
+    completeness = _compute_completeness(
+        doc, ext.pages, ext.sections, tables, ext.figures, ext.stats,
+        page_cache=page_cache,
+    )
+
+    # Synthetic captions
+    for t in tables:
+        if not t.caption:
+            t.caption = f"{SYNTHETIC_CAPTION_PREFIX}table on page {t.page_num}"
+    for f in ext.figures:
+        if not f.caption:
+            f.caption = f"{SYNTHETIC_CAPTION_PREFIX}figure on page {f.page_num}"
 
-        # Update extraction in-place
-        ext.tables = tables
-        ext.vision_details = vision_details if vision_details else None
-        ext.completeness = completeness
-        ext.quality_grade = completeness.grade
-        ext.pending_vision = None
+    # Update extraction in-place
+    ext.tables = tables
+    ext.vision_details = vision_details if vision_details else None
+    ext.completeness = completeness
+    ext.quality_grade = completeness.grade
+    ext.pending_vision = None
 
 
-def _finalize_document_no_tables(ext: DocumentExtraction) -> None:
+def _finalize_document_no_tables(ext: DocumentExtraction, doc_pool: DocumentPool) -> None:
     """Finalize a document that had vision requested but no table specs."""
     pending: PendingVisionWork = ext.pending_vision  # type: ignore[assignment]
-    doc = pymupdf.open(str(pending.pdf_path))
-    try:
-        completeness = _compute_completeness(
-            doc, ext.pages, ext.sections, ext.tables, ext.figures, ext.stats,
-        )
-    finally:
-        doc.close()
+    completeness = _compute_completeness(
+        doc_pool.get(pending.pdf_path), ext.pages, ext.sections,
+        ext.tables, ext.figures, ext.stats,
+    )
 
     for f in ext.figures:
         if not f.caption:
@@ -1075,6 +1238,7 @@ def _detect_abstract(
     full_markdown: str,
     doc: pymupdf.Document,
     sections: list[SectionSpan],
+    page_cache: PageTextCache | None = None,
 ) -> SectionSpan | None:
     """Detect abstract using three-tier approach.
 
@@ -1116,11 +1280,13 @@ def _detect_abstract(
     if len(doc) < 4:
         return None
 
+    if page_cache is None:
+        page_cache = PageTextCache(doc)
+
     # Compute body font from pages 3+
     font_counts: dict[tuple[str, float], int] = {}
     for page_idx in range(3, min(len(doc), 10)):
-        page = doc[page_idx]
-        text_dict = page.get_text("dict")
+        text_dict = page_cache.text_dict(page_idx)
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
                 continue
@@ -1139,12 +1305,11 @@ def _detect_abstract(
     # Scan first 3 pages for differently-styled prose blocks
     candidates: list[tuple[int, int, str]] = []  # (char_start, char_end, text)
     for page_idx in range(min(3, len(doc))):
-        page = doc[page_idx]
         page_obj = pages[page_idx] if page_idx < len(pages) else None
         if page_obj is None:
             continue
 
-        text_dict = page.get_text("dict")
+        text_dict = page_cache.text_dict(page_idx)
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
                 continue
@@ -1521,6 +1686,7 @@ def _check_content_readability(table: "ExtractedTable") -> dict:
 def _compute_stats(
     pages: list[PageExtraction], page_chunks: list[dict],
     doc: pymupdf.Document | None = None,
+    page_cache: PageTextCache | None = None,
 ) -> dict:
     """Compute extraction statistics.
 
@@ -1528,6 +1694,8 @@ def _compute_stats(
     (page.get_text()) with the markdown output. Pages where native
     text is empty but markdown has content were processed by OCR.
     """
+    if doc and page_cache is None:
+        page_cache = PageTextCache(doc)
     total_pages = len(pages)
     text_pages = 0
     empty_pages = 0
@@ -1539,7 +1707,7 @@ def _compute_stats(
             text_pages += 1
             # Check if this page needed OCR
             if doc and i < len(doc):
-                native_text = doc[i].get_text().strip()
+                native_text = page_cache.text(i).strip()
                 if len(native_text) < 20 and len(md) > 20:
                     ocr_pages += 1
         else:
@@ -1560,15 +1728,18 @@ def _compute_completeness(
     tables: list[ExtractedTable],
     figures: list[ExtractedFigure],
     stats: dict,
+    page_cache: PageTextCache | None = None,
 ) -> "ExtractionCompleteness":
     from .models import ExtractionCompleteness
-    from .feature_extraction.captions import find_all_captions
+
+    if page_cache is None:
+        page_cache = PageTextCache(doc)
 
     fig_nums: set[str] = set()
     tab_nums: set[str] = set()
 
-    for page in doc:
-        for cap in find_all_captions(page, include_figures=True, include_tables=True):
+    for page_idx in range(len(page_cache)):
+        for cap in page_cache.captions(page_idx, include_figures=True, include_tables=True):
             if cap.number:
                 if cap.caption_type == "figure":
                     fig_nums.add(cap.number)
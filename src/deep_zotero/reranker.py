@@ -6,6 +6,9 @@ to produce a composite relevance score.
 """
 import logging
 from dataclasses import replace
+
+import numpy as np
+
 from .models import RetrievalResult
 
 logger = logging.getLogger(__name__)
@@ -74,10 +77,14 @@ class Reranker:
         results: list[RetrievalResult],
         section_weights: dict[str, float] | None = None,
         journal_weights: dict[str, float] | None = None,
+        top_k: int | None = None,
     ) -> list[RetrievalResult]:
         """
         Rerank results by composite score.
 
+        Scores are computed as NumPy arrays; only the results that are
+        returned are copied with composite_score set.
+
         Args:
             results: List of RetrievalResult from retriever
             section_weights: Optional overrides for section weights.
@@ -86,59 +93,60 @@ class Reranker:
                              Set to 0 to exclude that section entirely.
             journal_weights: Optional overrides for journal quartile weights.
                             Use "unknown" key for papers without quartile data.
+            top_k: Return only the best top_k results (None = all). Same
+                   as slicing the full ranking, but cheaper.
 
         Returns:
             New list of RetrievalResult with composite_score populated,
-            sorted by composite_score descending.
+            sorted by composite_score descending (ties keep input order).
             Results with composite_score=0 are excluded.
         """
-        if not results:
+        if not results or top_k is not None and top_k <= 0:
             return []
 
         logger.debug(f"Reranking {len(results)} results with alpha={self.alpha}")
 
-        # Build effective section weights
-        effective_section = self.default_section_weights.copy()
-        if section_weights:
-            for section, weight in section_weights.items():
-                effective_section[section] = max(0.0, min(1.0, weight))
-
-        # Build effective journal weights
-        # Map "unknown" -> None and "" for internal lookup
-        effective_journal = self.quartile_weights.copy()
-        if journal_weights:
-            for quartile, weight in journal_weights.items():
-                clamped = max(0.0, min(1.0, weight))
-                if quartile == "unknown":
-                    effective_journal[None] = clamped
-                    effective_journal[""] = clamped
-                else:
-                    effective_journal[quartile] = clamped
-
-        # Score each result
-        scored: list[tuple[RetrievalResult, float]] = []
-
-        for result in results:
-            section_weight = effective_section.get(result.section, 0.7)
-            journal_weight = effective_journal.get(result.journal_quartile, 0.7)
-
-            composite = (max(result.score, 0.0) ** self.alpha) * section_weight * journal_weight
-
-            logger.debug(
-                f"  {result.doc_id}[{result.chunk_index}]: "
-                f"sim={result.score:.3f} sect={result.section}({section_weight}) "
-                f"jrnl={result.journal_quartile}({journal_weight}) "
-                f"composite={composite:.3f}"
-            )
-
-            if composite > 0:
-                # Create new result with composite_score set
-                scored_result = replace(result, composite_score=composite)
-                scored.append((scored_result, composite))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
-        logger.debug(f"Reranking complete: {len(scored)} results after filtering")
-        return [r for r, _ in scored]
+        section_index, section_table = _weight_table(self._effective_section(section_weights))
+        journal_index, journal_table = _weight_table(self._effective_journal(journal_weights))
+        fallback = len(section_table) - 1
+        section_idx = np.fromiter(
+            (section_index.get(r.section, fallback) for r in results), np.intp, len(results),
+        )
+        fallback = len(journal_table) - 1
+        journal_idx = np.fromiter(
+            (journal_index.get(r.journal_quartile, fallback) for r in results), np.intp, len(results),
+        )
+        # The power is taken per element with Python floats: NumPy's SIMD
+        # pow can differ in the last bit, which would reorder near-ties
+        alpha = self.alpha
+        similarity = np.fromiter(
+            (max(r.score, 0.0) ** alpha for r in results), np.float64, len(results),
+        )
+
+        composite = similarity * section_table[section_idx] * journal_table[journal_idx]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, result in enumerate(results):
+                logger.debug(
+                    f"  {result.doc_id}[{result.chunk_index}]: "
+                    f"sim={result.score:.3f} sect={result.section}({section_table[section_idx[i]]}) "
+                    f"jrnl={result.journal_quartile}({journal_table[journal_idx[i]]}) "
+                    f"composite={composite[i]:.3f}"
+                )
+
+        keep = np.flatnonzero(composite > 0)
+        n_kept = len(keep)
+        if top_k is not None and top_k < len(keep):
+            # Narrow to the top_k scores plus anything tied with the k-th,
+            # so the stable sort below picks ties in input order
+            kth = len(keep) - top_k
+            cutoff = np.partition(composite[keep], kth)[kth]
+            keep = keep[composite[keep] >= cutoff]
+        # Stable descending sort, same order as sorted(..., reverse=True)
+        order = keep[np.argsort(-composite[keep], kind="stable")][:top_k]
+
+        logger.debug(f"Reranking complete: {n_kept} results after filtering")
+        return [replace(results[i], composite_score=float(composite[i])) for i in order]
 
     def score_result(
         self,
@@ -151,25 +159,45 @@ class Reranker:
 
         Useful for getting the score without reranking a full list.
         """
-        effective_section = self.default_section_weights.copy()
+        section_weight = self._effective_section(section_weights).get(result.section, 0.7)
+        journal_weight = self._effective_journal(journal_weights).get(result.journal_quartile, 0.7)
+
+        return (result.score ** self.alpha) * section_weight * journal_weight
+
+    def _effective_section(self, section_weights: dict[str, float] | None) -> dict[str, float]:
+        """Default section weights with clamped caller overrides applied."""
+        effective = self.default_section_weights.copy()
         if section_weights:
             for section, weight in section_weights.items():
-                effective_section[section] = max(0.0, min(1.0, weight))
+                effective[section] = max(0.0, min(1.0, weight))
+        return effective
+
+    def _effective_journal(self, journal_weights: dict[str, float] | None) -> dict[str | None, float]:
+        """Quartile weights with clamped caller overrides applied.
 
-        effective_journal = self.quartile_weights.copy()
+        The "unknown" override maps to both None and "" for internal lookup.
+        """
+        effective = self.quartile_weights.copy()
         if journal_weights:
             for quartile, weight in journal_weights.items():
                 clamped = max(0.0, min(1.0, weight))
                 if quartile == "unknown":
-                    effective_journal[None] = clamped
-                    effective_journal[""] = clamped
+                    effective[None] = clamped
+                    effective[""] = clamped
                 else:
-                    effective_journal[quartile] = clamped
+                    effective[quartile] = clamped
+        return effective
 
-        section_weight = effective_section.get(result.section, 0.7)
-        journal_weight = effective_journal.get(result.journal_quartile, 0.7)
 
-        return (result.score ** self.alpha) * section_weight * journal_weight
+def _weight_table(weights: dict) -> tuple[dict, np.ndarray]:
+    """(label -> index, weight array) for a weight map.
+
+    The array has one extra trailing slot holding the 0.7 fallback for
+    labels missing from the map.
+    """
+    index = {label: i for i, label in enumerate(weights)}
+    table = np.array([*weights.values(), 0.7], dtype=np.float64)
+    return index, table
 
 
 def validate_section_weights(section_weights: dict) -> list[str]:
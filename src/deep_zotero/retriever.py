@@ -20,7 +20,9 @@ class Retriever:
         query: str,
         top_k: int = 10,
         context_window: int = 1,
-        filters: dict | None = None
+        filters: dict | None = None,
+        required_terms: list[str] | None = None,
+        hybrid: bool = False,
     ) -> list[RetrievalResult]:
         """
         Search for relevant chunks and expand context.
@@ -30,23 +32,29 @@ class Retriever:
             top_k: Number of results
             context_window: Chunks before/after to include (0-5)
             filters: Optional metadata filters
+            required_terms: Terms every hit must contain (see VectorStore.search)
+            hybrid: Fuse lexical (BM25) and vector rankings
 
         Returns:
             List of RetrievalResult with expanded context
         """
-        hits = self.store.search(query, top_k=top_k, filters=filters)
+        hits = self.store.search(
+            query, top_k=top_k, filters=filters,
+            required_terms=required_terms, hybrid=hybrid,
+        )
+
+        # Fetch context for all hits at once rather than one query per hit
+        if context_window > 0 and hits:
+            context = self.store.get_adjacent_chunks_bulk(
+                [(h.metadata["doc_id"], h.metadata["chunk_index"]) for h in hits],
+                window=context_window
+            )
+        else:
+            context = {}
 
         results = []
         for hit in hits:
-            # Get adjacent chunks
-            if context_window > 0:
-                adjacent = self.store.get_adjacent_chunks(
-                    hit.metadata["doc_id"],
-                    hit.metadata["chunk_index"],
-                    window=context_window
-                )
-            else:
-                adjacent = []
+            adjacent = context.get((hit.metadata["doc_id"], hit.metadata["chunk_index"]), [])
 
             # Separate into before/after
             context_before = []
@@ -5,10 +5,11 @@ import time
 import logging
 import threading
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from dataclasses import replace
 from fastmcp import FastMCP
 from .config import Config
-from .embedder import Embedder
+from .embedder import create_embedder
 from .vector_store import VectorStore
 from .retriever import Retriever
 from .reranker import (
@@ -19,6 +20,7 @@ from .reranker import (
     VALID_QUARTILES,
 )
 from .models import RetrievalResult
+from .index_jobs import IndexJobManager, IndexProgress
 
 logger = logging.getLogger(__name__)
 
@@ -122,32 +124,62 @@ def _start_parent_monitor():
 # Start parent monitor before anything else
 _start_parent_monitor()
 
-mcp = FastMCP("deep-zotero")
-
-# Lazy initialization
+# Lazy initialization (started eagerly by _warm_up when the server runs)
 _retriever = None
 _store = None
 _reranker = None
 _config = None
+_init_lock = threading.Lock()
+_index_jobs = IndexJobManager()
 
 
 def _get_retriever() -> Retriever:
     global _retriever, _store, _reranker, _config
     if _retriever is None:
-        _config = Config.load()
-        embedder = Embedder(
-            model=_config.embedding_model,
-            dimensions=_config.embedding_dimensions,
-            api_key=_config.gemini_api_key,
-            timeout=_config.embedding_timeout,
-            max_retries=_config.embedding_max_retries,
-        )
-        _store = VectorStore(_config.chroma_db_path, embedder)
-        _retriever = Retriever(_store)
-        _reranker = Reranker(alpha=_config.rerank_alpha)
+        # Tool calls arriving during warm-up wait here instead of initializing twice
+        with _init_lock:
+            if _retriever is None:
+                _config = Config.load()
+                embedder = create_embedder(_config)
+                _store = VectorStore(_config.chroma_db_path, embedder)
+                _reranker = Reranker(alpha=_config.rerank_alpha)
+                _retriever = Retriever(_store)
     return _retriever
 
 
+def _warm_up() -> None:
+    """Initialize Chroma, the embedder and the HNSW index ahead of the first tool call.
+
+    Runs in a background thread at server startup; failures are logged and
+    left for the first tool call to report.
+    """
+    start = time.perf_counter()
+    try:
+        _get_retriever()
+        # Loads the HNSW segment: query with a stored vector (no API call)
+        peek = _store.collection.peek(limit=1)
+        embeddings = peek.get("embeddings")
+        if embeddings is not None and len(embeddings) > 0:
+            _store.collection.query(
+                query_embeddings=[list(embeddings[0])], n_results=1, include=["distances"]
+            )
+        # Loads the local model / opens the API connection
+        _store.embedder.embed_query("warm-up")
+    except Exception as e:
+        logger.warning(f"Server warm-up failed: {e}")
+        return
+    logger.info(f"Server warm-up finished in {time.perf_counter() - start:.2f}s")
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    threading.Thread(target=_warm_up, name="deep-zotero-warmup", daemon=True).start()
+    yield {}
+
+
+mcp = FastMCP("deep-zotero", lifespan=_lifespan)
+
+
 def _get_store() -> VectorStore:
     _get_retriever()  # Ensure initialized
     return _store
@@ -285,7 +317,8 @@ def _has_text_filters(author: str | None, tag: str | None, collection: str | Non
 def _apply_required_terms(results: list, terms: list[str]) -> list:
     """Filter results to only those containing all required terms as whole words.
 
-    Case-insensitive. Checks the passage text (and full_context if available).
+    Case-insensitive. Checks the passage text only, not its context chunks,
+    matching what the lexical index answers when it is available.
     """
     import re
     patterns = [re.compile(r'\b' + re.escape(t) + r'\b', re.IGNORECASE) for t in terms]
@@ -293,9 +326,7 @@ def _apply_required_terms(results: list, terms: list[str]) -> list:
     filtered = []
     for r in results:
         text = getattr(r, 'text', '') or ''
-        full_ctx = r.full_context() if hasattr(r, 'full_context') and callable(getattr(r, 'full_context', None)) else ''
-        combined = text + ' ' + full_ctx
-        if all(p.search(combined) for p in patterns):
+        if all(p.search(text) for p in patterns):
             filtered.append(r)
     return filtered
 
@@ -354,7 +385,8 @@ def search_papers(
 
     Combine semantic search with exact word matching by passing
     required_terms. Each term must appear as a whole word (case-insensitive)
-    in the passage text for the result to be included. This is useful for
+    in the passage's own text for the result to be included; the adjacent
+    context chunks are not searched. This is useful for
     ensuring results contain specific acronyms, identifiers, or keywords
     that semantic search alone might miss.
 
@@ -377,7 +409,8 @@ def search_papers(
         journal_weights: Override journal quartile weights. Keys: Q1, Q2,
             Q3, Q4, unknown. Values are 0.0-1.0.
         required_terms: List of words that must appear in the passage text
-            (case-insensitive whole-word match). All terms must be present.
+            (case-insensitive whole-word match). All terms must be present
+            in the passage itself, not only in its context chunks.
             Use this to combine semantic search with exact keyword filtering.
 
     Returns:
@@ -409,25 +442,34 @@ def search_papers(
     retriever = _get_retriever()
     reranker = _get_reranker()
 
+    # required_terms are answered by the lexical index when available;
+    # otherwise they are a post-retrieval filter like author/tag/collection
+    lexical_terms = required_terms if _get_store().lexical is not None else None
+
     # Oversample for reranking; increase if post-retrieval filters will reduce results
     base_fetch = min(top_k * _config.oversample_multiplier, 150)
-    has_post_filters = _has_text_filters(author, tag, collection) or required_terms
+    has_post_filters = (
+        _has_text_filters(author, tag, collection) or (required_terms and not lexical_terms)
+    )
     fetch_k = base_fetch * 3 if has_post_filters else base_fetch
 
     results = retriever.search(
         query=query,
         top_k=fetch_k,
         context_window=min(context_chunks, 3),
-        filters=_build_chromadb_filters(year_min, year_max, chunk_types)
+        filters=_build_chromadb_filters(year_min, year_max, chunk_types),
+        required_terms=lexical_terms,
+        hybrid=_config.hybrid_search,
     )
     results = _apply_text_filters(results, author, tag, collection)
-    if required_terms:
+    if required_terms and not lexical_terms:
         results = _apply_required_terms(results, required_terms)
 
     # Rerank (or bypass if disabled)
     if _config.rerank_enabled:
-        reranked = reranker.rerank(results, section_weights, journal_weights)
-        top_results = reranked[:min(top_k, 50)]
+        top_results = reranker.rerank(
+            results, section_weights, journal_weights, top_k=min(top_k, 50),
+        )
     else:
         # No reranking — set composite_score equal to relevance_score
         top_results = []
@@ -522,7 +564,8 @@ def search_topic(
         query=query,
         top_k=fetch_k,
         context_window=1,
-        filters=_build_chromadb_filters(year_min, year_max, chunk_types)
+        filters=_build_chromadb_filters(year_min, year_max, chunk_types),
+        hybrid=_config.hybrid_search,
     )
     results = _apply_text_filters(results, author, tag, collection)
 
@@ -644,7 +687,7 @@ def search_tables(
     base_fetch = min(top_k * _config.oversample_multiplier, 90)
     fetch_k = base_fetch * 2 if _has_text_filters(author, tag, collection) else base_fetch
 
-    results = store.search(query=query, top_k=fetch_k, filters=filters)
+    results = store.search(query=query, top_k=fetch_k, filters=filters, hybrid=_config.hybrid_search)
     results = _apply_text_filters(results, author, tag, collection)
 
     # Apply reranking (or bypass if disabled)
@@ -652,8 +695,9 @@ def search_tables(
         # Convert StoredChunk to RetrievalResult for reranking
         retrieval_results = [_stored_chunk_to_retrieval_result(r) for r in results]
         # Note: section_weights not needed - all tables have section="table"
-        reranked = reranker.rerank(retrieval_results, journal_weights=journal_weights)
-        top_results = reranked[:min(top_k, 30)]
+        top_results = reranker.rerank(
+            retrieval_results, journal_weights=journal_weights, top_k=min(top_k, 30),
+        )
     else:
         # No reranking - set composite_score = relevance_score
         retrieval_results = [_stored_chunk_to_retrieval_result(r) for r in results]
@@ -745,7 +789,7 @@ def search_figures(
     base_fetch = min(top_k * 3, 90)
     fetch_k = base_fetch * 2 if _has_text_filters(author, tag, collection) else base_fetch
 
-    results = store.search(query=query, top_k=fetch_k, filters=filters)
+    results = store.search(query=query, top_k=fetch_k, filters=filters, hybrid=_config.hybrid_search)
     results = _apply_text_filters(results, author, tag, collection)
 
     output = []
@@ -856,6 +900,7 @@ def _get_table_reference_context(
 
     table_meta = table_results["metadatas"][0]
     table_caption = table_meta.get("table_caption", "")
+    doc_meta = store.get_document_meta(doc_id) or {}
 
     # Get all text chunks for this document
     text_results = store.collection.get(
@@ -872,8 +917,8 @@ def _get_table_reference_context(
         # No text chunks - return table metadata only
         return {
             "doc_id": doc_id,
-            "doc_title": table_meta.get("doc_title", "Unknown"),
-            "citation_key": table_meta.get("citation_key", ""),
+            "doc_title": doc_meta.get("doc_title", "Unknown"),
+            "citation_key": doc_meta.get("citation_key", ""),
             "note": "No text chunks found for this document",
             "table_caption": table_caption,
             "table_page": table_page,
@@ -905,8 +950,8 @@ def _get_table_reference_context(
         # No reference found - return table metadata with note
         return {
             "doc_id": doc_id,
-            "doc_title": table_meta.get("doc_title", "Unknown"),
-            "citation_key": table_meta.get("citation_key", ""),
+            "doc_title": doc_meta.get("doc_title", "Unknown"),
+            "citation_key": doc_meta.get("citation_key", ""),
             "note": "No text reference to this table found",
             "table_caption": table_caption,
             "table_page": table_page,
@@ -958,13 +1003,17 @@ def index_library(
     item_key: str | None = None,
     title_pattern: str | None = None,
     no_vision: bool = False,
+    changed_only: bool = False,
 ) -> dict:
     """
-    Index Zotero PDFs into the vector store.
+    Start indexing Zotero PDFs into the vector store in the background.
 
     Extracts text, tables, and figures from PDFs, chunks them, and stores
     embeddings in ChromaDB. Incrementally indexes only new/changed documents
-    unless force_reindex is True.
+    unless force_reindex is True. Returns immediately with a job ID; poll
+    get_index_job_status for progress and the final summary. Search tools
+    keep working on the existing index while the job runs. Only one job
+    runs at a time.
 
     Args:
         force_reindex: Delete and rebuild index for all matching items
@@ -972,9 +1021,11 @@ def index_library(
         item_key: Index only this specific Zotero item key
         title_pattern: Regex pattern to filter items by title (case-insensitive)
         no_vision: Disable vision-based table extraction for this run
+        changed_only: Only check items changed in Zotero since the last
+            changed_only run (fast incremental update)
 
     Returns:
-        Summary with counts of indexed/failed/skipped items and quality stats
+        Job status dict with job_id, status and progress
     """
     from .indexer import Indexer
 
@@ -991,15 +1042,36 @@ def index_library(
         from dataclasses import replace as dc_replace
         config = dc_replace(_config, vision_enabled=False)
 
-    indexer = Indexer(config)
-    result = indexer.index_all(
-        force_reindex=force_reindex,
-        limit=limit,
-        item_key=item_key,
-        title_pattern=title_pattern,
-    )
+    params = {
+        "force_reindex": force_reindex,
+        "limit": limit,
+        "item_key": item_key,
+        "title_pattern": title_pattern,
+        "no_vision": no_vision,
+        "changed_only": changed_only,
+    }
 
-    # Serialize IndexResult objects
+    def run(progress: IndexProgress) -> dict:
+        indexer = Indexer(config)
+        result = indexer.index_all(
+            force_reindex=force_reindex,
+            limit=limit,
+            item_key=item_key,
+            title_pattern=title_pattern,
+            changed_only=changed_only,
+            progress=progress,
+        )
+        return _serialize_index_result(result)
+
+    try:
+        job = _index_jobs.start(run, params)
+    except RuntimeError as e:
+        raise ToolError(f"{e}; poll get_index_job_status or call cancel_index_job")
+    return job.to_dict()
+
+
+def _serialize_index_result(result: dict) -> dict:
+    """JSON-safe summary of an Indexer.index_all result."""
     serialized_results = []
     for r in result["results"]:
         serialized_results.append({
@@ -1012,7 +1084,7 @@ def index_library(
             "quality_grade": r.quality_grade,
         })
 
-    return {
+    summary = {
         "results": serialized_results,
         "indexed": result["indexed"],
         "failed": result["failed"],
@@ -1022,6 +1094,56 @@ def index_library(
         "quality_distribution": result.get("quality_distribution"),
         "extraction_stats": result.get("extraction_stats"),
     }
+    if "vision_cost" in result:
+        summary["vision_cost"] = result["vision_cost"]
+    if "removed" in result:
+        summary["removed"] = result["removed"]
+        summary["metadata_updated"] = result["metadata_updated"]
+    return summary
+
+
+@mcp.tool()
+def get_index_job_status(job_id: str | None = None) -> dict:
+    """
+    Get the status of a background indexing job.
+
+    Args:
+        job_id: Job ID returned by index_library (default: most recent job)
+
+    Returns:
+        Dict with:
+        - status: running, completed, failed or cancelled
+        - progress: stage (discovering, extracting, vision, storing or
+          indexing), papers done/total in that stage, papers_per_minute
+          and eta_seconds
+        - elapsed_seconds, params, error
+        - result: indexing summary once the job has completed
+    """
+    job = _index_jobs.get(job_id)
+    if job is None:
+        raise ToolError(f"No indexing job found{f' with ID {job_id}' if job_id else ''}")
+    return job.to_dict()
+
+
+@mcp.tool()
+def cancel_index_job(job_id: str) -> dict:
+    """
+    Cancel a running background indexing job.
+
+    The job stops at the next paper boundary (a vision batch already
+    submitted is waited for). Papers stored so far stay indexed, and the
+    next index_library run resumes from the saved extractions.
+
+    Args:
+        job_id: Job ID returned by index_library
+
+    Returns:
+        Job status dict (cancel_requested is true until the job stops)
+    """
+    job = _index_jobs.cancel(job_id)
+    if job is None:
+        raise ToolError(f"No indexing job found with ID {job_id}")
+    return job.to_dict()
 
 
 @mcp.tool()
@@ -1032,12 +1154,11 @@ def get_index_stats() -> dict:
     doc_ids = store.get_indexed_doc_ids()
     total_chunks = store.count()
 
-    # Get section, journal, and chunk type coverage from a sample of chunks
+    # Get section and chunk type coverage from a sample of chunks
     # (Getting all chunks would be expensive for large collections)
     sample = store.collection.get(limit=_config.stats_sample_limit, include=["metadatas"])
 
     section_counts: dict[str, int] = defaultdict(int)
-    journal_doc_quartiles: dict[str, str] = {}  # doc_id -> quartile
     chunk_type_counts: dict[str, int] = defaultdict(int)
 
     if sample["metadatas"]:
@@ -1048,16 +1169,11 @@ def get_index_stats() -> dict:
             chunk_type = meta.get("chunk_type", "text")
             chunk_type_counts[chunk_type] += 1
 
-            doc_id = meta.get("doc_id", "")
-            quartile = meta.get("journal_quartile", "")
-            if doc_id and doc_id not in journal_doc_quartiles:
-                journal_doc_quartiles[doc_id] = quartile
-
-    # Count documents per quartile
+    # Count documents per quartile (exact: one sidecar row per document)
     journal_counts: dict[str, int] = defaultdict(int)
-    for quartile in journal_doc_quartiles.values():
+    for quartile, n in store.documents.count_by("journal_quartile").items():
         key = quartile if quartile else "unknown"
-        journal_counts[key] += 1
+        journal_counts[key] += n
 
     return {
         "total_documents": len(doc_ids),
@@ -1329,14 +1445,16 @@ def get_vision_costs(last_n: int = 10) -> dict:
         - recent_entries: Last N log entries in chronological order
         - log_path: Absolute path to the cost log file
     """
-    import json
     from pathlib import Path
 
+    from .feature_extraction.cost_ledger import CostLedger
+
     global _config
     if _config is None:
         _config = Config.load()
 
-    log_path = Path(_config.chroma_db_path).parent / "vision_costs.json"
+    ledger = CostLedger(Path(_config.chroma_db_path).parent / "vision_costs.jsonl")
+    log_path = ledger.path
 
     if not log_path.exists():
         return {
@@ -1345,75 +1463,18 @@ def get_vision_costs(last_n: int = 10) -> dict:
         }
 
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            entries = json.load(f)
-    except (json.JSONDecodeError, OSError) as exc:
+        summary = ledger.summarize(last_n=last_n)
+    except OSError as exc:
         raise ToolError(f"Failed to read vision cost log: {exc}")
 
-    if not entries:
+    if summary is None:
         return {
             "message": "Vision cost log exists but contains no entries.",
             "log_path": str(log_path),
         }
 
-    # Aggregate totals
-    total_cost = 0.0
-    total_input = 0
-    total_output = 0
-    total_cache_write = 0
-    total_cache_read = 0
-
-    # Per-session tracking: session_id -> {first_ts, count, cost}
-    session_map: dict[str, dict] = {}
-
-    for entry in entries:
-        total_cost += entry.get("cost_usd", 0.0)
-        total_input += entry.get("input_tokens", 0)
-        total_output += entry.get("output_tokens", 0)
-        total_cache_write += entry.get("cache_write_tokens", 0)
-        total_cache_read += entry.get("cache_read_tokens", 0)
-
-        sid = entry.get("session_id", "unknown")
-        ts = entry.get("timestamp", "")
-        if sid not in session_map:
-            session_map[sid] = {"session_id": sid, "first_timestamp": ts, "table_count": 0, "cost_usd": 0.0}
-        session_map[sid]["table_count"] += 1
-        session_map[sid]["cost_usd"] += entry.get("cost_usd", 0.0)
-        # Keep earliest timestamp
-        if ts and ts < session_map[sid]["first_timestamp"]:
-            session_map[sid]["first_timestamp"] = ts
-
-    total_tables = len(entries)
-    avg_cost = total_cost / total_tables if total_tables else 0.0
-
-    # Round session costs
-    sessions = []
-    for s in session_map.values():
-        sessions.append({
-            "session_id": s["session_id"],
-            "first_timestamp": s["first_timestamp"],
-            "table_count": s["table_count"],
-            "cost_usd": round(s["cost_usd"], 6),
-        })
-    # Sort sessions by first timestamp ascending
-    sessions.sort(key=lambda x: x["first_timestamp"])
-
-    recent = entries[-last_n:] if last_n > 0 else []
-
-    return {
-        "total_cost_usd": round(total_cost, 6),
-        "total_tables": total_tables,
-        "avg_cost_per_table_usd": round(avg_cost, 6),
-        "tokens": {
-            "input": total_input,
-            "output": total_output,
-            "cache_write": total_cache_write,
-            "cache_read": total_cache_read,
-        },
-        "sessions": sessions,
-        "recent_entries": recent,
-        "log_path": str(log_path),
-    }
+    summary["log_path"] = str(log_path)
+    return summary
 
 
 if __name__ == "__main__":
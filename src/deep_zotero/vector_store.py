@@ -1,18 +1,29 @@
 """ChromaDB vector storage with chunk management."""
 import logging
 import re
+import sqlite3
 import chromadb
 from chromadb.config import Settings
 from pathlib import Path
 from typing import TYPE_CHECKING
 from .models import Chunk, StoredChunk
 from .interfaces import EmbedderProtocol
+from .document_store import DOC_FIELDS, DocumentStore
+from .lexical_index import LexicalIndex
 
 if TYPE_CHECKING:
     from .models import ExtractedTable
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal rank fusion constant (Cormack et al. 2009)
+RRF_K = 60
+
+# required_terms candidates sent to Chroma: the best-BM25
+# max(top_k * factor, minimum) matching chunks
+REQUIRED_TERMS_FACTOR = 10
+REQUIRED_TERMS_MIN_CANDIDATES = 1000
+
 
 def _ref_chunk_index(ref_map: dict, element_type: str, item) -> int:
     """Look up chunk_index from ref_map using caption number."""
@@ -37,6 +48,14 @@ class VectorStore:
     - Semantic search with filters
     - Adjacent chunk retrieval for context expansion
     - Document-level operations (delete, list)
+
+    Chunk texts are mirrored into a LexicalIndex (SQLite FTS5) next to
+    the Chroma files for required-term filtering and hybrid search.
+    ``lexical`` is None if this SQLite build lacks FTS5.
+
+    Document-level metadata lives once per document in ``documents``
+    (a DocumentStore) and is joined onto every returned chunk, so
+    callers still see doc_title, authors, tags, ... in chunk metadata.
     """
 
     def __init__(self, db_path: Path, embedder: EmbedderProtocol):
@@ -80,6 +99,98 @@ class VectorStore:
             metadata=metadata
         )
         self.embedder = embedder
+        self.documents = DocumentStore(self.db_path / "documents.sqlite")
+        if self.documents.count() == 0 and self.collection.count() > 0:
+            self._backfill_documents()
+        self.lexical = self._open_lexical_index()
+
+    def _backfill_documents(self) -> None:
+        """Populate the document sidecar from an index built before it existed.
+
+        Such indexes carry document fields in every chunk; the first chunk
+        seen for each doc_id supplies them.
+        """
+        total = self.collection.count()
+        logger.info(f"Migrating document metadata from {total} chunks")
+        seen: set[str] = set()
+        page = 5000
+        for offset in range(0, total, page):
+            batch = self.collection.get(limit=page, offset=offset, include=["metadatas"])
+            for meta in batch["metadatas"]:
+                doc_id = meta.get("doc_id")
+                if not doc_id or doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                self.documents.upsert(doc_id, {col: meta.get(key) for col, key in DOC_FIELDS.items()})
+        logger.info(f"Migrated metadata for {len(seen)} documents")
+
+    def _join_documents(self, chunks: list[StoredChunk]) -> list[StoredChunk]:
+        """Merge document-level metadata into each chunk's metadata (in place)."""
+        docs = self.documents.get_many(c.metadata.get("doc_id", "") for c in chunks)
+        for c in chunks:
+            doc = docs.get(c.metadata.get("doc_id", ""))
+            if doc is not None:
+                c.metadata = {**c.metadata, **doc}
+        return chunks
+
+    @staticmethod
+    def _base_metadata(doc_id: str, doc_meta: dict) -> dict:
+        """Chunk metadata shared by all chunk types.
+
+        Only doc_id and the fields Chroma filters on are stored per chunk;
+        everything else is in the document sidecar.
+        """
+        return {
+            "doc_id": doc_id,
+            "year": doc_meta.get("year") or 0,
+        }
+
+    def _open_lexical_index(self) -> LexicalIndex | None:
+        """Open the FTS5 index, building it if it was never completed.
+
+        Counts are not compared with Chroma: another process may be
+        between its Chroma and FTS writes.  ``rebuild_lexical_index``
+        repairs an index that has drifted.
+        """
+        try:
+            lexical = LexicalIndex(self.db_path / "lexical_index.sqlite")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Lexical index unavailable ({e}); hybrid search disabled")
+            return None
+
+        if not lexical.is_complete() or (lexical.count() == 0 and self.collection.count() > 0):
+            self._rebuild_lexical(lexical)
+        return lexical
+
+    def rebuild_lexical_index(self) -> int:
+        """Rebuild the lexical index from the Chroma collection.
+
+        Returns:
+            Number of chunks indexed.
+        """
+        if self.lexical is None:
+            raise RuntimeError("Lexical index is unavailable")
+        return self._rebuild_lexical(self.lexical)
+
+    def _rebuild_lexical(self, lexical: LexicalIndex) -> int:
+        total = self.collection.count()
+        logger.info(f"Rebuilding lexical index for {total} chunks")
+        lexical.set_complete(False)
+        lexical.clear()
+        page = 5000
+        for offset in range(0, total, page):
+            batch = self.collection.get(
+                limit=page, offset=offset, include=["documents", "metadatas"]
+            )
+            by_doc: dict[str, tuple[list[str], list[str]]] = {}
+            for chunk_id, text, meta in zip(batch["ids"], batch["documents"], batch["metadatas"]):
+                ids, texts = by_doc.setdefault(meta.get("doc_id", ""), ([], []))
+                ids.append(chunk_id)
+                texts.append(text or "")
+            for doc_id, (ids, texts) in by_doc.items():
+                lexical.add(doc_id, ids, texts)
+        lexical.set_complete(True)
+        return lexical.count()
 
     def add_chunks(self, doc_id: str, doc_meta: dict, chunks: list[Chunk]) -> None:
         """
@@ -93,6 +204,9 @@ class VectorStore:
         if not chunks:
             return
 
+        # Sidecar first: a document row without chunks is harmless
+        self.documents.upsert(doc_id, doc_meta)
+
         ids = [f"{doc_id}_chunk_{c.chunk_index:04d}" for c in chunks]
         texts = [c.text for c in chunks]
 
@@ -101,19 +215,7 @@ class VectorStore:
 
         metadatas = [
             {
-                "doc_id": doc_id,
-                "doc_title": doc_meta.get("title", ""),
-                "authors": doc_meta.get("authors", ""),
-                "authors_lower": doc_meta.get("authors", "").lower(),  # For case-insensitive search
-                "year": doc_meta.get("year") or 0,
-                "citation_key": doc_meta.get("citation_key", ""),
-                "publication": doc_meta.get("publication", ""),
-                "doi": doc_meta.get("doi", ""),
-                "tags": doc_meta.get("tags", ""),
-                "tags_lower": doc_meta.get("tags", "").lower(),  # For case-insensitive search
-                "collections": doc_meta.get("collections", ""),
-                "pdf_hash": doc_meta.get("pdf_hash", ""),  # Feature 6: for update detection
-                "quality_grade": doc_meta.get("quality_grade", ""),  # Feature 11: extraction quality
+                **self._base_metadata(doc_id, doc_meta),
                 "page_num": c.page_num,
                 "chunk_index": c.chunk_index,
                 "total_chunks": len(chunks),
@@ -121,7 +223,6 @@ class VectorStore:
                 "char_end": c.char_end,
                 "section": c.section,
                 "section_confidence": c.section_confidence,
-                "journal_quartile": doc_meta.get("journal_quartile", ""),
                 "chunk_type": "text",
             }
             for c in chunks
@@ -133,6 +234,8 @@ class VectorStore:
             embeddings=embeddings,
             metadatas=metadatas
         )
+        if self.lexical is not None:
+            self.lexical.add(doc_id, ids, texts)
 
     def add_tables(
         self,
@@ -160,26 +263,14 @@ class VectorStore:
             for t in tables
         ]
         texts = [t.to_markdown() for t in tables]
+        self.documents.upsert(doc_id, doc_meta)
 
         # Use RETRIEVAL_DOCUMENT task type
         embeddings = self.embedder.embed(texts, task_type="RETRIEVAL_DOCUMENT")
 
         metadatas = [
             {
-                "doc_id": doc_id,
-                "doc_title": doc_meta.get("title", ""),
-                "authors": doc_meta.get("authors", ""),
-                "authors_lower": doc_meta.get("authors", "").lower(),
-                "year": doc_meta.get("year") or 0,
-                "citation_key": doc_meta.get("citation_key", ""),
-                "publication": doc_meta.get("publication", ""),
-                "doi": doc_meta.get("doi", ""),
-                "tags": doc_meta.get("tags", ""),
-                "tags_lower": doc_meta.get("tags", "").lower(),
-                "collections": doc_meta.get("collections", ""),
-                "journal_quartile": doc_meta.get("journal_quartile", ""),
-                "pdf_hash": doc_meta.get("pdf_hash", ""),  # Feature 6: for update detection
-                "quality_grade": doc_meta.get("quality_grade", ""),  # Feature 11: extraction quality
+                **self._base_metadata(doc_id, doc_meta),
                 "page_num": t.page_num,
                 "chunk_index": _ref_chunk_index(ref_map, "table", t) if ref_map else -1,
                 "chunk_type": "table",
@@ -201,6 +292,8 @@ class VectorStore:
             embeddings=embeddings,
             metadatas=metadatas
         )
+        if self.lexical is not None:
+            self.lexical.add(doc_id, ids, texts)
 
     def add_figures(
         self,
@@ -233,20 +326,7 @@ class VectorStore:
             text = fig.to_searchable_text()
 
             metadata = {
-                "doc_id": doc_id,
-                "doc_title": doc_meta.get("title", ""),
-                "authors": doc_meta.get("authors", ""),
-                "authors_lower": doc_meta.get("authors", "").lower(),
-                "year": doc_meta.get("year") or 0,
-                "citation_key": doc_meta.get("citation_key", ""),
-                "publication": doc_meta.get("publication", ""),
-                "doi": doc_meta.get("doi", ""),
-                "tags": doc_meta.get("tags", ""),
-                "tags_lower": doc_meta.get("tags", "").lower(),
-                "collections": doc_meta.get("collections", ""),
-                "journal_quartile": doc_meta.get("journal_quartile", ""),
-                "pdf_hash": doc_meta.get("pdf_hash", ""),
-                "quality_grade": doc_meta.get("quality_grade", ""),
+                **self._base_metadata(doc_id, doc_meta),
                 "chunk_type": "figure",
                 "page_num": fig.page_num,
                 "chunk_index": _ref_chunk_index(ref_map, "figure", fig) if ref_map else -1,
@@ -264,6 +344,7 @@ class VectorStore:
             metadatas.append(metadata)
 
         if ids:
+            self.documents.upsert(doc_id, doc_meta)
             embeddings = self.embedder.embed(documents, task_type="RETRIEVAL_DOCUMENT")
             self.collection.add(
                 ids=ids,
@@ -271,12 +352,16 @@ class VectorStore:
                 embeddings=embeddings,
                 metadatas=metadatas,
             )
+            if self.lexical is not None:
+                self.lexical.add(doc_id, ids, documents)
 
     def search(
         self,
         query: str,
         top_k: int = 10,
-        filters: dict | None = None
+        filters: dict | None = None,
+        required_terms: list[str] | None = None,
+        hybrid: bool = False,
     ) -> list[StoredChunk]:
         """
         Search for similar chunks.
@@ -285,18 +370,100 @@ class VectorStore:
             query: Search query text
             top_k: Number of results to return
             filters: Optional ChromaDB where clause
+            required_terms: Words/phrases that must all appear in the chunk's
+                own text (case-insensitive, whole word; adjacent chunks are
+                not searched). Answered from the lexical index: the best
+                BM25 matches that pass ``filters``, up to
+                max(top_k * REQUIRED_TERMS_FACTOR,
+                REQUIRED_TERMS_MIN_CANDIDATES), are the vector candidates.
+                Requires the lexical index (see ``lexical``).
+            hybrid: Fuse BM25 and vector rankings with reciprocal rank
+                fusion to choose the candidates. Scores stay cosine
+                similarities so downstream reranking is unchanged.
 
         Returns:
-            List of StoredChunk objects sorted by similarity
+            List of StoredChunk objects, most relevant first
         """
         # Use RETRIEVAL_QUERY task type for asymmetric search
         query_embedding = self.embedder.embed_query(query)
 
+        if required_terms and self.lexical is None:
+            raise RuntimeError("required_terms needs the lexical index, which is unavailable")
+
+        candidate_ids = None
+        if required_terms:
+            cap = max(top_k * REQUIRED_TERMS_FACTOR, REQUIRED_TERMS_MIN_CANDIDATES)
+            candidate_ids = self._lexical_candidates(None, cap, filters, required_terms)
+            if not candidate_ids:
+                return []
+
+        chunks = self._vector_query(query_embedding, top_k, filters, candidate_ids)
+        if not hybrid or self.lexical is None:
+            return chunks
+
+        # BM25 ranking over the same candidate set
+        lexical_ids = self._lexical_candidates(query, top_k, filters, required_terms)
+        have = {c.id for c in chunks}
+        missing = [i for i in lexical_ids if i not in have]
+        if missing:
+            # Cosine scores for lexical-only hits; also applies ``filters``
+            chunks += self._vector_query(query_embedding, len(missing), filters, missing)
+
+        rrf: dict[str, float] = {}
+        for rank, c in enumerate(sorted(chunks, key=lambda c: c.score, reverse=True)):
+            rrf[c.id] = 1.0 / (RRF_K + rank + 1)
+        by_id = {c.id: c for c in chunks}
+        for rank, chunk_id in enumerate(lexical_ids):
+            if chunk_id in by_id:
+                rrf[chunk_id] += 1.0 / (RRF_K + rank + 1)
+
+        fused = sorted(by_id.values(), key=lambda c: rrf[c.id], reverse=True)
+        return fused[:top_k]
+
+    def _lexical_candidates(
+        self,
+        query: str | None,
+        top_k: int,
+        filters: dict | None,
+        required_terms: list[str] | None,
+    ) -> list[str]:
+        """Best ``top_k`` BM25 hits that also pass ``filters``.
+
+        The lexical index holds no metadata, so with filters the BM25
+        ranking is fetched in growing windows and checked against Chroma
+        until ``top_k`` hits pass or the matches run out.
+        """
+        if not filters:
+            return [i for i, _ in self.lexical.search(query, limit=top_k, required_terms=required_terms)]
+
+        limit = top_k * 4
+        while True:
+            ranked = [i for i, _ in self.lexical.search(query, limit=limit, required_terms=required_terms)]
+            if not ranked:
+                return []
+            allowed = set(self.collection.get(ids=ranked, where=filters, include=[])["ids"])
+            passing = [i for i in ranked if i in allowed]
+            if len(passing) >= top_k or len(ranked) < limit:
+                return passing[:top_k]
+            limit *= 4
+
+    def _vector_query(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        filters: dict | None,
+        ids: list[str] | None = None,
+    ) -> list[StoredChunk]:
+        """Nearest-neighbour query, optionally restricted to ``ids``."""
+        kwargs = {}
+        if ids is not None:
+            kwargs["ids"] = ids
         results = self.collection.query(
             query_embeddings=[query_embedding],
             n_results=top_k,
             where=filters,
-            include=["documents", "metadatas", "distances"]
+            include=["documents", "metadatas", "distances"],
+            **kwargs,
         )
 
         chunks = []
@@ -308,7 +475,7 @@ class VectorStore:
                     metadata=results['metadatas'][0][i],
                     score=1 - results['distances'][0][i]  # Convert distance to similarity
                 ))
-        return chunks
+        return self._join_documents(chunks)
 
     def get_adjacent_chunks(
         self,
@@ -347,11 +514,93 @@ class VectorStore:
                     metadata=results['metadatas'][i]
                 ))
 
-        return sorted(chunks, key=lambda c: c.metadata['chunk_index'])
+        return self._join_documents(sorted(chunks, key=lambda c: c.metadata['chunk_index']))
+
+    # Max (doc_id, range) clauses per $or in get_adjacent_chunks_bulk
+    _BULK_CLAUSES_PER_QUERY = 100
+
+    def get_adjacent_chunks_bulk(
+        self,
+        centers: list[tuple[str, int]],
+        window: int = 2
+    ) -> dict[tuple[str, int], list[StoredChunk]]:
+        """
+        Get context windows for many chunks in as few queries as possible.
+
+        Equivalent to calling get_adjacent_chunks() for every center, but
+        windows are grouped by document and overlapping ranges merged, so a
+        result set costs one Chroma get per ~100 disjoint ranges instead of
+        one per hit.
+
+        Args:
+            centers: (doc_id, chunk_index) pairs
+            window: Number of chunks before/after each center
+
+        Returns:
+            Dict mapping each (doc_id, chunk_index) in ``centers`` to its
+            chunks sorted by chunk_index
+        """
+        if not centers:
+            return {}
+
+        # Merge overlapping [index - window, index + window] ranges per doc
+        by_doc: dict[str, list[int]] = {}
+        for doc_id, chunk_index in centers:
+            by_doc.setdefault(doc_id, []).append(chunk_index)
+        clauses = []
+        for doc_id, indices in by_doc.items():
+            ranges: list[list[int]] = []
+            for idx in sorted(set(indices)):
+                lo, hi = idx - window, idx + window
+                if ranges and lo <= ranges[-1][1] + 1:
+                    ranges[-1][1] = hi
+                else:
+                    ranges.append([lo, hi])
+            for lo, hi in ranges:
+                clauses.append({
+                    "$and": [
+                        {"doc_id": {"$eq": doc_id}},
+                        {"chunk_index": {"$gte": lo}},
+                        {"chunk_index": {"$lte": hi}}
+                    ]
+                })
+
+        fetched: dict[str, list[StoredChunk]] = {}
+        seen: set[str] = set()
+        step = self._BULK_CLAUSES_PER_QUERY
+        for start in range(0, len(clauses), step):
+            group = clauses[start:start + step]
+            where = group[0] if len(group) == 1 else {"$or": group}
+            results = self.collection.get(where=where, include=["documents", "metadatas"])
+            for i, chunk_id in enumerate(results['ids'] or []):
+                if chunk_id in seen:
+                    continue
+                seen.add(chunk_id)
+                meta = results['metadatas'][i]
+                fetched.setdefault(meta['doc_id'], []).append(StoredChunk(
+                    id=chunk_id,
+                    text=results['documents'][i],
+                    metadata=meta
+                ))
+
+        for chunks in fetched.values():
+            chunks.sort(key=lambda c: c.metadata['chunk_index'])
+        self._join_documents([c for chunks in fetched.values() for c in chunks])
+
+        out = {}
+        for doc_id, chunk_index in centers:
+            out[(doc_id, chunk_index)] = [
+                c for c in fetched.get(doc_id, [])
+                if chunk_index - window <= c.metadata['chunk_index'] <= chunk_index + window
+            ]
+        return out
 
     def delete_document(self, doc_id: str) -> None:
         """Remove all chunks for a document."""
         self.collection.delete(where={"doc_id": {"$eq": doc_id}})
+        self.documents.delete(doc_id)
+        if self.lexical is not None:
+            self.lexical.delete_document(doc_id)
 
     def get_indexed_doc_ids(self) -> set[str]:
         """Get set of all indexed document IDs.
@@ -384,23 +633,57 @@ class VectorStore:
         """Return total number of chunks."""
         return self.collection.count()
 
+    def update_document_meta(self, doc_id: str, doc_meta: dict) -> list[str] | None:
+        """Apply bibliographic changes to an indexed document without re-embedding.
+
+        Only keys present in ``doc_meta`` are compared.  Document fields are
+        rewritten in the sidecar; ``year``, the one field also stored on
+        chunks, is updated in place on the document's chunks.
+
+        Args:
+            doc_id: Document ID
+            doc_meta: Document metadata with indexer keys (title, authors, ...)
+
+        Returns:
+            Names of the fields that changed (empty if none), or None if the
+            document is not indexed
+        """
+        current = self.documents.get(doc_id)
+        if current is None:
+            return None
+
+        changed = {}
+        for col, key in DOC_FIELDS.items():
+            if col not in doc_meta:
+                continue
+            value = doc_meta[col] or (0 if col == "year" else "")
+            if value != current[key]:
+                changed[col] = value
+        if not changed:
+            return []
+
+        self.documents.update(doc_id, changed)
+        if "year" in changed:
+            ids = self.collection.get(where={"doc_id": {"$eq": doc_id}}, include=[])["ids"]
+            if ids:
+                self.collection.update(ids=ids, metadatas=[{"year": changed["year"]}] * len(ids))
+        return sorted(changed)
+
     def get_document_meta(self, doc_id: str) -> dict | None:
-        """Get metadata for a document's first chunk.
+        """Get document-level metadata (single-row sidecar lookup).
 
         Useful for checking stored metadata (e.g., pdf_hash) without
-        loading full document content.
+        loading any chunks.
 
         Args:
             doc_id: Document ID to look up
 
         Returns:
-            Metadata dict from first chunk, or None if not found
+            Dict with doc_id, doc_title, authors, year, doi, tags,
+            collections, journal_quartile, pdf_hash, quality_grade, ...,
+            or None if not found
         """
-        results = self.collection.get(
-            where={"doc_id": {"$eq": doc_id}},
-            limit=1,
-            include=["metadatas"]
-        )
-        if results["metadatas"]:
-            return results["metadatas"][0]
-        return None
+        meta = self.documents.get(doc_id)
+        if meta is None:
+            return None
+        return {"doc_id": doc_id, **meta}
@@ -0,0 +1,156 @@
+"""Watch mode: keep the index in step with the Zotero library.
+
+``deep-zotero-index --watch`` runs an incremental change-feed index
+(``Indexer.index_all(changed_only=True)``) whenever Zotero touches its
+database or adds an attachment folder under ``storage/``.
+
+Change detection compares a cheap snapshot (size and mtime of
+``zotero.sqlite``, its ``-wal``/``-journal`` files and the ``storage/``
+directory).  When the optional ``watchdog`` package is installed,
+filesystem events wake the loop immediately; otherwise the snapshot is
+polled every ``poll_interval`` seconds.  Either way, a detected change
+is debounced until the library has been quiet for ``debounce`` seconds,
+so an import that writes the database many times (or a PDF that is
+still being copied) triggers one run.  Only one index run is in flight
+at a time; changes made during a run are picked up by the next one.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+_DB_FILES = ("zotero.sqlite", "zotero.sqlite-wal", "zotero.sqlite-journal")
+
+
+class LibraryWatcher:
+    """Re-runs change-feed indexing whenever the Zotero library changes.
+
+    Args:
+        indexer: Indexer whose index_all(changed_only=True) is called per run.
+        data_dir: Zotero data directory (contains zotero.sqlite and storage/).
+        poll_interval: Seconds between snapshot checks.
+        debounce: Seconds the library must stay unchanged before a run.
+        max_settle: Upper bound on debouncing, so a library that never goes
+            quiet is still indexed (default: 6 x debounce).
+        streaming: Passed through to index_all.
+    """
+
+    def __init__(
+        self,
+        indexer,
+        data_dir: Path,
+        poll_interval: float = 5.0,
+        debounce: float = 10.0,
+        max_settle: float | None = None,
+        streaming: bool = False,
+    ):
+        self.indexer = indexer
+        self.data_dir = Path(data_dir)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.max_settle = max_settle if max_settle is not None else 6 * debounce
+        self.streaming = streaming
+        self.runs = 0
+        self._wake = threading.Event()
+
+    def snapshot(self) -> tuple:
+        """(size, mtime_ns) of the database files and the storage directory."""
+        state = []
+        for path in [self.data_dir / name for name in _DB_FILES] + [self.data_dir / "storage"]:
+            try:
+                st = path.stat()
+                state.append((st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                state.append(None)
+        return tuple(state)
+
+    def run_once(self) -> dict | None:
+        """Run one change-feed index pass; errors are logged, not raised."""
+        self.runs += 1
+        started = time.monotonic()
+        try:
+            result = self.indexer.index_all(changed_only=True, streaming=self.streaming)
+        except Exception:
+            logger.exception("Watch: indexing run failed; will retry on the next change")
+            return None
+        logger.info(
+            f"Watch: run {self.runs} done in {time.monotonic() - started:.1f}s — "
+            f"{result['indexed']} indexed, {result['failed']} failed, "
+            f"{result.get('removed', 0)} removed, {result.get('metadata_updated', 0)} metadata synced"
+        )
+        return result
+
+    def _wait(self, stop: threading.Event, timeout: float) -> None:
+        """Sleep up to timeout, waking early on a filesystem event or stop."""
+        deadline = time.monotonic() + timeout
+        while not stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._wake.wait(min(remaining, 0.5)):
+                break
+        self._wake.clear()
+
+    def _settle(self, stop: threading.Event, state: tuple) -> tuple:
+        """Wait until the snapshot stops changing for `debounce` seconds."""
+        started = time.monotonic()
+        while not stop.is_set() and time.monotonic() - started < self.max_settle:
+            stop.wait(self.debounce)
+            current = self.snapshot()
+            if current == state:
+                break
+            state = current
+        return state
+
+    def _start_observer(self):
+        if Observer is None:
+            logger.info(f"Watch: polling every {self.poll_interval:g}s (install watchdog for filesystem events)")
+            return None
+        wake = self._wake
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+
+        observer = Observer()
+        # Non-recursive: new attachments appear as new storage/<key>/ folders,
+        # and one watch per attachment folder would exhaust inotify limits.
+        observer.schedule(_Handler(), str(self.data_dir), recursive=False)
+        if (self.data_dir / "storage").is_dir():
+            observer.schedule(_Handler(), str(self.data_dir / "storage"), recursive=False)
+        observer.daemon = True
+        observer.start()
+        logger.info(f"Watch: using filesystem events on {self.data_dir}")
+        return observer
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Index once, then keep indexing changes until `stop` is set."""
+        stop = stop or threading.Event()
+        observer = self._start_observer()
+        try:
+            state = self.snapshot()
+            self.run_once()
+            while not stop.is_set():
+                self._wait(stop, self.poll_interval)
+                if stop.is_set():
+                    break
+                current = self.snapshot()
+                if current == state:
+                    continue
+                logger.debug("Watch: change detected, waiting for Zotero to settle")
+                state = self._settle(stop, current)
+                if stop.is_set():
+                    break
+                self.run_once()
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join(timeout=5)
@@ -1,7 +1,8 @@
 """Zotero SQLite database client."""
 import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
-from .models import ZoteroItem
+from .models import ZoteroChangeSet, ZoteroItem
 
 
 class ZoteroClient:
@@ -14,7 +15,9 @@ class ZoteroClient:
     - Attachments: linkMode 0,1,4 = storage/{key}/, linkMode 2 = linked file
     """
 
-    # Combined query: items with PDFs and all metadata
+    # Combined query: items with PDFs and all metadata. {item_filter} narrows
+    # base_items (e.g. to changed itemIDs); the aggregate CTEs only visit
+    # rows of base_items, so a narrow filter keeps the whole query cheap.
     ITEMS_WITH_PDFS_SQL = """
     WITH
         base_items AS (
@@ -22,6 +25,7 @@ class ZoteroClient:
             FROM items
             WHERE items.itemTypeID NOT IN (1, 14)
               AND items.itemID NOT IN (SELECT itemID FROM deletedItems)
+              {item_filter}
         ),
         titles AS (
             SELECT itemData.itemID, itemDataValues.value AS title
@@ -29,6 +33,7 @@ class ZoteroClient:
             JOIN itemDataValues ON itemData.valueID = itemDataValues.valueID
             JOIN fields ON itemData.fieldID = fields.fieldID
             WHERE fields.fieldName = 'title'
+              AND itemData.itemID IN (SELECT itemID FROM base_items)
         ),
         years AS (
             SELECT itemData.itemID, CAST(substr(itemDataValues.value, 1, 4) AS INTEGER) AS year
@@ -36,6 +41,7 @@ class ZoteroClient:
             JOIN itemDataValues ON itemData.valueID = itemDataValues.valueID
             JOIN fields ON itemData.fieldID = fields.fieldID
             WHERE fields.fieldName = 'date'
+              AND itemData.itemID IN (SELECT itemID FROM base_items)
         ),
         authors AS (
             SELECT
@@ -52,6 +58,7 @@ class ZoteroClient:
             FROM items
             JOIN itemCreators ON items.itemID = itemCreators.itemID
             JOIN creators ON itemCreators.creatorID = creators.creatorID
+            WHERE items.itemID IN (SELECT itemID FROM base_items)
             GROUP BY items.itemID
         ),
         publications AS (
@@ -60,6 +67,7 @@ class ZoteroClient:
             JOIN itemDataValues ON itemData.valueID = itemDataValues.valueID
             JOIN fields ON itemData.fieldID = fields.fieldID
             WHERE fields.fieldName = 'publicationTitle'
+              AND itemData.itemID IN (SELECT itemID FROM base_items)
         ),
         dois AS (
             SELECT itemData.itemID, itemDataValues.value AS doi
@@ -67,12 +75,14 @@ class ZoteroClient:
             JOIN itemDataValues ON itemData.valueID = itemDataValues.valueID
             JOIN fields ON itemData.fieldID = fields.fieldID
             WHERE fields.fieldName = 'DOI'
+              AND itemData.itemID IN (SELECT itemID FROM base_items)
         ),
         item_tags AS (
             SELECT items.itemID, GROUP_CONCAT(tags.name, '; ') AS tags
             FROM items
             JOIN itemTags ON items.itemID = itemTags.itemID
             JOIN tags ON itemTags.tagID = tags.tagID
+            WHERE items.itemID IN (SELECT itemID FROM base_items)
             GROUP BY items.itemID
         ),
         item_collections AS (
@@ -80,6 +90,7 @@ class ZoteroClient:
             FROM items
             JOIN collectionItems ci ON items.itemID = ci.itemID
             JOIN collections c ON ci.collectionID = c.collectionID
+            WHERE items.itemID IN (SELECT itemID FROM base_items)
             GROUP BY items.itemID
         ),
         pdfs AS (
@@ -162,17 +173,14 @@ class ZoteroClient:
 
         return None
 
-    def get_all_items_with_pdfs(self) -> list[ZoteroItem]:
-        """Get all Zotero items that have PDF attachments."""
+    def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(f"file:{self.db_path}?mode=ro&immutable=1", uri=True)
         conn.row_factory = sqlite3.Row
+        return conn
 
-        try:
-            cursor = conn.execute(self.ITEMS_WITH_PDFS_SQL)
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
-
+    def _query_items(self, conn: sqlite3.Connection, item_filter: str = "", params=()) -> list[ZoteroItem]:
+        """Run ITEMS_WITH_PDFS_SQL with an optional base_items filter."""
+        rows = conn.execute(self.ITEMS_WITH_PDFS_SQL.format(item_filter=item_filter), params).fetchall()
         citation_keys = self._load_citation_keys()
 
         items = []
@@ -198,6 +206,118 @@ class ZoteroClient:
 
         return items
 
+    def get_all_items_with_pdfs(self) -> list[ZoteroItem]:
+        """Get all Zotero items that have PDF attachments."""
+        conn = self._connect()
+        try:
+            return self._query_items(conn)
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Change feed
+    # =========================================================================
+
+    @staticmethod
+    def _tables(conn: sqlite3.Connection) -> set[str]:
+        return {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    @staticmethod
+    def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
+        return {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+
+    def _modified_column(self, conn: sqlite3.Connection) -> str:
+        """Local modification timestamp of items.
+
+        ``clientDateModified`` changes on every local edit, including tag and
+        collection changes; ``dateModified`` (the fallback for old or minimal
+        schemas) only on some field edits. ``items.version`` is not usable
+        here because it only advances when Zotero syncs with the server.
+        """
+        return "clientDateModified" if "clientDateModified" in self._columns(conn, "items") else "dateModified"
+
+    def _high_water_mark(self, conn: sqlite3.Connection) -> str:
+        """Newest change timestamp anywhere in the library ('' if none)."""
+        col = self._modified_column(conn)
+        tables = self._tables(conn)
+        stamps = [f"SELECT MAX({col}) FROM items"]
+        if "collections" in tables and "clientDateModified" in self._columns(conn, "collections"):
+            stamps.append("SELECT MAX(clientDateModified) FROM collections")
+        if "deletedItems" in tables and "dateDeleted" in self._columns(conn, "deletedItems"):
+            stamps.append("SELECT MAX(dateDeleted) FROM deletedItems")
+        if "syncDeleteLog" in tables:
+            stamps.append("SELECT MAX(dateDeleted) FROM syncDeleteLog")
+        values = [conn.execute(sql).fetchone()[0] for sql in stamps]
+        return max((v for v in values if v), default="")
+
+    def get_change_marker(self) -> str:
+        """Current high-water mark, to pass as ``since`` to get_changed_items."""
+        conn = self._connect()
+        try:
+            return self._high_water_mark(conn)
+        finally:
+            conn.close()
+
+    def get_changed_items(self, since: str, also_keys: Iterable[str] = ()) -> ZoteroChangeSet:
+        """Items with PDFs touched at or after ``since``, plus removed item keys.
+
+        An item counts as changed if it, one of its attachments, or one of
+        its collections was modified. Comparison is inclusive, so edits made
+        in the same second as the previous marker are never missed; those
+        items are simply checked again.
+
+        Args:
+            since: Marker from a previous get_change_marker()/get_changed_items().
+            also_keys: Extra item keys to return regardless of timestamps
+                (e.g. items that failed to index last time).
+
+        Returns:
+            ZoteroChangeSet with the changed items, the keys of items moved
+            to the trash or erased, and the new high-water mark.
+        """
+        also_keys = list(dict.fromkeys(also_keys))
+        conn = self._connect()
+        try:
+            col = self._modified_column(conn)
+            tables = self._tables(conn)
+            changed_sql = [
+                f"SELECT itemID FROM items WHERE {col} >= ?",
+                f"""SELECT ia.parentItemID FROM itemAttachments ia
+                    JOIN items ON ia.itemID = items.itemID
+                    WHERE ia.parentItemID IS NOT NULL AND items.{col} >= ?""",
+            ]
+            params: list = [since, since]
+            if "collections" in tables and "clientDateModified" in self._columns(conn, "collections"):
+                changed_sql.append(
+                    """SELECT ci.itemID FROM collectionItems ci
+                       JOIN collections c ON ci.collectionID = c.collectionID
+                       WHERE c.clientDateModified >= ?""")
+                params.append(since)
+            if also_keys:
+                changed_sql.append(f'SELECT itemID FROM items WHERE "key" IN ({",".join("?" * len(also_keys))})')
+                params.extend(also_keys)
+            items = self._query_items(
+                conn, f"AND items.itemID IN ({' UNION '.join(changed_sql)})", params,
+            )
+
+            removed: set[str] = set()
+            if "deletedItems" in tables and "dateDeleted" in self._columns(conn, "deletedItems"):
+                removed.update(r[0] for r in conn.execute(
+                    """SELECT items."key" FROM deletedItems
+                       JOIN items ON deletedItems.itemID = items.itemID
+                       WHERE deletedItems.dateDeleted >= ?""", (since,)))
+            if "syncDeleteLog" in tables and "syncObjectTypes" in tables:
+                removed.update(r[0] for r in conn.execute(
+                    """SELECT l."key" FROM syncDeleteLog l
+                       JOIN syncObjectTypes t ON l.syncObjectTypeID = t.syncObjectTypeID
+                       WHERE t.name = 'item' AND l.dateDeleted >= ?""", (since,)))
+            marker = self._high_water_mark(conn)
+        finally:
+            conn.close()
+
+        removed -= {item.item_key for item in items}
+        return ZoteroChangeSet(items=items, removed_keys=sorted(removed), marker=max(marker, since))
+
     def get_library_diagnostics(self) -> dict:
         """
         Return a breakdown of why items are/aren't indexable.
@@ -307,13 +427,12 @@ class ZoteroClient:
 
     def get_item(self, item_key: str) -> ZoteroItem | None:
         """Get a specific item by key."""
-        # For now, just filter from all items
-        # Could optimize with a WHERE clause if needed
-        all_items = self.get_all_items_with_pdfs()
-        for item in all_items:
-            if item.item_key == item_key:
-                return item
-        return None
+        conn = self._connect()
+        try:
+            items = self._query_items(conn, 'AND items."key" = ?', (item_key,))
+        finally:
+            conn.close()
+        return items[0] if items else None
 
     # =========================================================================
     # Boolean Full-Text Search (Feature 3)
@@ -0,0 +1,147 @@
+"""
+BENCHMARK: vision image payload optimization (ImageOptions).
+
+Renders every table crop that extract_document would send to the vision
+API, plus the full-page fallback image of each table page (vision waves
+2/3), under several encoding profiles and reports, per profile:
+
+  bytes    base64 payload size, as embedded in the batch request
+  tokens   estimated image input tokens after the API's resize
+           (long edge <= 1568 px, <= ~1.15 MP; tokens = w * h / 750)
+
+With --api, table crops are also transcribed under each profile through
+the Anthropic Batch API (this costs money) and parse success is reported.
+
+Usage:
+    python tests/benchmark_image_payload.py [PDF ...] [--api]
+
+Defaults to the PDFs in tests/fixtures/papers.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import math
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pymupdf
+from PIL import Image
+
+from deep_zotero.feature_extraction.image_optimizer import ImageOptions
+from deep_zotero.feature_extraction.vision_api import TableVisionSpec, _encode_table_images
+from deep_zotero.pdf_processor import extract_document
+
+FIXTURES = Path(__file__).parent / "fixtures" / "papers"
+
+PROFILES: dict[str, ImageOptions] = {
+    "png (baseline)": ImageOptions(),
+    "gray png": ImageOptions(grayscale=True),
+    "gray png 16c": ImageOptions(grayscale=True, colors=16),
+    "gray png 16c trim": ImageOptions(grayscale=True, colors=16, trim_whitespace=True),
+    "gray jpeg q80": ImageOptions(grayscale=True, format="jpeg", quality=80, trim_whitespace=True),
+    "gray webp q80": ImageOptions(grayscale=True, format="webp", quality=80, trim_whitespace=True),
+}
+
+
+def _estimate_tokens(b64: str) -> int:
+    """Image input tokens after the Anthropic API's downscaling."""
+    w, h = Image.open(io.BytesIO(base64.b64decode(b64))).size
+    scale = min(1.0, 1568 / max(w, h), math.sqrt(1_150_000 / (w * h)))
+    return round(w * h * scale * scale / 750)
+
+
+def _collect_specs(pdf: Path) -> tuple[list[TableVisionSpec], list[TableVisionSpec]]:
+    """(table crop specs, full-page fallback specs) for one PDF."""
+    extraction = extract_document(pdf, collect_vision_specs=True)
+    crops = list(extraction.pending_vision.specs) if extraction.pending_vision else []
+    full_pages: list[TableVisionSpec] = []
+    doc = pymupdf.open(str(pdf))
+    try:
+        for page_num in sorted({s.page_num for s in crops}):
+            r = doc[page_num - 1].rect
+            full_pages.append(TableVisionSpec(
+                table_id=f"fullpage_p{page_num}", pdf_path=pdf, page_num=page_num,
+                bbox=(r.x0, r.y0, r.x1, r.y1), raw_text="",
+            ))
+    finally:
+        doc.close()
+    return crops, full_pages
+
+
+def _measure(specs: list[TableVisionSpec], options: ImageOptions) -> tuple[int, int]:
+    n_bytes = n_tokens = 0
+    docs: dict[Path, pymupdf.Document] = {}
+    try:
+        for spec in specs:
+            doc = docs.setdefault(spec.pdf_path, pymupdf.open(str(spec.pdf_path)))
+            for b64, _media_type in _encode_table_images(doc, spec, options):
+                n_bytes += len(b64)
+                n_tokens += _estimate_tokens(b64)
+    finally:
+        for doc in docs.values():
+            doc.close()
+    return n_bytes, n_tokens
+
+
+def _parse_success(specs: list[TableVisionSpec], options: ImageOptions) -> str:
+    from deep_zotero.feature_extraction.vision_api import VisionAPI
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = VisionAPI(
+            api_key=os.environ["ANTHROPIC_API_KEY"],
+            cost_log_path=Path(tmp) / "costs.jsonl",
+            image_options=options,
+        )
+        responses = api.extract_tables_batch(specs)
+        ok = sum(1 for r in responses if r.parse_success and (r.headers or r.rows))
+        return f"{ok}/{len(responses)} (${api.session_cost:.3f})"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("pdfs", nargs="*", type=Path)
+    parser.add_argument("--api", action="store_true", help="measure parse success (paid API calls)")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(FIXTURES.glob("*.pdf"))
+    if not pdfs:
+        print("No PDFs given and no fixtures found", file=sys.stderr)
+        return 1
+    if args.api and not os.environ.get("ANTHROPIC_API_KEY"):
+        print("--api needs ANTHROPIC_API_KEY", file=sys.stderr)
+        return 1
+
+    crops: list[TableVisionSpec] = []
+    full_pages: list[TableVisionSpec] = []
+    for pdf in pdfs:
+        c, f = _collect_specs(pdf)
+        crops += c
+        full_pages += f
+    print(f"{len(pdfs)} PDFs: {len(crops)} table crops, {len(full_pages)} full-page fallbacks\n")
+
+    header = f"{'profile':<20} {'crop KB':>9} {'crop tok':>9} {'page KB':>9} {'page tok':>9} {'KB vs png':>10}"
+    if args.api:
+        header += f" {'parsed':>16}"
+    print(header)
+    base_total = None
+    for name, options in PROFILES.items():
+        crop_bytes, crop_tokens = _measure(crops, options)
+        page_bytes, page_tokens = _measure(full_pages, options)
+        total = crop_bytes + page_bytes
+        base_total = base_total or total
+        line = (
+            f"{name:<20} {crop_bytes / 1024:>9.0f} {crop_tokens:>9} "
+            f"{page_bytes / 1024:>9.0f} {page_tokens:>9} {total / base_total:>9.0%}"
+        )
+        if args.api:
+            line += f" {_parse_success(crops, options):>16}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
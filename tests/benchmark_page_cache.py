@@ -0,0 +1,126 @@
+"""
+BENCHMARK: per-document page text cache (PageTextCache).
+
+Times the text-analysis stages of extract_document that run after layout
+analysis — abstract detection, per-page caption scanning, orphan recovery,
+stats and completeness grading — twice per PDF:
+
+  uncached  each stage gets its own PageTextCache, reproducing the old
+            behaviour where every stage re-parsed the pages it touched
+  shared    one PageTextCache is passed through all stages, as
+            extract_document does
+
+and reports the number of page parses and wall time for each.
+
+Usage:
+    python tests/benchmark_page_cache.py [PDF ...] [--repeat N]
+
+Defaults to the PDFs in tests/fixtures/papers.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pymupdf
+
+from deep_zotero.feature_extraction.captions import PageTextCache
+from deep_zotero.models import ExtractedFigure, PageExtraction
+from deep_zotero.orphan_recovery import run_recovery
+from deep_zotero.pdf_processor import (
+    _compute_completeness,
+    _compute_stats,
+    _detect_abstract,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "papers"
+
+
+class _CountingCache(PageTextCache):
+    """PageTextCache that counts cache misses (actual page parses)."""
+
+    def __init__(self, doc, counter: list[int]):
+        super().__init__(doc)
+        self._counter = counter
+
+    def text_dict(self, page_idx: int) -> dict:
+        if page_idx not in self._dicts:
+            self._counter[0] += 1
+        return super().text_dict(page_idx)
+
+    def text(self, page_idx: int) -> str:
+        if page_idx not in self._texts:
+            self._counter[0] += 1
+        return super().text(page_idx)
+
+
+def _run_stages(doc: pymupdf.Document, shared: bool) -> int:
+    """Run the cached stages once; return the number of page parses."""
+    parses = [0]
+    shared_cache = _CountingCache(doc, parses)
+
+    def cache() -> PageTextCache:
+        return shared_cache if shared else _CountingCache(doc, parses)
+
+    pages = [
+        PageExtraction(page_num=i + 1, markdown=doc[i].get_text(), char_start=0)
+        for i in range(len(doc))
+    ]
+    _detect_abstract(pages, "", doc, [], page_cache=cache())
+
+    per_page = cache()
+    figures: list[ExtractedFigure] = []
+    for i in range(len(doc)):
+        for cap in per_page.captions(i):
+            if cap.caption_type == "figure":
+                # Orphan every figure so recovery scans the whole document
+                figures.append(ExtractedFigure(
+                    page_num=i + 1, figure_index=len(figures),
+                    bbox=cap.bbox, caption=None,
+                ))
+
+    run_recovery(doc, figures, [], [], page_cache=cache())
+    stats = _compute_stats(pages, [], doc, page_cache=cache())
+    _compute_completeness(doc, pages, [], [], figures, stats, page_cache=cache())
+    return parses[0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("pdfs", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(FIXTURES.glob("*.pdf"))
+    if not pdfs:
+        print("No PDFs given and no fixtures found", file=sys.stderr)
+        return 1
+
+    print(f"{'PDF':<30} {'pages':>5} {'parses':>13} {'uncached':>10} {'shared':>10} {'speedup':>8}")
+    for pdf in pdfs:
+        doc = pymupdf.open(str(pdf))
+        try:
+            timings: dict[bool, float] = {}
+            parses: dict[bool, int] = {}
+            for shared in (False, True):
+                best = float("inf")
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    parses[shared] = _run_stages(doc, shared)
+                    best = min(best, time.perf_counter() - t0)
+                timings[shared] = best
+            print(
+                f"{pdf.name[:30]:<30} {len(doc):>5} "
+                f"{parses[False]:>6} -> {parses[True]:<4} "
+                f"{timings[False] * 1000:>8.0f}ms {timings[True] * 1000:>8.0f}ms "
+                f"{timings[False] / timings[True]:>7.2f}x"
+            )
+        finally:
+            doc.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
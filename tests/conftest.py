@@ -232,6 +232,83 @@ def mock_config(temp_db_path: Path, tmp_path: Path):
     )
 
 
+@pytest.fixture
+def make_config(tmp_path: Path):
+    """Factory for an indexer configuration rooted at tmp_path.
+
+    Keyword arguments override individual Config fields. The extraction
+    cache is off unless a test asks for it.
+    """
+    from deep_zotero.config import Config
+
+    def _make(**overrides) -> Config:
+        chroma_dir = tmp_path / "chroma"
+        chroma_dir.mkdir(exist_ok=True)
+        fields = dict(
+            zotero_data_dir=tmp_path,
+            chroma_db_path=chroma_dir,
+            embedding_model="gemini-embedding-001",
+            embedding_dimensions=768,
+            chunk_size=400,
+            chunk_overlap=100,
+            gemini_api_key=None,
+            embedding_provider="local",
+            embedding_timeout=120.0,
+            embedding_max_retries=3,
+            rerank_alpha=0.7,
+            rerank_section_weights=None,
+            rerank_journal_weights=None,
+            rerank_enabled=True,
+            oversample_multiplier=3,
+            oversample_topic_factor=5,
+            stats_sample_limit=10000,
+            ocr_language="eng",
+            openalex_email=None,
+            vision_enabled=False,
+            vision_model="claude-haiku-4-5-20251001",
+            anthropic_api_key=None,
+            extraction_cache_enabled=False,
+        )
+        fields.update(overrides)
+        return Config(**fields)
+
+    return _make
+
+
+# =============================================================================
+# Indexer fixtures
+# =============================================================================
+
+@pytest.fixture
+def make_indexer():
+    """Factory for an Indexer over the given Zotero items.
+
+    Zotero and the journal ranker are mocked. The vector store is a
+    MagicMock reporting ``indexed`` as already indexed, unless an
+    ``embedder`` is passed, in which case a real store is built with it.
+    """
+    from unittest.mock import MagicMock, patch
+
+    def _make(config, items, indexed=(), embedder=None):
+        with patch("deep_zotero.indexer.ZoteroClient") as mock_zotero, \
+             patch("deep_zotero.indexer.create_embedder", return_value=embedder), \
+             patch("deep_zotero.indexer.JournalRanker") as mock_ranker:
+            mock_zotero.return_value.get_all_items_with_pdfs.return_value = items
+            mock_ranker.return_value.lookup.return_value = None
+
+            from deep_zotero.indexer import Indexer
+            if embedder is not None:
+                return Indexer(config)
+
+            store = MagicMock()
+            store.get_indexed_doc_ids.return_value = set(indexed)
+            store.get_document_meta.return_value = None
+            with patch("deep_zotero.indexer.VectorStore", return_value=store):
+                return Indexer(config)
+
+    return _make
+
+
 # =============================================================================
 # Journal ranker fixtures
 # =============================================================================
@@ -628,7 +628,7 @@ def run_stress_test(
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if api_key:
                 from deep_zotero.feature_extraction.vision_api import VisionAPI
-                vision_cost_log = test_dir / "vision_costs.json"
+                vision_cost_log = test_dir / "vision_costs.jsonl"
                 vision_api = VisionAPI(api_key=api_key, cost_log_path=vision_cost_log)
                 print(f"  Vision API enabled (model: {vision_api._model})")
             else:
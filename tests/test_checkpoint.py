@@ -0,0 +1,292 @@
+"""Tests for resumable indexing (checkpoint journal + batch resume)."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import anthropic
+import httpx
+import pytest
+
+from deep_zotero.checkpoint import IndexCheckpoint
+from deep_zotero.feature_extraction.vision_api import TableVisionSpec, VisionAPI, _batch_fingerprint
+from deep_zotero.feature_extraction.vision_cache import VisionResultCache
+from deep_zotero.models import DocumentExtraction, PageExtraction, ZoteroItem
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+
+
+def _extraction(text: str = "Some text") -> DocumentExtraction:
+    md = f"# Introduction\n\n{text} " * 40
+    return DocumentExtraction(
+        pages=[PageExtraction(page_num=1, markdown=md, char_start=0)],
+        full_markdown=md,
+        sections=[],
+        tables=[],
+        figures=[],
+        stats={"total_pages": 1, "text_pages": 1, "ocr_pages": 0, "empty_pages": 0},
+        quality_grade="A",
+    )
+
+
+
+
+def _spec(table_id: str) -> TableVisionSpec:
+    return TableVisionSpec(
+        table_id=table_id, pdf_path=Path("x.pdf"), page_num=1,
+        bbox=(0.0, 0.0, 100.0, 100.0), raw_text="a b", caption="Table 1.",
+    )
+
+
+def _make_api(journal, result_cache=None) -> VisionAPI:
+    with patch("deep_zotero.feature_extraction.vision_api.anthropic") as mock_anthropic:
+        mock_anthropic.Anthropic.return_value = MagicMock()
+        return VisionAPI(api_key="test-key", batch_journal=journal, result_cache=result_cache)
+
+
+_OK = '{"table_label": "Table 1", "caption": "", "is_incomplete": false, "incomplete_reason": "", "headers": ["a"], "rows": [["1"]], "footnotes": ""}'
+
+
+# =============================================================================
+# IndexCheckpoint
+# =============================================================================
+
+
+class TestIndexCheckpoint:
+    def test_stage_round_trip_and_staleness(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        cp.mark("AAA", "fp1", "extracted")
+        assert cp.get_stage("AAA", "fp1") == "extracted"
+        assert cp.get_stage("AAA", "fp2") is None  # PDF or settings changed
+        cp.mark("AAA", "fp1", "storing")
+        assert cp.items_in_stage("storing") == ["AAA"]
+        cp.forget(["AAA"])
+        assert cp.get_stage("AAA", "fp1") is None
+
+    def test_unknown_stage_rejected(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        with pytest.raises(ValueError):
+            cp.mark("AAA", "fp", "half-done")
+
+    def test_survives_reopen(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        cp.mark("AAA", "fp", "vision_resolved")
+        cp.record_batch("wave1", "msgbatch_1", 10)
+        cp.close()
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        assert cp.get_stage("AAA", "fp") == "vision_resolved"
+        assert cp.find_batches("wave1") == [("msgbatch_1", 10)]
+        cp.finish_batches("wave1")
+        assert cp.find_batches("wave1") == []
+
+    def test_batch_request_metadata(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        cp.record_batch("wave1", "msgbatch_1", 2, {
+            "T1__transcriber": {"spec": {"table_id": "T1"}, "cache_key": "k1"},
+            "T2__transcriber": {"spec": {"table_id": "T2"}},
+        })
+        cp.record_batch("wave2", "msgbatch_2", 1)
+        assert cp.pending_batches() == [("msgbatch_1", 2), ("msgbatch_2", 1)]
+        assert cp.batch_requests("msgbatch_1")["T1__transcriber"]["cache_key"] == "k1"
+        assert cp.batch_requests("msgbatch_2") == {}
+        cp.finish_batch("msgbatch_2")
+        cp.finish_batches("wave1")
+        assert cp.pending_batches() == []
+        assert cp.batch_requests("msgbatch_1") == {}
+
+
+# =============================================================================
+# VisionAPI batch journal
+# =============================================================================
+
+
+class TestVisionBatchJournal:
+    def test_batch_recorded_before_polling(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        api = _make_api(cp)
+        specs = [_spec("D1__p1_t0")]
+        fp = _batch_fingerprint(api._model, specs)
+
+        def poll(batch_id, expected_count, **kwargs):
+            assert cp.find_batches(fp) == [("msgbatch_new", 1)]
+            return {"D1__p1_t0__transcriber": _OK}
+
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_create_batch", return_value="msgbatch_new"), \
+             patch.object(api, "_poll_batch", side_effect=poll):
+            responses = api.extract_tables_batch(specs)
+
+        assert responses[0].parse_success
+        assert cp.find_batches(fp) == []  # collected -> forgotten
+
+    def test_journaled_batch_is_repolled_not_resubmitted(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        api = _make_api(cp)
+        specs = [_spec("D1__p1_t0"), _spec("D1__p2_t1")]
+        cp.record_batch(_batch_fingerprint(api._model, specs), "msgbatch_old", 2)
+
+        with patch.object(api, "_prepare_table") as prep, \
+             patch.object(api, "_create_batch") as create, \
+             patch.object(api, "_poll_batch", return_value={
+                 "D1__p1_t0__transcriber": _OK, "D1__p2_t1__transcriber": _OK,
+             }) as poll:
+            responses = api.extract_tables_batch(specs)
+
+        create.assert_not_called()
+        prep.assert_not_called()
+        poll.assert_called_once_with("msgbatch_old", 2)
+        assert all(r.parse_success for r in responses)
+
+    def test_unsubmitted_sub_batch_completed_on_resume(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        api = _make_api(cp)
+        specs = [_spec("D1__p1_t0"), _spec("D1__p2_t1")]
+        cp.record_batch(_batch_fingerprint(api._model, specs), "msgbatch_half", 1)
+
+        polls = {
+            "msgbatch_half": {"D1__p1_t0__transcriber": _OK},
+            "msgbatch_rest": {"D1__p2_t1__transcriber": _OK},
+        }
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]) as prep, \
+             patch.object(api, "_create_batch", return_value="msgbatch_rest") as create, \
+             patch.object(api, "_poll_batch", side_effect=lambda bid, n, **k: polls[bid]):
+            responses = api.extract_tables_batch(specs)
+
+        assert prep.call_count == 1
+        create.assert_called_once()
+        assert all(r.parse_success for r in responses)
+
+    def test_specs_and_cache_keys_journaled(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        api = _make_api(cp, VisionResultCache(tmp_path / "vc.sqlite"))
+        specs = [_spec("D1__p1_t0")]
+
+        def poll(batch_id, expected_count, **kwargs):
+            meta = cp.batch_requests(batch_id)["D1__p1_t0__transcriber"]
+            assert meta["spec"]["table_id"] == "D1__p1_t0"
+            assert meta["spec"]["pdf_path"] == "x.pdf"
+            assert len(meta["cache_key"]) == 64
+            return {"D1__p1_t0__transcriber": _OK}
+
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_create_batch", return_value="msgbatch_new"), \
+             patch.object(api, "_poll_batch", side_effect=poll):
+            api.extract_tables_batch(specs)
+        assert cp.pending_batches() == []
+
+    def test_resume_pending_batches_fills_result_cache(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        cache = VisionResultCache(tmp_path / "vc.sqlite")
+        specs = [_spec("D1__p1_t0"), _spec("D1__p2_t1")]
+
+        # First run: batch submitted, then the process dies while polling
+        api = _make_api(cp, cache)
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_create_batch", return_value="msgbatch_orphan"), \
+             patch.object(api, "_poll_batch", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                api.extract_tables_batch(specs)
+        assert cp.pending_batches() == [("msgbatch_orphan", 2)]
+
+        # Next run groups the same tables differently, so the fingerprint
+        # no longer matches; the journaled batch is still collected
+        api = _make_api(cp, cache)
+        with patch.object(api, "_poll_batch", return_value={
+            "D1__p1_t0__transcriber": _OK, "D1__p2_t1__transcriber": _OK,
+        }) as poll:
+            collected = api.resume_pending_batches()
+        poll.assert_called_once_with("msgbatch_orphan", 2)
+        assert set(collected) == {"D1__p1_t0__transcriber", "D1__p2_t1__transcriber"}
+        assert cp.pending_batches() == []
+
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_create_batch") as create:
+            responses = api.extract_tables_batch(specs[:1])
+        create.assert_not_called()
+        assert responses[0].parse_success
+
+    def test_resume_without_result_cache_leaves_journal(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        cp.record_batch("fp", "msgbatch_1", 1, {"T1__transcriber": {"spec": {}, "cache_key": "k"}})
+        api = _make_api(cp)
+        with patch.object(api, "_poll_batch") as poll:
+            assert api.resume_pending_batches() == {}
+        poll.assert_not_called()
+        assert cp.pending_batches() == [("msgbatch_1", 1)]
+
+    def test_resume_survives_retrieve_errors(self, tmp_path: Path) -> None:
+        cp = IndexCheckpoint(tmp_path / "cp.sqlite")
+        meta = {"spec": {}, "cache_key": "k"}
+        cp.record_batch("fp1", "msgbatch_gone", 1, {"T1__transcriber": meta})
+        cp.record_batch("fp2", "msgbatch_flaky", 1, {"T2__transcriber": meta})
+        api = _make_api(cp, VisionResultCache(tmp_path / "vc.sqlite"))
+
+        request = httpx.Request("GET", "https://api.anthropic.com/v1/messages/batches/x")
+        errors = {
+            "msgbatch_gone": anthropic.NotFoundError(
+                "not found", response=httpx.Response(404, request=request), body=None,
+            ),
+            "msgbatch_flaky": anthropic.APIConnectionError(request=request),
+        }
+
+        def retrieve(batch_id):
+            raise errors[batch_id]
+
+        api._client.messages.batches.retrieve.side_effect = retrieve
+        with patch("deep_zotero.feature_extraction.vision_api.time.sleep"):
+            assert api.resume_pending_batches() == {}
+        # Expired/unknown batch forgotten; transient failure retried next run
+        assert cp.pending_batches() == [("msgbatch_flaky", 1)]
+
+
+# =============================================================================
+# Indexer resume
+# =============================================================================
+
+
+class TestIndexerResume:
+    @pytest.fixture
+    def item(self, tmp_path: Path) -> ZoteroItem:
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        return ZoteroItem(item_key="AAA", title="Paper", authors="Doe, J.", year=2020, pdf_path=pdf)
+
+    def test_spooled_extraction_reused(self, tmp_path: Path, item, make_config, make_indexer) -> None:
+        indexer = make_indexer(make_config(), [item])
+        indexer._checkpoint_save(item, _extraction(), "extracted")
+
+        with patch("deep_zotero.indexer.extract_document", side_effect=AssertionError("re-extracted")):
+            result = indexer.index_all()
+
+        assert result["indexed"] == 1
+        assert indexer._checkpoint.get_stage("AAA", indexer._checkpoint_fingerprint(item)) is None
+        assert not list((tmp_path / "chroma" / "vision_spool").glob("*.pkl"))
+
+    def test_partial_store_deleted_and_redone(self, item, make_config, make_indexer) -> None:
+        indexer = make_indexer(make_config(), [item], indexed={"AAA"})
+        # A previous run died inside add_chunks for AAA
+        indexer._checkpoint_save(item, _extraction(), "vision_resolved")
+        indexer._checkpoint.mark("AAA", indexer._checkpoint_fingerprint(item), "storing")
+        # Partial chunks look "current" to the hash check
+        indexer.store.get_document_meta.return_value = {"pdf_hash": indexer._pdf_hash(item.pdf_path)}
+
+        with patch("deep_zotero.indexer.extract_document", side_effect=AssertionError("re-extracted")):
+            result = indexer.index_all()
+
+        indexer.store.delete_document.assert_called_with("AAA")
+        assert result["indexed"] == 1
+
+    def test_failed_store_left_for_next_run(self, item, make_config, make_indexer) -> None:
+        indexer = make_indexer(make_config(), [item])
+        indexer.store.add_chunks.side_effect = RuntimeError("disk full")
+
+        with patch("deep_zotero.indexer.extract_document", return_value=_extraction()):
+            result = indexer.index_all()
+
+        assert result["failed"] == 1
+        assert indexer._checkpoint.items_in_stage("storing") == ["AAA"]
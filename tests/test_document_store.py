@@ -0,0 +1,140 @@
+"""Tests for the document-level metadata sidecar."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import chromadb
+import pytest
+from chromadb.config import Settings
+
+from deep_zotero.document_store import DocumentStore
+from deep_zotero.models import Chunk
+from deep_zotero.vector_store import VectorStore
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _FakeEmbedder:
+    dimensions = 3
+
+    def embed(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        return [[1.0, float(i), 0.5] for i, _ in enumerate(texts)]
+
+    def embed_query(self, query):
+        return [1.0, 0.0, 0.5]
+
+
+_META = {
+    "title": "Heart Rate Paper",
+    "authors": "Smith, J.",
+    "year": 2020,
+    "citation_key": "smith2020",
+    "publication": "J. Physiol.",
+    "journal_quartile": "Q1",
+    "doi": "10.1/x",
+    "tags": "HRV",
+    "collections": "Thesis",
+    "pdf_hash": "abc",
+    "quality_grade": "A",
+}
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [Chunk(text=f"chunk {i}", chunk_index=i, page_num=1, char_start=0, char_end=1) for i in range(n)]
+
+
+# =============================================================================
+# DocumentStore
+# =============================================================================
+
+
+class TestDocumentStore:
+    def test_upsert_and_get_chunk_shaped(self, tmp_path: Path) -> None:
+        docs = DocumentStore(tmp_path / "documents.sqlite")
+        docs.upsert("D1", _META)
+        meta = docs.get("D1")
+        assert meta["doc_title"] == "Heart Rate Paper"
+        assert meta["authors_lower"] == "smith, j."
+        assert meta["year"] == 2020
+        assert docs.get("missing") is None
+
+    def test_none_values_stored_empty(self, tmp_path: Path) -> None:
+        docs = DocumentStore(tmp_path / "documents.sqlite")
+        docs.upsert("D1", {"title": "T", "year": None, "doi": None})
+        meta = docs.get("D1")
+        assert meta["year"] == 0 and meta["doi"] == ""
+
+    def test_count_by_and_delete(self, tmp_path: Path) -> None:
+        docs = DocumentStore(tmp_path / "documents.sqlite")
+        docs.upsert("D1", {**_META, "journal_quartile": "Q1"})
+        docs.upsert("D2", {**_META, "journal_quartile": "Q1"})
+        docs.upsert("D3", {**_META, "journal_quartile": ""})
+        assert docs.count_by("journal_quartile") == {"Q1": 2, "": 1}
+        docs.delete("D1")
+        assert docs.count() == 2
+        with pytest.raises(ValueError):
+            docs.count_by("doc_id; DROP TABLE documents")
+
+
+# =============================================================================
+# VectorStore integration
+# =============================================================================
+
+
+class TestVectorStoreJoin:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> VectorStore:
+        store = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        store.add_chunks("D1", _META, _chunks(3))
+        return store
+
+    def test_chunk_metadata_is_slim(self, store: VectorStore) -> None:
+        meta = store.collection.get(ids=["D1_chunk_0000"], include=["metadatas"])["metadatas"][0]
+        assert meta["doc_id"] == "D1" and meta["year"] == 2020
+        assert "doc_title" not in meta and "tags" not in meta and "pdf_hash" not in meta
+
+    def test_results_carry_document_fields(self, store: VectorStore) -> None:
+        hit = store.search("q", top_k=1)[0]
+        assert hit.metadata["doc_title"] == "Heart Rate Paper"
+        assert hit.metadata["journal_quartile"] == "Q1"
+        assert hit.metadata["chunk_index"] == 0
+        adjacent = store.get_adjacent_chunks("D1", 1, window=1)
+        assert all(c.metadata["citation_key"] == "smith2020" for c in adjacent)
+
+    def test_get_document_meta_does_not_touch_chunks(self, store: VectorStore) -> None:
+        with patch.object(store.collection, "get", side_effect=AssertionError("chunk scan")):
+            meta = store.get_document_meta("D1")
+        assert meta["doc_id"] == "D1" and meta["pdf_hash"] == "abc"
+
+    def test_delete_document_removes_row(self, store: VectorStore) -> None:
+        store.delete_document("D1")
+        assert store.get_document_meta("D1") is None
+
+
+class TestLegacyMigration:
+    def test_sidecar_backfilled_from_chunk_metadata(self, tmp_path: Path) -> None:
+        db = tmp_path / "chroma"
+        client = chromadb.PersistentClient(path=str(db), settings=Settings(anonymized_telemetry=False))
+        collection = client.get_or_create_collection("chunks", metadata={"hnsw:space": "cosine"})
+        legacy = {
+            "doc_title": "Old Paper", "authors": "Doe, J.", "year": 2001, "doi": "10.2/y",
+            "tags": "ECG", "collections": "", "journal_quartile": "Q2", "pdf_hash": "h1",
+            "citation_key": "", "publication": "", "quality_grade": "B",
+        }
+        collection.add(
+            ids=["OLD_chunk_0000", "OLD_chunk_0001"],
+            documents=["a", "b"],
+            embeddings=[[1.0, 0.0, 0.5], [1.0, 1.0, 0.5]],
+            metadatas=[{**legacy, "doc_id": "OLD", "chunk_index": i} for i in range(2)],
+        )
+        del client
+
+        store = VectorStore(db, _FakeEmbedder())
+        meta = store.get_document_meta("OLD")
+        assert meta["doc_title"] == "Old Paper"
+        assert meta["pdf_hash"] == "h1"
+        assert meta["journal_quartile"] == "Q2"
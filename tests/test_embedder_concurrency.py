@@ -0,0 +1,154 @@
+"""Tests for concurrent, rate-controlled Gemini embedding batches."""
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.embedder import Embedder, EmbeddingError, _TokenBucket, _is_rate_limited
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _RateLimitError(Exception):
+    code = 429
+
+
+class _FakeModels:
+    """Stand-in for genai Client.models that records concurrency."""
+
+    def __init__(self, delay: float = 0.02, failures: dict[int, list[Exception | str]] | None = None):
+        self.delay = delay
+        self.failures = failures or {}  # first text index -> queued outcomes
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def embed_content(self, model, contents, config):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            key = int(contents[0].split()[1])
+            queued = self.failures.get(key)
+            if queued:
+                outcome = queued.pop(0)
+                if outcome == "hang":
+                    time.sleep(0.5)
+                else:
+                    raise outcome
+            time.sleep(self.delay)
+            return SimpleNamespace(embeddings=[
+                SimpleNamespace(values=[float(t.split()[1]), 1.0]) for t in contents
+            ])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _make_embedder(models: _FakeModels, **kwargs) -> Embedder:
+    with patch("google.genai.Client") as mock_client:
+        mock_client.return_value = SimpleNamespace(models=models)
+        return Embedder(api_key="test", **kwargs)
+
+
+def _texts(n: int) -> list[str]:
+    return [f"text {i}" for i in range(n)]
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff():
+    with patch("deep_zotero.embedder.random.uniform", return_value=0.01):
+        yield
+
+
+# =============================================================================
+# Concurrency and ordering
+# =============================================================================
+
+
+class TestConcurrentBatches:
+    def test_order_preserved(self) -> None:
+        models = _FakeModels()
+        embedder = _make_embedder(models, max_concurrent_batches=4)
+        vectors = embedder.embed(_texts(950))
+        assert [v[0] for v in vectors] == [float(i) for i in range(950)]
+        assert models.calls == 10
+
+    def test_in_flight_bounded(self) -> None:
+        models = _FakeModels(delay=0.05)
+        embedder = _make_embedder(models, max_concurrent_batches=3)
+        embedder.embed(_texts(1000))
+        assert 1 < models.max_active <= 3
+
+    def test_stats_report_throughput(self) -> None:
+        embedder = _make_embedder(_FakeModels(), max_concurrent_batches=2)
+        embedder.embed(_texts(250))
+        stats = embedder.stats
+        assert stats["texts"] == 250
+        assert stats["batches"] == 3
+        assert stats["texts_per_sec"] > 0
+
+    def test_empty_input(self) -> None:
+        assert _make_embedder(_FakeModels()).embed([]) == []
+
+
+# =============================================================================
+# Retry, timeout and rate limiting
+# =============================================================================
+
+
+class TestRetries:
+    def test_transient_error_retried(self) -> None:
+        models = _FakeModels(failures={100: [RuntimeError("boom")]})
+        embedder = _make_embedder(models, max_retries=3)
+        vectors = embedder.embed(_texts(300))
+        assert len(vectors) == 300
+        assert models.calls == 4
+
+    def test_persistent_failure_raises_embedding_error(self) -> None:
+        models = _FakeModels(failures={0: [RuntimeError("boom")] * 5})
+        embedder = _make_embedder(models, max_retries=2)
+        with pytest.raises(EmbeddingError, match="failed after 2 attempts"):
+            embedder.embed(_texts(50))
+
+    def test_timeout_retried(self) -> None:
+        models = _FakeModels(failures={0: ["hang"]})
+        embedder = _make_embedder(models, timeout=0.1, max_retries=3)
+        vectors = embedder.embed(_texts(10))
+        assert len(vectors) == 10
+        assert models.calls == 2
+
+    def test_rate_limit_halves_concurrency_without_using_attempts(self) -> None:
+        # Three 429s would exhaust max_retries=2 if they counted as failures
+        models = _FakeModels(failures={0: [_RateLimitError("429 RESOURCE_EXHAUSTED")] * 3})
+        embedder = _make_embedder(models, max_concurrent_batches=4, max_retries=2)
+        vectors = embedder.embed(_texts(400))
+        assert len(vectors) == 400
+        assert embedder.stats["throttled"] == 3
+
+    def test_rate_limit_detection(self) -> None:
+        assert _is_rate_limited(_RateLimitError("x"))
+        assert _is_rate_limited(RuntimeError("429 Too Many Requests"))
+        assert not _is_rate_limited(RuntimeError("500 Internal"))
+        assert _is_rate_limited(RuntimeError("Quota exceeded: RESOURCE_EXHAUSTED"))
+        assert not _is_rate_limited(RuntimeError("Embedded 1429 of 2000 texts before timeout"))
+        assert not _is_rate_limited(RuntimeError("500 Internal: bad chunk id 429"))
+
+
+class TestTokenBucket:
+    def test_limits_rate(self) -> None:
+        bucket = _TokenBucket(rate=50.0, capacity=1)
+        t0 = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        # First token is free, the other five need 1/50 s each
+        assert time.monotonic() - t0 >= 0.09
@@ -0,0 +1,115 @@
+"""Tests for the persistent content-hash embedding cache."""
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from deep_zotero.embedder import Embedder
+from deep_zotero.embedding_cache import EmbeddingCache
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _CountingCompute:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+_NS = EmbeddingCache.namespace("gemini", "gemini-embedding-001", 768, "RETRIEVAL_DOCUMENT")
+
+
+# =============================================================================
+# EmbeddingCache
+# =============================================================================
+
+
+class TestEmbeddingCache:
+    def test_misses_computed_once_hits_reused(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(tmp_path / "emb.sqlite")
+        compute = _CountingCompute()
+
+        first = cache.get_or_compute(_NS, ["a", "bb", "a"], compute)
+        assert compute.calls == [["a", "bb"]]  # duplicates embedded once
+        assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+
+        second = cache.get_or_compute(_NS, ["bb", "ccc"], compute)
+        assert compute.calls[-1] == ["ccc"]
+        assert second == [[2.0, 0.5], [3.0, 0.5]]
+        stats = cache.stats()
+        assert stats["entries"] == 3
+        assert stats["hits"] == 1
+        assert stats["misses"] == 4
+
+    def test_all_hits_skip_compute(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(tmp_path / "emb.sqlite")
+        cache.get_or_compute(_NS, ["x"], _CountingCompute())
+        compute = _CountingCompute()
+        assert cache.get_or_compute(_NS, ["x", "x"], compute) == [[1.0, 0.5]] * 2
+        assert compute.calls == []
+
+    def test_namespace_isolates_models_and_task_types(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(tmp_path / "emb.sqlite")
+        cache.get_or_compute(_NS, ["x"], _CountingCompute())
+        for other in (
+            EmbeddingCache.namespace("gemini", "gemini-embedding-001", 768, "RETRIEVAL_QUERY"),
+            EmbeddingCache.namespace("gemini", "gemini-embedding-001", 1536, "RETRIEVAL_DOCUMENT"),
+            EmbeddingCache.namespace("local", "all-MiniLM-L6-v2", 384, "symmetric"),
+        ):
+            compute = _CountingCompute()
+            cache.get_or_compute(other, ["x"], compute)
+            assert compute.calls == [["x"]]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        EmbeddingCache(tmp_path / "emb.sqlite").get_or_compute(_NS, ["x"], _CountingCompute())
+        compute = _CountingCompute()
+        EmbeddingCache(tmp_path / "emb.sqlite").get_or_compute(_NS, ["x"], compute)
+        assert compute.calls == []
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(tmp_path / "emb.sqlite", max_entries=2)
+        with patch("deep_zotero.embedding_cache.time.time", side_effect=itertools.count(1.0)):
+            cache.get_or_compute(_NS, ["old"], _CountingCompute())   # get@1, put@2
+            cache.get_or_compute(_NS, ["mid"], _CountingCompute())   # get@3, put@4
+            cache.get_or_compute(_NS, ["old"], _CountingCompute())   # hit, touched@5
+            cache.get_or_compute(_NS, ["new"], _CountingCompute())   # put@7 evicts "mid"
+        assert cache.stats()["entries"] == 2
+        compute = _CountingCompute()
+        cache.get_or_compute(_NS, ["old", "new", "mid"], compute)
+        assert compute.calls == [["mid"]]
+
+
+# =============================================================================
+# Embedder integration
+# =============================================================================
+
+
+class TestEmbedderUsesCache:
+    def test_only_uncached_texts_sent_to_api(self, tmp_path: Path) -> None:
+        sent: list[list[str]] = []
+
+        def embed_content(model, contents, config):
+            sent.append(list(contents))
+            return SimpleNamespace(embeddings=[SimpleNamespace(values=[float(len(t))]) for t in contents])
+
+        with patch("google.genai.Client") as mock_client:
+            mock_client.return_value = SimpleNamespace(models=SimpleNamespace(embed_content=embed_content))
+            embedder = Embedder(api_key="test")
+        embedder.cache = EmbeddingCache(tmp_path / "emb.sqlite")
+
+        embedder.embed(["one", "three"])
+        vectors = embedder.embed(["three", "fourth"])
+
+        assert sent == [["one", "three"], ["fourth"]]
+        assert vectors == [[5.0], [6.0]]
+        # Queries use a different task type, so the document vector is not reused
+        embedder.embed_query("one")
+        assert sent[-1] == ["one"]
@@ -0,0 +1,141 @@
+"""Tests for the content-addressed extraction cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.extraction_cache import ExtractionCache, file_hash
+from deep_zotero.models import DocumentExtraction, PageExtraction, ZoteroItem
+from deep_zotero.pdf_processor import PendingVisionWork
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _extraction(text: str = "Some text") -> DocumentExtraction:
+    md = f"# Introduction\n\n{text} " * 40
+    return DocumentExtraction(
+        pages=[PageExtraction(page_num=1, markdown=md, char_start=0)],
+        full_markdown=md,
+        sections=[],
+        tables=[],
+        figures=[],
+        stats={"total_pages": 1, "text_pages": 1, "ocr_pages": 0, "empty_pages": 0},
+        quality_grade="A",
+    )
+
+
+
+
+# =============================================================================
+# ExtractionCache
+# =============================================================================
+
+
+class TestExtractionCache:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=10**9)
+        cache.put("k1", _extraction("Alpha"))
+        loaded = cache.get("k1")
+        assert loaded is not None
+        assert loaded.full_markdown == _extraction("Alpha").full_markdown
+        assert cache.get("missing") is None
+
+    def test_key_depends_on_version_and_options(self) -> None:
+        base = dict(extractor_version=1, ocr_language="eng", vision="")
+        k = ExtractionCache.make_key("abc", **base)
+        assert k == ExtractionCache.make_key("abc", **base)
+        assert k != ExtractionCache.make_key("abd", **base)
+        assert k != ExtractionCache.make_key("abc", **{**base, "extractor_version": 2})
+        assert k != ExtractionCache.make_key("abc", **{**base, "ocr_language": "deu"})
+        assert k != ExtractionCache.make_key("abc", **{**base, "vision": "claude-haiku-4-5-20251001"})
+
+    def test_pending_vision_rejected(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=10**9)
+        ext = _extraction()
+        ext.pending_vision = PendingVisionWork(specs=[], crop_infos=[], pdf_path=Path("x.pdf"))
+        with pytest.raises(ValueError):
+            cache.put("k", ext)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=10**9)
+        (tmp_path / "cache" / "bad.pkl").write_bytes(b"garbage")
+        assert cache.get("bad") is None
+        assert not (tmp_path / "cache" / "bad.pkl").exists()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=10**9)
+        for n, key in enumerate(("old", "mid", "new")):
+            cache.put(key, _extraction(key))
+            os.utime(tmp_path / "cache" / f"{key}.pkl", (1000 + n, 1000 + n))
+        cache.get("old")  # touch: now most recently used
+        entry_size = (tmp_path / "cache" / "mid.pkl").stat().st_size
+
+        removed, freed = cache.prune(int(entry_size * 2.5))
+        assert removed == 1 and freed > 0
+        assert cache.get("mid") is None
+        assert cache.get("old") is not None
+        assert cache.get("new") is not None
+
+    def test_prune_to_zero_clears(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=10**9)
+        cache.put("a", _extraction())
+        cache.put("b", _extraction())
+        cache.prune(0)
+        assert cache.stats() == {"entries": 0, "bytes": 0}
+
+    def test_put_scans_only_over_limit(self, tmp_path: Path) -> None:
+        ExtractionCache(tmp_path / "cache", max_bytes=10**9).put("seed", _extraction())
+        entry_size = (tmp_path / "cache" / "seed.pkl").stat().st_size
+
+        # Existing entries are counted once, when the cache is opened
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+        with patch.object(cache, "prune", wraps=cache.prune) as prune:
+            cache.put("a", _extraction())
+            cache.put("a", _extraction())  # overwrite: size unchanged
+            prune.assert_not_called()
+            cache.put("b", _extraction())
+            prune.assert_called_once()
+        assert cache.stats()["entries"] == 2
+
+
+# =============================================================================
+# Indexer integration
+# =============================================================================
+
+
+class TestIndexerUsesCache:
+    def test_second_run_skips_extraction(self, tmp_path: Path, make_config, make_indexer) -> None:
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        item = ZoteroItem(item_key="AAA", title="Paper", authors="Doe, J.", year=2020, pdf_path=pdf)
+        config = make_config(extraction_cache_enabled=True)
+
+        def run(extract):
+            indexer = make_indexer(config, [item])
+            with patch("deep_zotero.indexer.extract_document", side_effect=extract) as mock_extract:
+                result = indexer.index_all()
+            return result, mock_extract
+
+        first, extract1 = run(lambda *a, **k: _extraction())
+        assert first["indexed"] == 1 and extract1.call_count == 1
+
+        second, extract2 = run(lambda *a, **k: pytest.fail("cache miss"))
+        assert second["indexed"] == 1 and extract2.call_count == 0
+
+        # A changed PDF is a miss
+        pdf.write_bytes(b"%PDF-1.4 changed")
+        third, extract3 = run(lambda *a, **k: _extraction())
+        assert extract3.call_count == 1
+
+    def test_file_hash_covers_whole_file(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.pdf"
+        b = tmp_path / "b.pdf"
+        a.write_bytes(b"x" * 200_000 + b"A")
+        b.write_bytes(b"x" * 200_000 + b"B")
+        assert file_hash(a) != file_hash(b)
@@ -8,6 +8,7 @@ import pytest
 
 from deep_zotero.feature_extraction.captions import (
     DetectedCaption,
+    PageTextCache,
     _FIG_CAPTION_RE,
     _FIG_CAPTION_RE_RELAXED,
     _FIG_LABEL_ONLY_RE,
@@ -319,6 +320,61 @@ class TestFindAllCaptions:
         assert "Figure 5" in captions[0].text
 
 
+# ---------------------------------------------------------------------------
+# TestPageTextCache
+# ---------------------------------------------------------------------------
+
+
+def _make_mock_doc(pages: list[MagicMock]) -> MagicMock:
+    doc = MagicMock()
+    doc.__len__ = MagicMock(return_value=len(pages))
+    doc.__getitem__ = MagicMock(side_effect=lambda i: pages[i])
+    return doc
+
+
+class TestPageTextCache:
+    def test_text_dict_parsed_once(self) -> None:
+        """Repeated lookups reuse the first get_text("dict") result."""
+        page = _make_mock_page([_make_block("Table 1. Results")])
+        cache = PageTextCache(_make_mock_doc([page]))
+
+        first = cache.text_dict(0)
+        assert cache.text_dict(0) is first
+        cache.captions(0)
+        cache.captions(0, include_figures=False)
+        assert page.get_text.call_count == 1
+
+    def test_plain_text_cached(self) -> None:
+        page = MagicMock()
+        page.get_text.return_value = "body text"
+        cache = PageTextCache(_make_mock_doc([page]))
+        assert cache.text(0) == "body text"
+        assert cache.text(0) == "body text"
+        page.get_text.assert_called_once_with()
+
+    def test_captions_match_uncached(self) -> None:
+        """Cached captions equal find_all_captions on the page, per flag combination."""
+        blocks = [
+            _make_block("Table 1. Results", bbox=(10, 100, 400, 120)),
+            _make_block("Figure 2: Graph", bbox=(10, 300, 400, 320)),
+        ]
+        page = _make_mock_page(blocks)
+        cache = PageTextCache(_make_mock_doc([page]))
+
+        assert cache.captions(0) == find_all_captions(page)
+        assert cache.captions(0, include_figures=False) == find_all_captions(page, include_figures=False)
+        assert [c.caption_type for c in cache.captions(0, include_tables=False)] == ["figure"]
+
+    def test_custom_caption_finder(self) -> None:
+        page = _make_mock_page([])
+        finder = MagicMock(return_value=[])
+        cache = PageTextCache(_make_mock_doc([page]), caption_finder=finder)
+        cache.captions(0)
+        cache.captions(0)
+        finder.assert_called_once()
+        assert finder.call_args.kwargs["text_dict"] is cache.text_dict(0)
+
+
 # ---------------------------------------------------------------------------
 # TestIsInReferences
 # ---------------------------------------------------------------------------
@@ -0,0 +1,106 @@
+"""Tests for cost_ledger.py — append-only JSONL vision cost ledger."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from deep_zotero.feature_extraction.cost_ledger import CostLedger
+
+
+def _entry(i: int, session: str = "s1", cost: float = 0.01) -> dict:
+    return {
+        "timestamp": f"2026-01-01T00:00:{i:02d}",
+        "session_id": session,
+        "table_id": f"T{i}",
+        "agent_role": "transcriber",
+        "model": "m",
+        "input_tokens": 100,
+        "output_tokens": 10,
+        "cache_write_tokens": 1,
+        "cache_read_tokens": 2,
+        "cost_usd": cost,
+    }
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> CostLedger:
+    return CostLedger(tmp_path / "vision_costs.jsonl")
+
+
+class TestCostLedger:
+    def test_append_writes_one_line_per_entry(self, ledger):
+        ledger.append(_entry(1))
+        ledger.append(_entry(2))
+        lines = ledger.path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(l)["table_id"] for l in lines] == ["T1", "T2"]
+
+    def test_empty_ledger_has_no_summary(self, ledger):
+        assert ledger.summarize() is None
+        ledger.path.write_text("", encoding="utf-8")
+        assert ledger.summarize() is None
+
+    def test_summary_totals_and_sessions(self, ledger):
+        ledger.append(_entry(1, "s1", 0.01))
+        ledger.append(_entry(2, "s2", 0.02))
+        ledger.append(_entry(3, "s1", 0.03))
+        summary = ledger.summarize(last_n=2)
+        assert summary["total_tables"] == 3
+        assert summary["total_cost_usd"] == pytest.approx(0.06)
+        assert summary["avg_cost_per_table_usd"] == pytest.approx(0.02)
+        assert summary["tokens"] == {"input": 300, "output": 30, "cache_write": 3, "cache_read": 6}
+        assert [(s["session_id"], s["table_count"]) for s in summary["sessions"]] == [("s1", 2), ("s2", 1)]
+        assert [e["table_id"] for e in summary["recent_entries"]] == ["T2", "T3"]
+
+    def test_rollup_is_incremental(self, ledger):
+        for i in range(5):
+            ledger.append(_entry(i))
+        assert ledger.summarize()["total_tables"] == 5
+        rollup = json.loads(ledger.rollup_path.read_text(encoding="utf-8"))
+        assert rollup["offset"] == ledger.path.stat().st_size
+
+        ledger.append(_entry(5, cost=1.0))
+        summary = CostLedger(ledger.path).summarize()
+        assert summary["total_tables"] == 6
+        assert summary["total_cost_usd"] == pytest.approx(1.05)
+
+    def test_partial_trailing_line_is_deferred(self, ledger):
+        ledger.append(_entry(1))
+        with open(ledger.path, "a", encoding="utf-8") as f:
+            f.write('{"cost_usd": 0.5')
+        assert ledger.summarize()["total_tables"] == 1
+        with open(ledger.path, "a", encoding="utf-8") as f:
+            f.write(', "session_id": "s1"}\n')
+        assert ledger.summarize()["total_tables"] == 2
+
+    def test_rebuilds_after_truncation(self, ledger):
+        for i in range(3):
+            ledger.append(_entry(i))
+        ledger.summarize()
+        ledger.path.write_text(json.dumps(_entry(9)) + "\n", encoding="utf-8")
+        summary = ledger.summarize()
+        assert summary["total_tables"] == 1
+        assert summary["recent_entries"][0]["table_id"] == "T9"
+
+    def test_tail_across_blocks(self, ledger):
+        for i in range(3000):
+            ledger.append(_entry(i % 60))
+        tail = ledger.tail(5)
+        assert len(tail) == 5
+        assert [e["table_id"] for e in tail] == [f"T{i % 60}" for i in range(2995, 3000)]
+
+    def test_migrates_legacy_json_log(self, tmp_path):
+        legacy = tmp_path / "vision_costs.json"
+        legacy.write_text(json.dumps([_entry(1), _entry(2)]), encoding="utf-8")
+        (tmp_path / "vision_costs.jsonl").write_text(json.dumps(_entry(3)) + "\n", encoding="utf-8")
+
+        ledger = CostLedger(tmp_path / "vision_costs.jsonl")
+        assert not legacy.exists()
+        assert (tmp_path / "vision_costs.json.migrated").exists()
+        summary = ledger.summarize(last_n=10)
+        assert [e["table_id"] for e in summary["recent_entries"]] == ["T1", "T2", "T3"]
+
+    def test_json_path_maps_to_jsonl(self, tmp_path):
+        ledger = CostLedger(tmp_path / "costs.json")
+        assert ledger.path == tmp_path / "costs.jsonl"
@@ -0,0 +1,59 @@
+"""Tests for doc_pool.py — bounded LRU pool of open PDF documents."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from deep_zotero.feature_extraction.doc_pool import DocumentPool
+
+
+@pytest.fixture
+def pdfs(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(3):
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), f"Document {i}")
+        path = tmp_path / f"doc{i}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+class TestDocumentPool:
+    def test_reuses_open_handle(self, pdfs):
+        with DocumentPool() as pool:
+            first = pool.get(pdfs[0])
+            assert pool.get(str(pdfs[0])) is first
+            assert pool.opens == 1
+
+    def test_evicts_least_recently_used(self, pdfs):
+        with DocumentPool(max_open=2) as pool:
+            a = pool.get(pdfs[0])
+            pool.get(pdfs[1])
+            pool.get(pdfs[0])  # refresh a
+            pool.get(pdfs[2])  # evicts doc1
+            assert len(pool) == 2
+            assert not a.is_closed
+            assert pool.get(pdfs[0]) is a
+            pool.get(pdfs[1])
+            assert pool.opens == 4
+
+    def test_evicted_handle_is_closed(self, pdfs):
+        pool = DocumentPool(max_open=1)
+        a = pool.get(pdfs[0])
+        pool.get(pdfs[1])
+        assert a.is_closed
+        pool.close()
+
+    def test_close_closes_everything(self, pdfs):
+        with DocumentPool() as pool:
+            docs = [pool.get(p) for p in pdfs]
+        assert all(d.is_closed for d in docs)
+        assert len(pool) == 0
+
+    def test_rejects_empty_bound(self):
+        with pytest.raises(ValueError):
+            DocumentPool(max_open=0)
@@ -0,0 +1,106 @@
+"""Tests for image_optimizer.py — ImageOptions validation and encode_pixmap."""
+
+from __future__ import annotations
+
+import io
+
+import pymupdf
+import pytest
+from PIL import Image
+
+from deep_zotero.feature_extraction.image_optimizer import ImageOptions, content_rect, encode_pixmap
+from deep_zotero.feature_extraction.vision_extract import render_table_region
+
+
+def _page() -> pymupdf.Page:
+    doc = pymupdf.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((200, 300), "Table 1. Results", fontsize=12)
+    page.draw_rect(pymupdf.Rect(200, 310, 400, 420), color=(0.8, 0, 0), width=2)
+    return page
+
+
+def _pixmap() -> pymupdf.Pixmap:
+    return _page().get_pixmap(matrix=pymupdf.Matrix(2, 2), clip=pymupdf.Rect(150, 250, 450, 450))
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+class TestImageOptions:
+
+    @pytest.mark.parametrize("kwargs", [
+        {"format": "gif"}, {"colors": 1}, {"colors": 300}, {"quality": 0},
+    ])
+    def test_invalid_options_rejected(self, kwargs):
+        with pytest.raises(ValueError):
+            ImageOptions(**kwargs)
+
+    def test_default_is_plain_png(self):
+        pix = _pixmap()
+        assert ImageOptions().is_default
+        assert encode_pixmap(pix, ImageOptions()) == (pix.tobytes("png"), "image/png")
+        assert encode_pixmap(pix, None) == (pix.tobytes("png"), "image/png")
+
+
+class TestEncodePixmap:
+
+    def test_grayscale_and_palette_shrink_png(self):
+        pix = _pixmap()
+        plain, _ = encode_pixmap(pix)
+        gray, media_type = encode_pixmap(pix, ImageOptions(grayscale=True))
+        palette, _ = encode_pixmap(pix, ImageOptions(grayscale=True, colors=16))
+
+        assert media_type == "image/png"
+        assert _open(gray).mode == "L"
+        assert _open(palette).mode == "P"
+        assert len(palette) < len(gray) < len(plain)
+        assert _open(palette).size == (pix.width, pix.height)
+
+    @pytest.mark.parametrize("fmt,media_type,magic", [
+        ("jpeg", "image/jpeg", b"\xff\xd8"),
+        ("webp", "image/webp", b"RIFF"),
+    ])
+    def test_lossy_formats(self, fmt, media_type, magic):
+        data, mt = encode_pixmap(_pixmap(), ImageOptions(format=fmt, quality=70))
+        assert mt == media_type
+        assert data.startswith(magic)
+
+    def test_content_rect(self):
+        page = _page()
+        rect = content_rect(page, page.rect)
+        # Caption text plus the drawn table, with a few points of margin
+        assert rect.contains(pymupdf.Rect(200, 290, 400, 420))
+        assert rect.x0 > 180 and rect.x1 < 420 and rect.y0 > 270 and rect.y1 < 440
+
+        blank = pymupdf.open().new_page()
+        assert content_rect(blank, blank.rect) == blank.rect
+
+    def test_render_trims_full_page_but_not_crops(self):
+        page = _page()
+        options = ImageOptions(trim_whitespace=True)
+        crop = (150.0, 250.0, 450.0, 450.0)
+
+        crop_img = _open(render_table_region(page, crop, image_options=options)[0][0])
+        assert crop_img.width / crop_img.height == pytest.approx(300 / 200, rel=0.02)
+
+        full = render_table_region(page, tuple(page.rect), image_options=options)
+        full_plain = render_table_region(page, tuple(page.rect))
+        assert sum(len(d) for d, _ in full) < sum(len(d) for d, _ in full_plain)
+
+    def test_portrait_full_page_strips_share_one_frame(self):
+        # 612x792 renders as strips; trimming must not crop each strip separately
+        page = pymupdf.open().new_page(width=612, height=792)
+        page.insert_text((100, 100), "Table 2. Tall table", fontsize=12)
+        page.draw_rect(pymupdf.Rect(100, 110, 500, 700), width=1)
+        page.insert_text((120, 400), "x", fontsize=10)
+        options = ImageOptions(trim_whitespace=True)
+
+        strips = [_open(d) for d, _ in render_table_region(page, tuple(page.rect), image_options=options)]
+        plain = render_table_region(page, tuple(page.rect))
+
+        assert len(strips) > 1 and len(plain) > 1
+        assert len({s.width for s in strips}) == 1
+        assert strips[0].width > 1000
+        assert strips[0].height == pytest.approx(strips[0].width, abs=2)
@@ -0,0 +1,115 @@
+"""Tests for local_vision_api.py — streaming iter_tables and extract_tables_batch ordering."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("openai")
+
+from deep_zotero.feature_extraction.local_vision_api import LocalVisionAPI
+from deep_zotero.feature_extraction.vision_api import TableVisionSpec
+from deep_zotero.feature_extraction.vision_extract import AgentResponse
+
+
+def _spec(i: int) -> TableVisionSpec:
+    return TableVisionSpec(
+        table_id=f"t{i}", pdf_path=Path("/fake/paper.pdf"), page_num=1,
+        bbox=(0.0, 0.0, 100.0, 100.0), raw_text="", caption=None,
+    )
+
+
+def _response(label: str) -> AgentResponse:
+    return AgentResponse(
+        headers=["h"], rows=[[label]], footnotes="",
+        table_label=None, caption="",
+        is_incomplete=False, incomplete_reason="",
+        raw_shape=(1, 1), parse_success=True,
+        raw_response="{}",
+        recrop_needed=False, recrop_bbox_pct=None,
+    )
+
+
+@pytest.fixture
+def api() -> LocalVisionAPI:
+    return LocalVisionAPI(max_workers=2)
+
+
+class TestIterTables:
+
+    def test_yields_before_later_tables_are_rendered(self, api):
+        rendered: list[str] = []
+
+        def prepare(spec, doc_pool=None):
+            rendered.append(spec.table_id)
+            return [("aGk=", "image/png")]
+
+        specs = [_spec(i) for i in range(5)]
+        with patch.object(api, "_prepare_table", side_effect=prepare), \
+             patch.object(api, "_extract_one", side_effect=lambda s, im: _response(s.table_id)):
+            stream = api.iter_tables(specs, max_in_flight=1)
+            first = next(stream)
+            assert first[0] == 0
+            assert rendered == ["t0"]
+            rest = list(stream)
+
+        assert sorted([first[0]] + [i for i, _ in rest]) == list(range(5))
+
+    def test_in_flight_window_bounds_rendered_images(self, api):
+        lock = threading.Lock()
+        state = {"outstanding": 0, "peak": 0}
+
+        def prepare(spec, doc_pool=None):
+            with lock:
+                state["outstanding"] += 1
+                state["peak"] = max(state["peak"], state["outstanding"])
+            return [("aGk=", "image/png")]
+
+        def extract(spec, images):
+            time.sleep(0.01)
+            with lock:
+                state["outstanding"] -= 1
+            return _response(spec.table_id)
+
+        with patch.object(api, "_prepare_table", side_effect=prepare), \
+             patch.object(api, "_extract_one", side_effect=extract):
+            results = dict(api.iter_tables([_spec(i) for i in range(12)], max_in_flight=3))
+
+        assert len(results) == 12
+        assert state["peak"] <= 3
+
+    def test_unexpected_error_becomes_failed_response(self, api):
+        def extract(spec, images):
+            if spec.table_id == "t1":
+                raise RuntimeError("boom")
+            return _response(spec.table_id)
+
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_extract_one", side_effect=extract):
+            results = dict(api.iter_tables([_spec(i) for i in range(3)]))
+
+        assert results[0].parse_success and results[2].parse_success
+        assert not results[1].parse_success
+        assert results[1].raw_response == "boom"
+
+
+class TestExtractTablesBatch:
+
+    def test_returns_input_order_when_completed_out_of_order(self, api):
+        def extract(spec, images):
+            # Later tables finish first
+            time.sleep(0.02 * (4 - int(spec.table_id[1:])))
+            return _response(spec.table_id)
+
+        with patch.object(api, "_prepare_table", return_value=[("aGk=", "image/png")]), \
+             patch.object(api, "_extract_one", side_effect=extract):
+            responses = api.extract_tables_batch([_spec(i) for i in range(4)])
+
+        assert [r.rows[0][0] for r in responses] == ["t0", "t1", "t2", "t3"]
+
+    def test_empty_specs(self, api):
+        assert api.extract_tables_batch([]) == []
@@ -1,4 +1,4 @@
-"""Tests for vision_api.py — sync conversion, _prepare_table, _build_request, extract_tables_batch."""
+"""Tests for vision_api.py — sync conversion, _prepare_table, _build_request, extract_tables_batch, polling, parallel rendering."""
 
 from __future__ import annotations
 
@@ -6,14 +6,18 @@ import asyncio
 import base64
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from deep_zotero.feature_extraction.vision_api import (
     VisionAPI,
     TableVisionSpec,
+    _POLL_MAX_INTERVAL,
+    _POLL_MIN_INTERVAL,
     _append_cost_entry,
+    _next_poll_delay,
+    render_tables_parallel,
 )
 
 
@@ -409,5 +413,115 @@ class TestExtractTablesBatch:
              }):
             api.extract_tables_batch([spec])
 
-        mock_prepare.assert_called_once_with(spec)
+        mock_prepare.assert_called_once_with(spec, doc_pool=ANY)
         mock_build.assert_called_once_with(spec, fake_images)
+
+
+# ---------------------------------------------------------------------------
+# TestPollBatch
+# ---------------------------------------------------------------------------
+
+def _status(state: str, processing: int = 0, succeeded: int = 0) -> MagicMock:
+    status = MagicMock()
+    status.processing_status = state
+    counts = status.request_counts
+    counts.processing, counts.succeeded = processing, succeeded
+    counts.errored = counts.canceled = counts.expired = 0
+    return status
+
+
+class TestPollBatch:
+
+    def test_backs_off_without_progress(self):
+        delays = [_POLL_MIN_INTERVAL]
+        for _ in range(20):
+            delays.append(_next_poll_delay(delays[-1], done=0, remaining=10, elapsed=100.0))
+        assert delays == sorted(delays)
+        assert delays[-1] == _POLL_MAX_INTERVAL
+
+    def test_progress_shortens_wait(self):
+        # 90 of 100 done in 90s: ~10s left, not the backed-off 60s
+        assert _next_poll_delay(_POLL_MAX_INTERVAL, done=90, remaining=10, elapsed=90.0) == pytest.approx(10.0)
+        # Never polls faster than the minimum interval
+        assert _next_poll_delay(_POLL_MAX_INTERVAL, done=99, remaining=1, elapsed=1.0) == _POLL_MIN_INTERVAL
+
+    def test_first_check_is_fast_and_results_collected(self):
+        api = _make_api()
+        api._client.messages.batches.retrieve.side_effect = [
+            _status("in_progress", processing=2),
+            _status("in_progress", processing=1, succeeded=1),
+            _status("ended", succeeded=2),
+        ]
+        result = MagicMock()
+        result.custom_id = "T1__transcriber"
+        result.result.type = "succeeded"
+        result.result.message.content = [MagicMock(text="{}")]
+        result.result.message.usage = MagicMock(
+            input_tokens=10, output_tokens=5,
+            cache_creation_input_tokens=0, cache_read_input_tokens=0,
+        )
+        api._client.messages.batches.results.return_value = [result]
+        api._cost_ledger = MagicMock()
+
+        with patch("deep_zotero.feature_extraction.vision_api.time.sleep") as sleep:
+            results = api._poll_batch("msgbatch_1", 1)
+
+        assert results == {"T1__transcriber": "{}"}
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert len(waits) == 3
+        assert waits[0] == _POLL_MIN_INTERVAL
+        assert all(w <= _POLL_MAX_INTERVAL for w in waits)
+
+
+# ---------------------------------------------------------------------------
+# TestParallelRender
+# ---------------------------------------------------------------------------
+
+def _write_pdf(path: Path, n_pages: int) -> Path:
+    import pymupdf
+    doc = pymupdf.open()
+    for i in range(n_pages):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((20, 50), f"{path.stem} page {i + 1}", fontsize=14)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestParallelRender:
+
+    def _specs(self, tmp_path: Path) -> list[TableVisionSpec]:
+        pdf_a = _write_pdf(tmp_path / "a.pdf", 3)
+        pdf_b = _write_pdf(tmp_path / "b.pdf", 2)
+        # Interleave the two PDFs so grouping has to restore input order
+        layout = [(pdf_a, 1), (pdf_b, 1), (pdf_a, 2), (pdf_b, 2), (pdf_a, 3),
+                  (pdf_a, 1), (pdf_b, 2), (pdf_a, 3), (pdf_b, 1)]
+        return [
+            TableVisionSpec(
+                table_id=f"t{i}", pdf_path=pdf, page_num=page,
+                bbox=(10.0, 10.0 + i, 250.0, 120.0 + 10 * i),
+                raw_text="", caption=None, garbled=False,
+            )
+            for i, (pdf, page) in enumerate(layout)
+        ]
+
+    def test_matches_serial_render_in_input_order(self, tmp_path):
+        specs = self._specs(tmp_path)
+        api = _make_api()
+        serial = [api._prepare_table(spec) for spec in specs]
+        assert render_tables_parallel(specs, workers=2) == serial
+
+    def test_batch_uses_process_pool_above_threshold(self, tmp_path):
+        with patch("deep_zotero.feature_extraction.vision_api.anthropic"):
+            api = VisionAPI(api_key="test-key", render_workers=2)
+        specs = self._specs(tmp_path)
+        fake_images = [[("b64", "image/png")] for _ in specs]
+
+        with patch("deep_zotero.feature_extraction.vision_api.render_tables_parallel",
+                   return_value=fake_images) as mock_render, \
+             patch.object(api, "_prepare_table") as mock_prepare, \
+             patch.object(api, "_submit_and_poll", return_value={}):
+            api.extract_tables_batch(specs)
+
+        mock_render.assert_called_once_with(specs, 2, None)
+        mock_prepare.assert_not_called()
@@ -0,0 +1,108 @@
+"""Tests for vision_cache.py — content-addressed vision result cache."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deep_zotero.feature_extraction.vision_api import TableVisionSpec, VisionAPI
+from deep_zotero.feature_extraction.vision_cache import VisionResultCache
+
+_IMAGES = [("aW1n", "image/png")]
+
+_OK = json.dumps({
+    "table_label": "Table 1", "caption": "Table 1. Results",
+    "is_incomplete": False, "incomplete_reason": "",
+    "headers": ["A"], "rows": [["1"]], "footnotes": "",
+    "recrop": {"needed": False, "bbox_pct": [0, 0, 100, 100]},
+})
+
+
+def _spec(table_id: str, caption: str = "Table 1. Results") -> TableVisionSpec:
+    return TableVisionSpec(
+        table_id=table_id, pdf_path=Path("/fake/paper.pdf"), page_num=1,
+        bbox=(0.0, 0.0, 100.0, 100.0), raw_text="A\n1", caption=caption,
+    )
+
+
+def _make_api(cache: VisionResultCache) -> VisionAPI:
+    with patch("deep_zotero.feature_extraction.vision_api.anthropic") as mock_anthropic:
+        mock_anthropic.Anthropic.return_value = MagicMock()
+        return VisionAPI(api_key="test-key", result_cache=cache)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> VisionResultCache:
+    return VisionResultCache(tmp_path / "vision_cache.sqlite")
+
+
+class TestVisionResultCache:
+    def test_key_depends_on_every_input(self):
+        base = VisionResultCache.key("m", "v1", "ctx", _IMAGES)
+        assert VisionResultCache.key("m", "v1", "ctx", list(_IMAGES)) == base
+        assert VisionResultCache.key("m2", "v1", "ctx", _IMAGES) != base
+        assert VisionResultCache.key("m", "v2", "ctx", _IMAGES) != base
+        assert VisionResultCache.key("m", "v1", "ctx2", _IMAGES) != base
+        assert VisionResultCache.key("m", "v1", "ctx", [("aW1o", "image/png")]) != base
+        assert VisionResultCache.key("m", "v1", "ctx", _IMAGES * 2) != base
+
+    def test_round_trip_and_counts(self, cache):
+        cache.put_many({"k1": "r1"})
+        assert cache.get_many(["k1", "k2"]) == {"k1": "r1"}
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_persists_across_instances(self, tmp_path, cache):
+        cache.put_many({"k": "r"})
+        assert VisionResultCache(tmp_path / "vision_cache.sqlite").get_many(["k"]) == {"k": "r"}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = VisionResultCache(tmp_path / "c.sqlite", max_entries=2)
+        cache.put_many({"a": "1"})
+        cache.put_many({"b": "2"})
+        cache.get_many(["a"])
+        cache.put_many({"c": "3"})
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+class TestVisionAPIResultCache:
+    def test_repeat_crop_is_not_resubmitted(self, cache):
+        api = _make_api(cache)
+        with patch.object(api, "_prepare_table", return_value=_IMAGES), \
+             patch.object(api, "_submit_and_poll", return_value={"D1__t0__transcriber": _OK}) as submit:
+            first = api.extract_tables_batch([_spec("D1__t0")])
+        assert submit.call_args.args[0][0]["custom_id"] == "D1__t0__transcriber"
+
+        # Same paper under another Zotero item: identical crop, new table_id
+        with patch.object(api, "_prepare_table", return_value=_IMAGES), \
+             patch.object(api, "_submit_and_poll", return_value={}) as submit:
+            second = api.extract_tables_batch([_spec("D2__t0")])
+
+        assert submit.call_args.args[0] == []
+        assert second[0].headers == first[0].headers == ["A"]
+        assert api.cache_stats["hits"] == 1
+        assert api.cache_stats["misses"] == 1
+
+    def test_changed_caption_misses(self, cache):
+        api = _make_api(cache)
+        with patch.object(api, "_prepare_table", return_value=_IMAGES), \
+             patch.object(api, "_submit_and_poll", side_effect=[
+                 {"D1__t0__transcriber": _OK}, {"D1__t0__transcriber": _OK},
+             ]) as submit:
+            api.extract_tables_batch([_spec("D1__t0")])
+            api.extract_tables_batch([_spec("D1__t0", caption="Table 2. Other")])
+        assert len(submit.call_args_list[1].args[0]) == 1
+
+    def test_failed_parse_is_not_cached(self, cache):
+        api = _make_api(cache)
+        with patch.object(api, "_prepare_table", return_value=_IMAGES), \
+             patch.object(api, "_submit_and_poll", return_value={"D1__t0__transcriber": "not json"}):
+            responses = api.extract_tables_batch([_spec("D1__t0")])
+        assert not responses[0].parse_success
+        assert cache.stats()["entries"] == 0
+
+    def test_no_cache_stats_without_cache(self):
+        with patch("deep_zotero.feature_extraction.vision_api.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = MagicMock()
+            assert VisionAPI(api_key="k").cache_stats is None
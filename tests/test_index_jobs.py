@@ -0,0 +1,196 @@
+"""Tests for background indexing jobs (index_jobs.py and Indexer progress hooks)."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.index_jobs import IndexCancelled, IndexJobManager, IndexProgress
+from deep_zotero.models import DocumentExtraction, PageExtraction, ZoteroItem
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+
+
+def _extraction(text: str) -> DocumentExtraction:
+    md = f"# Introduction\n\n{text} " * 40
+    return DocumentExtraction(
+        pages=[PageExtraction(page_num=1, markdown=md, char_start=0)],
+        full_markdown=md,
+        sections=[],
+        tables=[],
+        figures=[],
+        stats={"total_pages": 1, "text_pages": 1, "ocr_pages": 0, "empty_pages": 0},
+        quality_grade="A",
+    )
+
+
+
+
+@pytest.fixture
+def items(tmp_path: Path) -> list[ZoteroItem]:
+    out = []
+    for key in ("AAA", "BBB", "CCC", "DDD"):
+        pdf = tmp_path / f"{key}.pdf"
+        pdf.write_bytes(b"%PDF-1.4 " + key.encode())
+        out.append(ZoteroItem(item_key=key, title=f"Paper {key}", authors="Doe, J.", year=2020, pdf_path=pdf))
+    return out
+
+
+# =============================================================================
+# IndexProgress / IndexJobManager
+# =============================================================================
+
+
+class TestIndexProgress:
+    def test_snapshot_reports_rate_and_eta(self):
+        progress = IndexProgress()
+        progress.update("extracting", 0, 10)
+        progress._stage_started -= 60  # one minute into the stage
+        progress.update("extracting", 5, 10)
+        snap = progress.snapshot()
+        assert snap["stage"] == "extracting"
+        assert (snap["done"], snap["total"]) == (5, 10)
+        assert snap["papers_per_minute"] == pytest.approx(5, rel=0.05)
+        assert snap["eta_seconds"] == pytest.approx(60, abs=2)
+
+    def test_no_eta_before_first_paper(self):
+        progress = IndexProgress()
+        progress.update("extracting", 0, 10)
+        assert progress.snapshot()["eta_seconds"] is None
+
+    def test_update_raises_after_cancel(self):
+        progress = IndexProgress()
+        progress.cancel()
+        with pytest.raises(IndexCancelled):
+            progress.update("storing", 1, 2)
+
+
+class TestIndexJobManager:
+    def test_job_runs_in_background_and_completes(self):
+        manager = IndexJobManager()
+        release = threading.Event()
+
+        def run(progress):
+            progress.update("extracting", 1, 2)
+            release.wait(5)
+            return {"indexed": 2}
+
+        job = manager.start(run, {"limit": 2})
+        assert job.status == "running"
+        assert _wait_for(lambda: job.progress.snapshot()["done"] == 1)
+        release.set()
+        assert _wait_for(lambda: job.status == "completed")
+        assert manager.get(job.job_id).to_dict()["result"] == {"indexed": 2}
+        assert manager.get() is job
+
+    def test_one_job_at_a_time(self):
+        manager = IndexJobManager()
+        release = threading.Event()
+        job = manager.start(lambda progress: release.wait(5) and {}, {})
+        with pytest.raises(RuntimeError, match=job.job_id):
+            manager.start(lambda progress: {}, {})
+        release.set()
+        assert _wait_for(lambda: job.status == "completed")
+        manager.start(lambda progress: {}, {})
+
+    def test_cancel_stops_at_next_update(self):
+        manager = IndexJobManager()
+
+        def run(progress):
+            for i in range(1000):
+                progress.update("extracting", i, 1000)
+                time.sleep(0.005)
+            return {}
+
+        job = manager.start(run, {})
+        manager.cancel(job.job_id)
+        assert _wait_for(lambda: job.status == "cancelled")
+        assert job.progress.snapshot()["done"] < 999
+
+    def test_failure_is_recorded(self):
+        manager = IndexJobManager()
+
+        def run(progress):
+            raise ValueError("bad config")
+
+        job = manager.start(run, {})
+        assert _wait_for(lambda: job.status == "failed")
+        assert job.error == "ValueError: bad config"
+
+    def test_history_is_bounded(self):
+        manager = IndexJobManager(history=2)
+        for _ in range(4):
+            job = manager.start(lambda progress: {}, {})
+            assert _wait_for(lambda: job.status == "completed")
+        assert len(manager._jobs) <= 3
+
+    def test_unknown_job(self):
+        manager = IndexJobManager()
+        assert manager.get("nope") is None
+        assert manager.cancel("nope") is None
+
+
+# =============================================================================
+# Indexer progress hooks
+# =============================================================================
+
+
+class TestIndexerProgress:
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_progress_reaches_every_paper(self, items, streaming, make_config, make_indexer):
+        def fake_iter(self, to_index, figures_dir):
+            for item in to_index:
+                yield item, _extraction(f"Text of {item.item_key}"), None
+
+        seen = []
+        progress = IndexProgress()
+        original = progress.update
+
+        def record(stage, done, total):
+            seen.append((stage, done, total))
+            original(stage, done, total)
+
+        progress.update = record
+        with patch("deep_zotero.indexer.Indexer._iter_extractions", fake_iter):
+            indexer = make_indexer(make_config(), items)
+            result = indexer.index_all(streaming=streaming, progress=progress)
+
+        assert result["indexed"] == 4
+        assert seen[0] == ("discovering", 0, 0)
+        last_stage = "indexing" if streaming else "storing"
+        assert (last_stage, 4, 4) in seen
+
+    def test_cancel_stops_between_papers(self, items, make_config, make_indexer):
+        progress = IndexProgress()
+
+        def fake_iter(self, to_index, figures_dir):
+            for n, item in enumerate(to_index):
+                if n == 2:
+                    progress.cancel()
+                yield item, _extraction(f"Text of {item.item_key}"), None
+
+        with patch("deep_zotero.indexer.Indexer._iter_extractions", fake_iter):
+            indexer = make_indexer(make_config(), items)
+            with pytest.raises(IndexCancelled):
+                indexer.index_all(streaming=True, progress=progress)
+
+        # The paper extracted when cancel arrived is still stored; later ones are not
+        stored = [c.args[0] for c in indexer.store.add_chunks.call_args_list]
+        assert stored == ["AAA", "BBB", "CCC"]
@@ -0,0 +1,100 @@
+"""Tests for process-pool extraction in Indexer.index_all()."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from deep_zotero.models import ZoteroItem
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+
+
+def _write_pdf(path: Path, text: str) -> Path:
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Introduction", fontsize=14)
+    y = 100
+    for i in range(20):
+        page.insert_text((72, y), f"{text} sentence number {i} about control systems.", fontsize=10)
+        y += 14
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _item(key: str, pdf: Path) -> ZoteroItem:
+    return ZoteroItem(
+        item_key=key, title=f"Paper {key}", authors="Doe, J.", year=2020,
+        pdf_path=pdf, citation_key="", publication="", doi="", tags="", collections="",
+    )
+
+
+
+
+# =============================================================================
+# Worker function
+# =============================================================================
+
+
+class TestExtractInWorker:
+    def test_failure_returned_as_message(self, tmp_path: Path) -> None:
+        """Worker must report errors as strings, not raise."""
+        from deep_zotero.indexer import _extract_in_worker
+
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"not a pdf")
+        extraction, error = _extract_in_worker(bad, tmp_path / "figures", "eng", False)
+        assert extraction is None
+        assert error and ":" in error
+
+    def test_vision_specs_collected_without_api(self, tmp_path: Path) -> None:
+        """collect_vision_specs defers tables exactly like passing a VisionAPI."""
+        from deep_zotero.pdf_processor import extract_document
+
+        pdf = _write_pdf(tmp_path / "a.pdf", "Alpha")
+        ext = extract_document(pdf, collect_vision_specs=True)
+        # No table captions -> no pending work, but the call must succeed
+        assert ext.pending_vision is None or ext.pending_vision.specs
+
+
+# =============================================================================
+# index_all with a worker pool
+# =============================================================================
+
+
+class TestParallelIndexAll:
+    def test_pool_matches_serial_and_isolates_failures(self, tmp_path: Path, make_config, make_indexer) -> None:
+        """Parallel extraction indexes the same papers as serial extraction,
+        in library order, with a broken PDF reported as a failure."""
+        bad = tmp_path / "broken.pdf"
+        bad.write_bytes(b"%PDF-1.4 garbage")
+        items = [
+            _item("AAA", _write_pdf(tmp_path / "a.pdf", "Alpha")),
+            _item("BAD", bad),
+            _item("BBB", _write_pdf(tmp_path / "b.pdf", "Beta")),
+            _item("CCC", _write_pdf(tmp_path / "c.pdf", "Gamma")),
+        ]
+
+        outcomes = {}
+        stored_order = {}
+        for workers in (1, 2):
+            indexer = make_indexer(make_config(extraction_workers=workers), items)
+            result = indexer.index_all()
+            outcomes[workers] = {r.item_key: (r.status, r.n_chunks) for r in result["results"]}
+            stored_order[workers] = [c.args[0] for c in indexer.store.add_chunks.call_args_list]
+
+        assert outcomes[1] == outcomes[2]
+        assert outcomes[2]["BAD"][0] == "failed"
+        assert all(outcomes[2][k][0] == "indexed" for k in ("AAA", "BBB", "CCC"))
+        assert stored_order[2] == ["AAA", "BBB", "CCC"]
+
+    def test_invalid_worker_count_rejected(self, make_config) -> None:
+        config = make_config(extraction_workers=0)
+        assert any("extraction_workers" in e for e in config.validate())
@@ -0,0 +1,134 @@
+"""Tests for the streaming (bounded-memory) mode of Indexer.index_all()."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deep_zotero.models import DocumentExtraction, PageExtraction, ZoteroItem
+from deep_zotero.pdf_processor import PendingVisionWork
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+
+
+def _extraction(text: str, pending: bool = False) -> DocumentExtraction:
+    md = f"# Introduction\n\n{text} " * 40
+    return DocumentExtraction(
+        pages=[PageExtraction(page_num=1, markdown=md, char_start=0)],
+        full_markdown=md,
+        sections=[],
+        tables=[],
+        figures=[],
+        stats={"total_pages": 1, "text_pages": 1, "ocr_pages": 0, "empty_pages": 0},
+        quality_grade="A",
+        pending_vision=PendingVisionWork(specs=["spec"], crop_infos=[], pdf_path=Path("x.pdf")) if pending else None,
+    )
+
+
+
+
+@pytest.fixture
+def items(tmp_path: Path) -> list[ZoteroItem]:
+    out = []
+    for key in ("AAA", "BBB", "CCC", "DDD"):
+        pdf = tmp_path / f"{key}.pdf"
+        pdf.write_bytes(b"%PDF-1.4 " + key.encode())
+        out.append(ZoteroItem(item_key=key, title=f"Paper {key}", authors="Doe, J.", year=2020, pdf_path=pdf))
+    return out
+
+
+# =============================================================================
+# Spool
+# =============================================================================
+
+
+class TestExtractionSpool:
+    def test_round_trip_and_remove(self, tmp_path: Path) -> None:
+        from deep_zotero.indexer import _ExtractionSpool
+
+        spool = _ExtractionSpool(tmp_path / "spool")
+        ext = _extraction("Alpha", pending=True)
+        spool.put("AAA", ext)
+        loaded = spool.get("AAA")
+        assert loaded.full_markdown == ext.full_markdown
+        assert loaded.pending_vision.specs == ["spec"]
+        spool.remove("AAA")
+        assert not list((tmp_path / "spool").iterdir())
+
+
+# =============================================================================
+# Streaming pipeline
+# =============================================================================
+
+
+class TestStreamingIndexAll:
+    def test_same_outcome_as_batched(self, items, make_config, make_indexer) -> None:
+        fake = {i.item_key: _extraction(f"Text of {i.item_key}") for i in items}
+
+        def fake_iter(self, to_index, figures_dir):
+            for item in to_index:
+                if item.item_key == "CCC":
+                    yield item, None, "FileDataError: broken"
+                else:
+                    yield item, fake[item.item_key], None
+
+        outcomes = {}
+        with patch("deep_zotero.indexer.Indexer._iter_extractions", fake_iter):
+            for streaming in (False, True):
+                indexer = make_indexer(make_config(), items)
+                result = indexer.index_all(streaming=streaming)
+                outcomes[streaming] = sorted((r.item_key, r.status, r.n_chunks) for r in result["results"])
+                assert result["quality_distribution"]["A"] == 3
+
+        assert outcomes[True] == outcomes[False]
+
+    def test_store_overlaps_extraction(self, items, make_config, make_indexer) -> None:
+        """The first document is stored before extraction finishes."""
+        stored_before_end = threading.Event()
+        indexer = make_indexer(make_config(stream_queue_depth=1), items)
+
+        def fake_iter(self, to_index, figures_dir):
+            for n, item in enumerate(to_index):
+                if n == len(to_index) - 1:
+                    # Wait for the writer to catch up before yielding the last doc
+                    assert stored_before_end.wait(timeout=10)
+                yield item, _extraction(item.item_key), None
+
+        indexer.store.add_chunks.side_effect = lambda *a, **k: stored_before_end.set()
+        with patch("deep_zotero.indexer.Indexer._iter_extractions", fake_iter):
+            result = indexer.index_all(streaming=True)
+        assert result["indexed"] == 4
+
+    def test_vision_docs_spooled_then_resolved(self, tmp_path: Path, items, make_config, make_indexer) -> None:
+        indexer = make_indexer(make_config(stream_vision_batch_docs=1), items)
+        indexer._vision_api = MagicMock()
+
+        def fake_iter(self, to_index, figures_dir):
+            for item in to_index:
+                yield item, _extraction(item.item_key, pending=item.item_key in ("BBB", "DDD")), None
+
+        resolved_groups = []
+
+        def fake_resolve(extractions, api, on_document=None):
+            resolved_groups.append(sorted(extractions))
+            for key, ext in extractions.items():
+                ext.pending_vision = None
+                if on_document is not None:
+                    on_document(key, ext)
+
+        with patch("deep_zotero.indexer.Indexer._iter_extractions", fake_iter), \
+             patch("deep_zotero.pdf_processor.resolve_pending_vision", side_effect=fake_resolve):
+            result = indexer.index_all(streaming=True)
+
+        assert resolved_groups == [["BBB"], ["DDD"]]
+        assert result["indexed"] == 4
+        stored = [c.args[0] for c in indexer.store.add_chunks.call_args_list]
+        assert stored[-2:] == ["BBB", "DDD"]
+        assert not list((tmp_path / "chroma" / "vision_spool").glob("*.pkl"))
@@ -0,0 +1,162 @@
+"""Tests for the chunk-level FTS5 index and hybrid retrieval."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.lexical_index import LexicalIndex, build_match_expression
+from deep_zotero.models import Chunk
+from deep_zotero.vector_store import VectorStore
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _FakeEmbedder:
+    """Embeds by chunk number so that low numbers are nearest the query."""
+
+    dimensions = 2
+
+    def embed(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        return [[1.0, float(t.split()[1])] for t in texts]
+
+    def embed_query(self, query):
+        return [1.0, 0.0]
+
+
+def _chunk(i: int, extra: str = "") -> Chunk:
+    return Chunk(text=f"chunk {i} {extra}".strip(), chunk_index=i, page_num=1, char_start=0, char_end=1)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> VectorStore:
+    store = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+    chunks = [_chunk(i) for i in range(40)]
+    chunks[35] = _chunk(35, "mentions HRV-based biomarkers")
+    chunks[38] = _chunk(38, "hrv again")
+    store.add_chunks("DOC1", {"title": "One", "year": 2020}, chunks)
+    store.add_chunks("DOC2", {"title": "Two", "year": 2010}, [_chunk(5, "HRV in DOC2")])
+    return store
+
+
+# =============================================================================
+# LexicalIndex
+# =============================================================================
+
+
+class TestLexicalIndex:
+    def test_match_expression(self) -> None:
+        assert build_match_expression("Heart rate", None) == '("heart" OR "rate")'
+        assert build_match_expression("q", ["heart-rate", "ECG"]) == '"heart rate" AND "ECG" AND ("q")'
+        assert build_match_expression("...", ["--"]) is None
+
+    def test_whole_word_case_insensitive(self, tmp_path: Path) -> None:
+        idx = LexicalIndex(tmp_path / "fts.sqlite")
+        idx.add("D", ["D_1", "D_2", "D_3"], ["The HRV signal", "hrvs plural", "heart-rate variability"])
+        assert idx.matching_ids(["hrv"]) == ["D_1"]
+        assert idx.matching_ids(["heart rate"]) == ["D_3"]
+        assert idx.matching_ids(["hrv", "signal"]) == ["D_1"]
+        assert idx.matching_ids(["hrv", "plural"]) == []
+
+    def test_bm25_prefers_more_matching_words(self, tmp_path: Path) -> None:
+        idx = LexicalIndex(tmp_path / "fts.sqlite")
+        idx.add("D", ["a", "b"], ["heart only here", "heart rate variability here"])
+        assert [i for i, _ in idx.search("heart rate variability")] == ["b", "a"]
+
+    def test_readd_replaces_and_delete_removes(self, tmp_path: Path) -> None:
+        idx = LexicalIndex(tmp_path / "fts.sqlite")
+        idx.add("D", ["D_1"], ["old words"])
+        idx.add("D", ["D_1"], ["new words"])
+        idx.add("E", ["E_1"], ["new words"])
+        assert idx.count() == 2
+        assert idx.matching_ids(["old"]) == []
+        idx.delete_document("D")
+        assert idx.matching_ids(["new"]) == ["E_1"]
+
+
+# =============================================================================
+# VectorStore integration
+# =============================================================================
+
+
+class TestVectorStoreLexical:
+    def test_required_terms_complete_beyond_top_k(self, store: VectorStore) -> None:
+        # Vector-nearest chunks are 0..4; the matching chunks are far away
+        results = store.search("query", top_k=5, required_terms=["hrv"])
+        assert {r.id for r in results} == {"DOC1_chunk_0035", "DOC1_chunk_0038", "DOC2_chunk_0005"}
+
+    def test_required_terms_respect_filters(self, store: VectorStore) -> None:
+        results = store.search("query", top_k=5, required_terms=["hrv"], filters={"year": {"$gte": 2015}})
+        assert {r.id for r in results} == {"DOC1_chunk_0035", "DOC1_chunk_0038"}
+
+    def test_required_terms_candidates_capped(self, store: VectorStore) -> None:
+        with patch("deep_zotero.vector_store.REQUIRED_TERMS_FACTOR", 1), \
+             patch("deep_zotero.vector_store.REQUIRED_TERMS_MIN_CANDIDATES", 2), \
+             patch.object(store, "_vector_query", wraps=store._vector_query) as query:
+            results = store.search("query", top_k=1, required_terms=["hrv"])
+        candidates = query.call_args.args[3]
+        assert len(candidates) == 2
+        assert len(results) == 1
+
+    def test_hybrid_adds_lexical_hits_with_cosine_scores(self, store: VectorStore) -> None:
+        vector_only = store.search("biomarkers", top_k=5)
+        assert "DOC1_chunk_0035" not in {r.id for r in vector_only}
+
+        hybrid = store.search("biomarkers", top_k=5, hybrid=True)
+        assert len(hybrid) == 5
+        hit = next(r for r in hybrid if r.id == "DOC1_chunk_0035")
+        assert hit.score == pytest.approx(1 / (35 ** 2 + 1) ** 0.5, abs=1e-4)
+
+    def test_hybrid_rrf_ordering(self, store: VectorStore) -> None:
+        # Vector ranks chunks 0..4 first; chunk 35 is lexical rank 0 and
+        # vector rank 5, so 1/61 + 1/66 puts it ahead of chunk 0 (1/61)
+        hybrid = store.search("biomarkers", top_k=5, hybrid=True)
+        assert [r.id for r in hybrid] == [
+            "DOC1_chunk_0035", "DOC1_chunk_0000", "DOC1_chunk_0001",
+            "DOC1_chunk_0002", "DOC1_chunk_0003",
+        ]
+        assert [r.id for r in store.search("biomarkers", top_k=5)] == [
+            f"DOC1_chunk_{i:04d}" for i in range(5)
+        ]
+
+    def test_hybrid_lexical_hits_respect_filters(self, tmp_path: Path) -> None:
+        store = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        # Strongest BM25 hits are all in the filtered-out 2020 paper
+        store.add_chunks("NEW", {"title": "New", "year": 2020}, [_chunk(i, "hrv hrv hrv") for i in range(10)])
+        old = [_chunk(i) for i in range(10)]
+        old[9] = _chunk(9, "hrv")
+        store.add_chunks("OLD", {"title": "Old", "year": 2010}, old)
+
+        results = store.search("hrv", top_k=3, filters={"year": {"$lte": 2015}}, hybrid=True)
+        assert all(r.metadata["year"] == 2010 for r in results)
+        assert "OLD_chunk_0009" in {r.id for r in results}
+
+    def test_delete_document_updates_index(self, store: VectorStore) -> None:
+        store.delete_document("DOC2")
+        assert set(store.lexical.matching_ids(["hrv"])) == {"DOC1_chunk_0035", "DOC1_chunk_0038"}
+        assert store.lexical.count() == store.count()
+
+    def test_rebuilt_when_out_of_step(self, store: VectorStore, tmp_path: Path) -> None:
+        store.lexical.clear()
+        reopened = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        assert reopened.lexical.count() == 41
+        assert len(reopened.lexical.matching_ids(["hrv"])) == 3
+
+    def test_count_mismatch_not_rebuilt_on_open(self, store: VectorStore, tmp_path: Path) -> None:
+        # Another process between its Chroma and FTS writes looks like this
+        store.lexical.delete_document("DOC2")
+        reopened = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        assert reopened.lexical.count() == 40
+
+        assert reopened.rebuild_lexical_index() == 41
+        assert "DOC2_chunk_0005" in reopened.lexical.matching_ids(["hrv"])
+
+    def test_interrupted_rebuild_redone_on_open(self, store: VectorStore, tmp_path: Path) -> None:
+        store.lexical.set_complete(False)
+        store.lexical.delete_document("DOC2")
+        reopened = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        assert reopened.lexical.count() == 41
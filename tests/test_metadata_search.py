@@ -197,7 +197,7 @@ class TestVectorStoreMetadata:
         return VectorStore(tmp_path / "test_chroma", mock_embedder)
 
     def test_add_chunks_stores_new_metadata(self, temp_store):
-        """add_chunks should store doi, tags, collections in metadata."""
+        """add_chunks should store doi, tags, collections once per document."""
         doc_meta = {
             "title": "Test Paper",
             "authors": "Smith, J.; Jones, A.",
@@ -222,20 +222,25 @@ class TestVectorStoreMetadata:
 
         temp_store.add_chunks("test_doc_001", doc_meta, chunks)
 
-        # Retrieve and verify
+        # Chunk metadata holds only chunk-local and filterable fields
         results = temp_store.collection.get(
             ids=["test_doc_001_chunk_0000"],
             include=["metadatas"]
         )
-
         assert results["metadatas"], "Should have metadata"
-        meta = results["metadatas"][0]
-
-        # Verify new fields are stored
+        chunk_meta = results["metadatas"][0]
+        assert chunk_meta["doc_id"] == "test_doc_001"
+        assert chunk_meta["year"] == 2020, "Year stays on chunks for ChromaDB filters"
+        for field in ("doc_title", "authors", "doi", "tags", "collections", "pdf_hash"):
+            assert field not in chunk_meta, f"{field} should live in the document sidecar"
+
+        # Document fields are stored once and joined on lookup
+        meta = temp_store.get_document_meta("test_doc_001")
         assert meta["doi"] == "10.1234/test.2020", "DOI should be stored"
         assert meta["tags"] == "HRV; methodology", "Tags should be stored"
         assert meta["tags_lower"] == "hrv; methodology", "Lowercase tags should be stored"
         assert meta["collections"] == "Thesis Chapter 5", "Collections should be stored"
+        assert meta["journal_quartile"] == "Q1"
 
         # Verify lowercase author field for searching
         assert meta["authors_lower"] == "smith, j.; jones, a.", "Lowercase authors should be stored"
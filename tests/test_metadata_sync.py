@@ -0,0 +1,106 @@
+"""Tests for metadata-only incremental sync."""
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.models import Chunk, ZoteroItem
+from deep_zotero.vector_store import VectorStore
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _FakeEmbedder:
+    dimensions = 3
+
+    def embed(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        return [[1.0, float(i), 0.5] for i, _ in enumerate(texts)]
+
+    def embed_query(self, query):
+        return [1.0, 0.0, 0.5]
+
+
+
+
+_ITEM = ZoteroItem(
+    item_key="AAA", title="Old Title", authors="Doe, J.", year=2019,
+    pdf_path=Path("a.pdf"), tags="HRV", collections="Thesis", doi="10.1/a",
+)
+
+
+def _doc_meta(item: ZoteroItem) -> dict:
+    return {
+        "title": item.title, "authors": item.authors, "year": item.year,
+        "citation_key": item.citation_key, "publication": item.publication,
+        "journal_quartile": "", "doi": item.doi, "tags": item.tags,
+        "collections": item.collections, "pdf_hash": "hash", "quality_grade": "A",
+    }
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [Chunk(text=f"chunk {i}", chunk_index=i, page_num=1, char_start=0, char_end=1) for i in range(n)]
+
+
+
+
+# =============================================================================
+# VectorStore.update_document_meta
+# =============================================================================
+
+
+class TestUpdateDocumentMeta:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> VectorStore:
+        store = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+        store.add_chunks("AAA", _doc_meta(_ITEM), _chunks(3))
+        return store
+
+    def test_unchanged_is_noop(self, store: VectorStore) -> None:
+        assert store.update_document_meta("AAA", _doc_meta(_ITEM)) == []
+
+    def test_unknown_document(self, store: VectorStore) -> None:
+        assert store.update_document_meta("ZZZ", {"title": "x"}) is None
+
+    def test_changes_applied_without_reembedding(self, store: VectorStore) -> None:
+        with patch.object(store.embedder, "embed", side_effect=AssertionError("re-embedded")):
+            changed = store.update_document_meta("AAA", {"title": "New Title", "tags": "HRV; ECG"})
+        assert changed == ["tags", "title"]
+        meta = store.get_document_meta("AAA")
+        assert meta["doc_title"] == "New Title"
+        assert meta["tags_lower"] == "hrv; ecg"
+        assert meta["pdf_hash"] == "hash"  # untouched
+        assert store.search("q", top_k=1)[0].metadata["doc_title"] == "New Title"
+
+    def test_year_change_updates_chunk_filters(self, store: VectorStore) -> None:
+        assert store.update_document_meta("AAA", {"year": 2021}) == ["year"]
+        hits = store.search("q", top_k=5, filters={"year": {"$gte": 2020}})
+        assert len(hits) == 3
+
+
+# =============================================================================
+# Indexer.sync_metadata
+# =============================================================================
+
+
+class TestIndexerSyncMetadata:
+    def test_syncs_changed_items_only(self, make_config, make_indexer) -> None:
+        retagged = replace(_ITEM, tags="HRV; reviewed", collections="Thesis; Ch2")
+        new_item = replace(_ITEM, item_key="BBB")
+        indexer = make_indexer(make_config(), [retagged, new_item], embedder=_FakeEmbedder())
+        indexer.store.add_chunks("AAA", _doc_meta(_ITEM), _chunks(2))
+
+        result = indexer.sync_metadata()
+
+        assert result["updated"] == 1
+        assert result["not_indexed"] == 1
+        assert result["changes"] == {"AAA": ["collections", "tags"]}
+        assert indexer.store.get_document_meta("AAA")["tags"] == "HRV; reviewed"
+
+        again = indexer.sync_metadata()
+        assert again["updated"] == 0 and again["unchanged"] == 1
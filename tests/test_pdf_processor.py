@@ -510,3 +510,224 @@ class TestExtractDocument:
         assert len(extraction.tables) == 1
         assert extraction.tables[0].headers == ["effect"]
         assert extraction.tables[0].rows[0][0] == "0.047"
+
+    def test_resolve_opens_pdf_once_across_waves(self, tmp_path):
+        """Re-crop, full-page follow-up and post-processing share one handle."""
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"fake")
+        page = _make_page_mock()
+
+        cap = _make_detected_caption("Table 1")
+        mock_api = MagicMock()
+        mock_api.extract_tables_batch.side_effect = [
+            [_make_agent_response(headers=["A"], rows=[["1"]], recrop_needed=True,
+                                  recrop_bbox_pct=[10.0, 10.0, 90.0, 90.0])],
+            [_make_agent_response(parse_success=False)],
+            [_make_agent_response(headers=["A"], rows=[["full"]])],
+        ]
+        patches = _base_patches(page, extra_captions=[cap])
+        doc = patches[_PYMUPDF_OPEN].return_value
+
+        with (
+            patch(_PYMUPDF4LLM + ".to_markdown", patches[_PYMUPDF4LLM].to_markdown),
+            patch(_PYMUPDF_OPEN, patches[_PYMUPDF_OPEN]),
+            patch(_FIND_ALL_CAPTIONS, patches[_FIND_ALL_CAPTIONS]),
+            patch(_DETECT_SECTIONS, patches[_DETECT_SECTIONS]),
+            patch(_DETECT_ABSTRACT, patches[_DETECT_ABSTRACT]),
+            patch(_COMPUTE_STATS, patches[_COMPUTE_STATS]),
+            patch(_COMPUTE_COMPLETENESS, patches[_COMPUTE_COMPLETENESS]),
+            patch(_ASSIGN_HEADING, patches[_ASSIGN_HEADING]),
+            patch(_ASSIGN_CONTINUATION, patches[_ASSIGN_CONTINUATION]),
+            patch(_EXTRACT_FIGURES, patches[_EXTRACT_FIGURES]),
+        ):
+            extraction = _extract_and_resolve(pdf, mock_api)
+
+        assert mock_api.extract_tables_batch.call_count == 3
+        assert extraction.tables[0].rows == [["full"]]
+        # One open in extract_document, one for all of resolve_pending_vision
+        assert patches[_PYMUPDF_OPEN].call_count == 2
+        assert doc.close.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Page-parallel layout analysis
+# ---------------------------------------------------------------------------
+
+class TestPageParallelLayout:
+
+    def test_page_ranges_are_contiguous_and_complete(self):
+        from deep_zotero.pdf_processor import _page_ranges
+
+        ranges = _page_ranges(305, 4)
+        assert len(ranges) == 4
+        assert [p for r in ranges for p in r] == list(range(305))
+
+    def test_page_ranges_respect_minimum_size(self):
+        from deep_zotero.pdf_processor import _MIN_PAGES_PER_WORKER, _page_ranges
+
+        assert len(_page_ranges(_MIN_PAGES_PER_WORKER * 2 - 1, 8)) == 1
+        assert len(_page_ranges(_MIN_PAGES_PER_WORKER * 3, 8)) == 3
+
+    def test_parallel_chunks_match_serial(self, tmp_path, monkeypatch):
+        """Heading levels depend on the whole document; merged ranges must agree."""
+        import pymupdf
+        from deep_zotero import pdf_processor
+
+        pdf = tmp_path / "long.pdf"
+        doc = pymupdf.open()
+        for i in range(6):
+            page = doc.new_page()
+            # The largest heading is only on the last page, so a range-local
+            # parse of the first pages would assign different levels
+            size = 22 if i == 5 else 16 if i % 2 else 13
+            page.insert_text((72, 72), f"{i + 1} Section heading {i}", fontsize=size)
+            for line in range(12):
+                page.insert_text(
+                    (72, 110 + line * 14),
+                    f"Body text of page {i}, line {line}, with enough words to form a paragraph.",
+                    fontsize=10,
+                )
+        doc.save(pdf)
+        doc.close()
+
+        monkeypatch.setattr(pdf_processor, "_MIN_PAGES_PER_WORKER", 2)
+        serial = pdf_processor._layout_page_chunks(pdf, page_workers=1, min_pages=1)
+        parallel = pdf_processor._layout_page_chunks(pdf, page_workers=3, min_pages=1)
+
+        assert [c["text"] for c in parallel] == [c["text"] for c in serial]
+        assert [c["page_boxes"] for c in parallel] == [c["page_boxes"] for c in serial]
+        assert [c["metadata"]["page_number"] for c in parallel] == list(range(1, 7))
+
+
+# ---------------------------------------------------------------------------
+# Vision scheduling
+# ---------------------------------------------------------------------------
+
+class _FakePipelinedAPI:
+    """LocalVisionAPI stand-in that answers per table_id."""
+
+    supports_pipelining = True
+    max_workers = 1  # one request in flight: deterministic send order
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent: list[str] = []
+
+    def render_table(self, spec, doc_pool=None):
+        return [("aGk=", "image/png")]
+
+    def extract_table(self, spec, images):
+        self.sent.append(spec.table_id)
+        return self.responses[spec.table_id]
+
+
+class TestVisionScheduling:
+
+    @pytest.fixture
+    def extractions(self, tmp_path):
+        import pymupdf
+        from deep_zotero.feature_extraction.vision_api import TableVisionSpec
+        from deep_zotero.models import DocumentExtraction, PageExtraction
+        from deep_zotero.pdf_processor import PendingVisionWork, _CropInfo
+
+        def make(name: str, n_tables: int) -> DocumentExtraction:
+            pdf = tmp_path / f"{name}.pdf"
+            doc = pymupdf.open()
+            doc.new_page().insert_text((72, 72), "Table 1. Results", fontsize=10)
+            doc.save(pdf)
+            doc.close()
+            specs = [
+                TableVisionSpec(table_id=f"p1_t{i}", pdf_path=pdf, page_num=1,
+                                bbox=(50.0, 50.0, 500.0, 300.0), raw_text="a b",
+                                caption="Table 1. Results")
+                for i in range(n_tables)
+            ]
+            crops = [_CropInfo(1, "Table 1. Results", (50.0, 50.0, 500.0, 300.0)) for _ in specs]
+            return DocumentExtraction(
+                pages=[PageExtraction(page_num=1, markdown="Table 1. Results", char_start=0)],
+                full_markdown="Table 1. Results", sections=[], tables=[], figures=[],
+                stats={}, quality_grade="",
+                pending_vision=PendingVisionWork(specs=specs, crop_infos=crops, pdf_path=pdf),
+            )
+
+        return {"A": make("a", 2), "B": make("b", 1)}
+
+    def test_pipelined_follow_up_sent_before_remaining_tables(self, extractions):
+        from deep_zotero.pdf_processor import resolve_pending_vision
+
+        ok = _make_agent_response(headers=["h"], rows=[["1"]])
+        api = _FakePipelinedAPI({
+            "A__p1_t0": _make_agent_response(headers=["h"], rows=[["1"]], recrop_needed=True,
+                                             recrop_bbox_pct=[0.0, 0.0, 50.0, 50.0]),
+            "A__recrop_p1_t0": _make_agent_response(headers=["h"], rows=[["recropped"]]),
+            "A__p1_t1": ok,
+            "B__p1_t0": ok,
+        })
+        finalized: list[str] = []
+        resolve_pending_vision(
+            extractions, api, on_document=lambda key, ext: finalized.append(key),
+        )
+
+        assert api.sent == ["A__p1_t0", "A__recrop_p1_t0", "A__p1_t1", "B__p1_t0"]
+        assert finalized == ["A", "B"]
+        assert extractions["A"].pending_vision is None
+        assert [t.rows for t in extractions["A"].tables] == [[["recropped"]], [["1"]]]
+        assert extractions["A"].vision_details[0]["recropped"]
+
+    def test_batch_waves_finalize_settled_documents_early(self, extractions):
+        from deep_zotero.pdf_processor import resolve_pending_vision
+
+        ok = _make_agent_response(headers=["h"], rows=[["1"]])
+        api = MagicMock()
+        api.extract_tables_batch.side_effect = [
+            # A's first table needs a full-page resend; B is done
+            [_make_agent_response(parse_success=False), ok, ok],
+            [_make_agent_response(headers=["h"], rows=[["full"]])],
+        ]
+        finalized: list[str] = []
+        resolve_pending_vision(
+            extractions, api, on_document=lambda key, ext: finalized.append(key),
+        )
+
+        assert finalized == ["B", "A"]
+        wave2 = api.extract_tables_batch.call_args_list[1].args[0]
+        assert [s.table_id for s in wave2] == ["A__fullpage_p1_t0"]
+        assert [t.rows for t in extractions["A"].tables] == [[["full"]], [["1"]]]
+
+    def test_slow_callback_does_not_stall_dispatch(self, extractions):
+        import threading
+        from deep_zotero.pdf_processor import resolve_pending_vision
+
+        ok = _make_agent_response(headers=["h"], rows=[["1"]])
+        api = _FakePipelinedAPI({"A__p1_t0": ok, "A__p1_t1": ok, "B__p1_t0": ok})
+        b_sent = threading.Event()
+        original = api.extract_table
+
+        def extract_table(spec, images):
+            if spec.table_id == "B__p1_t0":
+                b_sent.set()
+            return original(spec, images)
+
+        api.extract_table = extract_table
+        waited: dict[str, bool] = {}
+
+        def on_document(key, ext):
+            if key == "A":
+                # Storing A must overlap with B's request, not block it
+                waited["A"] = b_sent.wait(timeout=5)
+
+        resolve_pending_vision(extractions, api, on_document=on_document)
+        assert waited == {"A": True}
+        assert extractions["B"].pending_vision is None
+
+    def test_callback_error_is_raised(self, extractions):
+        from deep_zotero.pdf_processor import resolve_pending_vision
+
+        ok = _make_agent_response(headers=["h"], rows=[["1"]])
+        api = _FakePipelinedAPI({"A__p1_t0": ok, "A__p1_t1": ok, "B__p1_t0": ok})
+
+        def on_document(key, ext):
+            raise RuntimeError(f"store failed for {key}")
+
+        with pytest.raises(RuntimeError, match="store failed for A"):
+            resolve_pending_vision(extractions, api, on_document=on_document)
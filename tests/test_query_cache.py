@@ -0,0 +1,115 @@
+"""Tests for query-embedding caching and MCP server warm-up."""
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deep_zotero.embedder import Embedder, _QueryLRU
+
+
+# =============================================================================
+# _QueryLRU / Embedder.embed_query
+# =============================================================================
+
+
+class TestQueryLRU:
+    def test_evicts_least_recently_used(self) -> None:
+        lru = _QueryLRU(2)
+        lru.put("a", [1.0])
+        lru.put("b", [2.0])
+        assert lru.get("a") == [1.0]  # "b" is now oldest
+        lru.put("c", [3.0])
+        assert lru.get("b") is None
+        assert lru.get("a") == [1.0] and lru.get("c") == [3.0]
+        assert (lru.hits, lru.misses) == (3, 1)
+
+    def test_returned_vectors_are_copies(self) -> None:
+        lru = _QueryLRU(2)
+        lru.put("a", [1.0])
+        lru.get("a").append(9.0)
+        assert lru.get("a") == [1.0]
+
+    def test_zero_size_disables(self) -> None:
+        lru = _QueryLRU(0)
+        lru.put("a", [1.0])
+        assert lru.get("a") is None
+
+
+class TestEmbedQueryCache:
+    def _embedder(self, calls: list, **kwargs) -> Embedder:
+        def embed_content(model, contents, config):
+            calls.append((list(contents), config.task_type))
+            return SimpleNamespace(embeddings=[SimpleNamespace(values=[0.5, 0.5]) for _ in contents])
+
+        with patch("google.genai.Client") as mock_client:
+            mock_client.return_value = SimpleNamespace(models=SimpleNamespace(embed_content=embed_content))
+            return Embedder(api_key="test", **kwargs)
+
+    def test_repeated_query_embedded_once(self) -> None:
+        calls: list = []
+        embedder = self._embedder(calls)
+        assert embedder.embed_query("heart rate") == embedder.embed_query("heart rate")
+        assert calls == [(["heart rate"], "RETRIEVAL_QUERY")]
+        embedder.embed_query("Heart rate")  # exact text is the key
+        assert len(calls) == 2
+
+    def test_documents_not_served_from_query_cache(self) -> None:
+        calls: list = []
+        embedder = self._embedder(calls)
+        embedder.embed_query("x")
+        embedder.embed_documents(["x"])
+        assert [c[1] for c in calls] == ["RETRIEVAL_QUERY", "RETRIEVAL_DOCUMENT"]
+
+
+# =============================================================================
+# Server warm-up
+# =============================================================================
+
+
+@pytest.fixture
+def server():
+    import deep_zotero.server as server
+    saved = (server._retriever, server._store, server._reranker, server._config)
+    server._retriever = server._store = server._reranker = server._config = None
+    yield server
+    server._retriever, server._store, server._reranker, server._config = saved
+
+
+class TestServerWarmUp:
+    def test_warm_up_initializes_and_touches_index(self, server) -> None:
+        store = MagicMock()
+        store.collection.peek.return_value = {"embeddings": [[0.1, 0.2]]}
+        with patch.object(server.Config, "load", return_value=MagicMock(rerank_alpha=0.7)), \
+             patch.object(server, "create_embedder") as mock_create, \
+             patch.object(server, "VectorStore", return_value=store):
+            server._warm_up()
+
+        assert server._retriever is not None
+        mock_create.assert_called_once()
+        store.collection.query.assert_called_once()
+        store.embedder.embed_query.assert_called_once()
+
+    def test_concurrent_first_calls_initialize_once(self, server) -> None:
+        def slow_store(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        with patch.object(server.Config, "load", return_value=MagicMock(rerank_alpha=0.7)), \
+             patch.object(server, "create_embedder"), \
+             patch.object(server, "VectorStore", side_effect=slow_store) as mock_store:
+            threads = [threading.Thread(target=server._get_retriever) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert mock_store.call_count == 1
+
+    def test_warm_up_failure_is_logged_not_raised(self, server) -> None:
+        with patch.object(server.Config, "load", side_effect=RuntimeError("no config")):
+            server._warm_up()
+        assert server._retriever is None
@@ -259,6 +259,50 @@ class TestReranker:
         expected = 0.8 ** 0.7 * 1.0 * 1.0
         assert abs(score - expected) < 0.001
 
+    def test_scores_match_score_result(self):
+        """Vectorized scores equal the per-result formula exactly."""
+        reranker = Reranker()
+        results = [
+            make_result(score=s, section=sec, journal_quartile=q, chunk_id=f"c{i}")
+            for i, (s, sec, q) in enumerate([
+                (0.83, "methods", "Q2"), (0.41, "weird_label", None),
+                (0.97, "table", ""), (0.66, "discussion", "Q9"),
+            ])
+        ]
+        overrides = {"section_weights": {"methods": 0.9}, "journal_weights": {"unknown": 0.4}}
+        by_id = {r.chunk_id: r for r in results}
+        for r in reranker.rerank(results, **overrides):
+            assert r.composite_score == reranker.score_result(by_id[r.chunk_id], **overrides)
+
+    def test_ties_keep_input_order(self):
+        """Equal composite scores keep their input order."""
+        reranker = Reranker()
+        results = [make_result(score=0.5, chunk_id=f"c{i}") for i in range(5)]
+        reranked = reranker.rerank(results)
+        assert [r.chunk_id for r in reranked] == ["c0", "c1", "c2", "c3", "c4"]
+
+    def test_top_k_matches_slice(self):
+        """top_k returns the same results as slicing the full ranking."""
+        reranker = Reranker()
+        scores = [0.9, 0.5, 0.7, 0.5, 0.0, 0.5, 0.8, 0.5, 0.3]
+        sections = ["results", "methods", "references", "results", "results",
+                    "introduction", "table", "results", "preamble"]
+        results = [
+            make_result(score=s, section=sec, chunk_id=f"c{i}")
+            for i, (s, sec) in enumerate(zip(scores, sections))
+        ]
+        full = [r.chunk_id for r in reranker.rerank(results)]
+        for k in range(0, len(results) + 2):
+            top = reranker.rerank(results, top_k=k)
+            assert [r.chunk_id for r in top] == full[:k]
+
+    def test_input_results_not_modified(self):
+        """Reranking returns copies; inputs keep composite_score=None."""
+        reranker = Reranker()
+        results = [make_result(chunk_id=f"c{i}") for i in range(3)]
+        reranker.rerank(results, top_k=1)
+        assert all(r.composite_score is None for r in results)
+
 
 class TestValidateSectionWeights:
     """Test section_weights validation."""
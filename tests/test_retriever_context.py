@@ -0,0 +1,99 @@
+"""Tests for bulk context expansion in VectorStore / Retriever."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deep_zotero.models import Chunk
+from deep_zotero.retriever import Retriever
+from deep_zotero.vector_store import VectorStore
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _FakeEmbedder:
+    dimensions = 3
+
+    def embed(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        return [[1.0, float(i % 7), 0.5] for i, _ in enumerate(texts)]
+
+    def embed_query(self, query):
+        return [1.0, 0.0, 0.5]
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [
+        Chunk(text=f"chunk {i}", chunk_index=i, page_num=1, char_start=i * 10, char_end=i * 10 + 9)
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> VectorStore:
+    store = VectorStore(tmp_path / "chroma", _FakeEmbedder())
+    store.add_chunks("DOC1", {"title": "One", "authors": "A", "year": 2020}, _chunks(20))
+    store.add_chunks("DOC2", {"title": "Two", "authors": "B", "year": 2021}, _chunks(5))
+    return store
+
+
+def _ids(chunks) -> list[str]:
+    return [c.id for c in chunks]
+
+
+# =============================================================================
+# VectorStore.get_adjacent_chunks_bulk
+# =============================================================================
+
+
+class TestAdjacentChunksBulk:
+    def test_matches_per_hit_queries(self, store: VectorStore) -> None:
+        centers = [("DOC1", 0), ("DOC1", 3), ("DOC1", 4), ("DOC1", 15), ("DOC2", 4), ("DOC2", 0)]
+        bulk = store.get_adjacent_chunks_bulk(centers, window=2)
+        for doc_id, idx in centers:
+            assert _ids(bulk[(doc_id, idx)]) == _ids(store.get_adjacent_chunks(doc_id, idx, window=2))
+
+    def test_overlapping_windows_merged_into_one_query(self, store: VectorStore) -> None:
+        with patch.object(store.collection, "get", wraps=store.collection.get) as spy:
+            bulk = store.get_adjacent_chunks_bulk([("DOC1", 5), ("DOC1", 6), ("DOC2", 1)], window=1)
+        assert spy.call_count == 1
+        where = spy.call_args.kwargs["where"]
+        assert len(where["$or"]) == 2  # DOC1 4..7 merged, DOC2 0..2
+        assert _ids(bulk[("DOC1", 6)]) == ["DOC1_chunk_0005", "DOC1_chunk_0006", "DOC1_chunk_0007"]
+
+    def test_many_ranges_split_across_queries(self, store: VectorStore) -> None:
+        store._BULK_CLAUSES_PER_QUERY = 2
+        centers = [("DOC1", i) for i in (0, 5, 10, 15)]
+        with patch.object(store.collection, "get", wraps=store.collection.get) as spy:
+            bulk = store.get_adjacent_chunks_bulk(centers, window=0)
+        assert spy.call_count == 2
+        assert [_ids(bulk[c]) for c in centers] == [[f"DOC1_chunk_{i:04d}"] for i in (0, 5, 10, 15)]
+
+    def test_empty_and_unknown(self, store: VectorStore) -> None:
+        assert store.get_adjacent_chunks_bulk([]) == {}
+        assert store.get_adjacent_chunks_bulk([("NOPE", 3)]) == {("NOPE", 3): []}
+
+
+# =============================================================================
+# Retriever
+# =============================================================================
+
+
+class TestRetrieverUsesBulk:
+    def test_context_split_before_after(self, store: VectorStore) -> None:
+        with patch.object(store, "get_adjacent_chunks", side_effect=AssertionError("per-hit query")):
+            results = Retriever(store).search("q", top_k=5, context_window=2)
+        assert len(results) == 5
+        for r in results:
+            assert r.context_before == [f"chunk {i}" for i in range(max(0, r.chunk_index - 2), r.chunk_index)]
+            assert all(t != r.text for t in r.context_after)
+
+    def test_no_context_window_skips_fetch(self, store: VectorStore) -> None:
+        with patch.object(store, "get_adjacent_chunks_bulk") as bulk:
+            results = Retriever(store).search("q", top_k=3, context_window=0)
+        bulk.assert_not_called()
+        assert all(r.context_before == [] and r.context_after == [] for r in results)
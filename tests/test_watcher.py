@@ -0,0 +1,135 @@
+"""Tests for watch mode (LibraryWatcher)."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from deep_zotero import watcher as watcher_mod
+from deep_zotero.watcher import LibraryWatcher
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class _FakeIndexer:
+    def __init__(self, fail: bool = False):
+        self.calls: list[dict] = []
+        self.fail = fail
+
+    def index_all(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"indexed": 0, "failed": 0, "removed": 0, "metadata_updated": 0}
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    (tmp_path / "zotero.sqlite").write_bytes(b"x")
+    (tmp_path / "storage").mkdir()
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _polling_only(monkeypatch):
+    monkeypatch.setattr(watcher_mod, "Observer", None)
+
+
+def _touch(path: Path, content: bytes) -> None:
+    path.write_bytes(content)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _start(watcher: LibraryWatcher) -> tuple[threading.Thread, threading.Event]:
+    stop = threading.Event()
+    thread = threading.Thread(target=watcher.run, args=(stop,), daemon=True)
+    thread.start()
+    return thread, stop
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestLibraryWatcher:
+    def test_snapshot_tracks_db_and_storage(self, library):
+        w = LibraryWatcher(_FakeIndexer(), library)
+        before = w.snapshot()
+        assert w.snapshot() == before
+        (library / "storage" / "ABCD1234").mkdir()
+        os.utime(library / "storage", ns=(0, time.time_ns() + 10**9))
+        assert w.snapshot() != before
+
+    def test_initial_run_uses_change_feed(self, library):
+        indexer = _FakeIndexer()
+        w = LibraryWatcher(indexer, library, poll_interval=0.01, debounce=0.01)
+        thread, stop = _start(w)
+        assert _wait_for(lambda: len(indexer.calls) == 1)
+        stop.set()
+        thread.join(timeout=5)
+        assert indexer.calls == [{"changed_only": True, "streaming": False}]
+
+    def test_burst_of_writes_triggers_one_run(self, library):
+        indexer = _FakeIndexer()
+        w = LibraryWatcher(indexer, library, poll_interval=0.01, debounce=0.3)
+        thread, stop = _start(w)
+        assert _wait_for(lambda: len(indexer.calls) == 1)
+        for i in range(5):
+            _touch(library / "zotero.sqlite", b"x" * (i + 2))
+            time.sleep(0.05)
+        assert _wait_for(lambda: len(indexer.calls) == 2)
+        time.sleep(0.5)
+        stop.set()
+        thread.join(timeout=5)
+        assert len(indexer.calls) == 2
+
+    def test_no_run_without_changes(self, library):
+        indexer = _FakeIndexer()
+        w = LibraryWatcher(indexer, library, poll_interval=0.01, debounce=0.01)
+        thread, stop = _start(w)
+        time.sleep(0.2)
+        stop.set()
+        thread.join(timeout=5)
+        assert len(indexer.calls) == 1
+
+    def test_failed_run_does_not_stop_watching(self, library):
+        indexer = _FakeIndexer(fail=True)
+        w = LibraryWatcher(indexer, library, poll_interval=0.01, debounce=0.01)
+        thread, stop = _start(w)
+        assert _wait_for(lambda: len(indexer.calls) == 1)
+        _touch(library / "zotero.sqlite", b"changed")
+        assert _wait_for(lambda: len(indexer.calls) == 2)
+        stop.set()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+class TestWatchOptions:
+    @pytest.mark.parametrize("flags", [["--force"], ["--limit", "5"], ["--item-key", "AAAA1111"], ["--title", "x"]])
+    def test_cli_rejects_one_shot_filters(self, flags, capsys):
+        from deep_zotero.cli import main
+        with pytest.raises(SystemExit) as exc:
+            main(["--watch", *flags])
+        assert exc.value.code == 2
+        assert f"--watch cannot be combined with {flags[0]}" in capsys.readouterr().err
+
+    def test_negative_debounce_rejected(self, make_config):
+        assert any("watch_debounce" in e for e in make_config(watch_debounce=-1).validate())
+        assert not any("watch_debounce" in e for e in make_config(watch_debounce=0).validate())
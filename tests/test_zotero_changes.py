@@ -0,0 +1,194 @@
+"""Tests for the Zotero change feed (ZoteroClient.get_changed_items)."""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from deep_zotero.indexer import CHANGE_RETRY_MAX_ATTEMPTS
+from deep_zotero.models import ZoteroChangeSet, ZoteroItem
+from deep_zotero.zotero_client import ZoteroClient
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+_SCHEMA = """
+    CREATE TABLE items (
+        itemID INTEGER PRIMARY KEY,
+        itemTypeID INTEGER,
+        key TEXT UNIQUE,
+        dateModified TEXT,
+        clientDateModified TEXT
+    );
+    CREATE TABLE deletedItems (itemID INTEGER PRIMARY KEY, dateDeleted TEXT);
+    CREATE TABLE itemAttachments (
+        itemID INTEGER PRIMARY KEY,
+        parentItemID INTEGER,
+        linkMode INTEGER,
+        contentType TEXT,
+        path TEXT
+    );
+    CREATE TABLE itemData (itemID INTEGER, fieldID INTEGER, valueID INTEGER);
+    CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value TEXT);
+    CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+    CREATE TABLE creators (creatorID INTEGER PRIMARY KEY, firstName TEXT, lastName TEXT);
+    CREATE TABLE itemCreators (itemID INTEGER, creatorID INTEGER, orderIndex INTEGER);
+    CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE itemTags (itemID INTEGER, tagID INTEGER);
+    CREATE TABLE collections (
+        collectionID INTEGER PRIMARY KEY,
+        collectionName TEXT,
+        clientDateModified TEXT
+    );
+    CREATE TABLE collectionItems (collectionID INTEGER, itemID INTEGER);
+    CREATE TABLE syncObjectTypes (syncObjectTypeID INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE syncDeleteLog (syncObjectTypeID INTEGER, libraryID INTEGER, key TEXT, dateDeleted TEXT);
+
+    INSERT INTO fields VALUES (1, 'title');
+    INSERT INTO syncObjectTypes VALUES (3, 'item');
+    INSERT INTO collections VALUES (1, 'Cardiology', '2024-01-01 00:00:00');
+"""
+
+_OLD = "2024-01-01 00:00:00"
+
+
+def _add_paper(conn, data_dir: Path, item_id: int, key: str, title: str, modified: str = _OLD) -> None:
+    att_id = item_id + 100
+    att_key = f"ATT{item_id:05d}"
+    conn.execute("INSERT INTO items VALUES (?, 2, ?, ?, ?)", (item_id, key, modified, modified))
+    conn.execute("INSERT INTO items VALUES (?, 3, ?, ?, ?)", (att_id, att_key, _OLD, _OLD))
+    conn.execute(
+        "INSERT INTO itemAttachments VALUES (?, ?, 0, 'application/pdf', ?)",
+        (att_id, item_id, f"storage:{key}.pdf"),
+    )
+    conn.execute("INSERT INTO itemDataValues VALUES (?, ?)", (item_id, title))
+    conn.execute("INSERT INTO itemData VALUES (?, 1, ?)", (item_id, item_id))
+    pdf_dir = data_dir / "storage" / att_key
+    pdf_dir.mkdir(parents=True)
+    (pdf_dir / f"{key}.pdf").write_bytes(b"%PDF-1.4")
+
+
+@pytest.fixture
+def zotero_dir(tmp_path: Path) -> Path:
+    conn = sqlite3.connect(tmp_path / "zotero.sqlite")
+    conn.executescript(_SCHEMA)
+    _add_paper(conn, tmp_path, 1, "AAAA1111", "Old paper")
+    _add_paper(conn, tmp_path, 2, "BBBB2222", "Other old paper")
+    conn.commit()
+    conn.close()
+    return tmp_path
+
+
+def _execute(data_dir: Path, sql: str, params=()) -> None:
+    conn = sqlite3.connect(data_dir / "zotero.sqlite")
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestChangeFeed:
+    def test_marker_is_newest_timestamp(self, zotero_dir):
+        assert ZoteroClient(zotero_dir).get_change_marker() == _OLD
+
+    def test_no_changes_since_later_marker(self, zotero_dir):
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert changes.items == []
+        assert changes.removed_keys == []
+        assert changes.marker == "2024-06-01 00:00:00"
+
+    def test_edited_item_is_returned(self, zotero_dir):
+        _execute(zotero_dir, "UPDATE items SET clientDateModified = '2024-07-01 12:00:00' WHERE itemID = 2")
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert [i.item_key for i in changes.items] == ["BBBB2222"]
+        assert changes.items[0].title == "Other old paper"
+        assert changes.marker == "2024-07-01 12:00:00"
+
+    def test_new_item_is_returned(self, zotero_dir):
+        conn = sqlite3.connect(zotero_dir / "zotero.sqlite")
+        _add_paper(conn, zotero_dir, 3, "CCCC3333", "New paper", modified="2024-07-02 00:00:00")
+        conn.commit()
+        conn.close()
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert [i.item_key for i in changes.items] == ["CCCC3333"]
+
+    def test_replaced_attachment_marks_parent(self, zotero_dir):
+        _execute(zotero_dir, "UPDATE items SET clientDateModified = '2024-07-01 00:00:00' WHERE itemID = 101")
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert [i.item_key for i in changes.items] == ["AAAA1111"]
+
+    def test_collection_change_marks_members(self, zotero_dir):
+        _execute(zotero_dir, "INSERT INTO collectionItems VALUES (1, 1)")
+        _execute(zotero_dir, "UPDATE collections SET clientDateModified = '2024-07-01 00:00:00'")
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert [i.item_key for i in changes.items] == ["AAAA1111"]
+        assert changes.items[0].collections == "Cardiology"
+
+    def test_trashed_and_erased_items_are_removed(self, zotero_dir):
+        _execute(zotero_dir, "INSERT INTO deletedItems VALUES (1, '2024-07-01 00:00:00')")
+        _execute(zotero_dir, "INSERT INTO syncDeleteLog VALUES (3, 1, 'ZZZZ9999', '2024-07-02 00:00:00')")
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00")
+        assert changes.items == []
+        assert changes.removed_keys == ["AAAA1111", "ZZZZ9999"]
+        assert changes.marker == "2024-07-02 00:00:00"
+
+    def test_also_keys_are_returned_regardless_of_timestamp(self, zotero_dir):
+        changes = ZoteroClient(zotero_dir).get_changed_items("2024-06-01 00:00:00", also_keys=["AAAA1111"])
+        assert [i.item_key for i in changes.items] == ["AAAA1111"]
+
+    def test_get_item_uses_key_filter(self, zotero_dir):
+        client = ZoteroClient(zotero_dir)
+        assert client.get_item("BBBB2222").title == "Other old paper"
+        assert client.get_item("NOPE0000") is None
+
+
+# =============================================================================
+# Indexer retry state
+# =============================================================================
+
+
+class TestChangeFeedRetries:
+    def test_missing_pdf_retried_then_dropped(self, tmp_path, make_config, make_indexer, caplog):
+        config = make_config()
+        state_path = config.chroma_db_path / "zotero_changes.json"
+        state_path.write_text(json.dumps({"marker": "m0", "retry": ["AAAA1111"]}))  # legacy format
+        item = ZoteroItem(item_key="AAAA1111", title="Paper", authors="Doe, J.", year=2020,
+                          pdf_path=tmp_path / "not-synced-yet.pdf")
+        indexer = make_indexer(config, [])
+        indexer.zotero.get_changed_items.return_value = ZoteroChangeSet(items=[item], removed_keys=[], marker="m1")
+
+        for attempt in range(1, CHANGE_RETRY_MAX_ATTEMPTS):
+            indexer.index_all(changed_only=True)
+            assert json.loads(state_path.read_text())["retry"] == {"AAAA1111": attempt}
+        assert indexer.zotero.get_changed_items.call_args.kwargs["also_keys"] == ["AAAA1111"]
+
+        with caplog.at_level(logging.WARNING, logger="deep_zotero.indexer"):
+            indexer.index_all(changed_only=True)
+        assert json.loads(state_path.read_text())["retry"] == {}
+        assert "AAAA1111" in caplog.text
+
+    def test_limit_deferral_costs_no_attempt(self, tmp_path, make_config, make_indexer):
+        config = make_config()
+        state_path = config.chroma_db_path / "zotero_changes.json"
+        state_path.write_text(json.dumps({"marker": "m0", "retry": {"BBBB2222": 3}}))
+        items = []
+        for key in ("AAAA1111", "BBBB2222"):
+            pdf = tmp_path / f"{key}.pdf"
+            pdf.write_bytes(b"%PDF-1.4 fake")
+            items.append(ZoteroItem(item_key=key, title=key, authors="Doe, J.", year=2020, pdf_path=pdf))
+        indexer = make_indexer(config, [])
+        indexer.zotero.get_changed_items.return_value = ZoteroChangeSet(items=items, removed_keys=[], marker="m1")
+        indexer.store.get_indexed_doc_ids.return_value = {"AAAA1111"}
+        indexer.store.get_document_meta.return_value = {"pdf_hash": indexer._pdf_hash(items[0].pdf_path)}
+
+        indexer.index_all(changed_only=True, limit=1)
+        assert json.loads(state_path.read_text())["retry"] == {"BBBB2222": 3}